@@ -0,0 +1,135 @@
+import asyncio
+import logging
+from typing import Iterable, List, Dict, Any, Optional
+
+from adapters.analyzer.llm_pipeline_processor import BaseLLMPipelineProcessor
+from core.interfaces.llm import IAsyncLLMClient, IPromptTemplate
+from core.models.line import Line
+from core.models.llm import LLMMessage, LLMResponse
+from core.models.segment import Segment
+from core.repositories.character_repository import CharacterRepository
+from core.utils.event_loop import run_sync
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncLLMPipelineProcessor(BaseLLMPipelineProcessor):
+    """
+    Variante assíncrona do LLMPipelineProcessor, baseada em IAsyncLLMClient.
+
+    `aprocess` envia os blocos concorrentemente no event loop corrente,
+    com no máximo `max_concurrency` requisições em andamento por chamada.
+    `process` continua disponível como fachada síncrona: roda `aprocess`
+    num event loop persistente (ver run_sync), o mesmo a cada chamada, já
+    que o pool de conexões do cliente fica ligado ao loop em que foi usado.
+
+    IAsyncLLMClient não tem streaming: `iter_process` é o padrão de
+    IBlockProcessor (percorre o resultado de `process`). A concorrência é
+    controlada por `max_concurrency`; não há `max_workers`.
+    """
+
+    def __init__(
+        self,
+        llm_client: IAsyncLLMClient,
+        prompt_template: IPromptTemplate,
+        character_repository: CharacterRepository,
+        *,
+        max_concurrency: int = 8,
+        **kwargs
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency deve ser maior ou igual a 1")
+        if "max_workers" in kwargs:
+            raise TypeError("AsyncLLMPipelineProcessor não usa max_workers; use max_concurrency")
+
+        super().__init__(llm_client, prompt_template, character_repository, **kwargs)
+        self.max_concurrency = max_concurrency
+
+    def process(
+        self,
+        lines: Iterable[Line],
+        *,
+        chunk_size: Optional[int] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        work_id: Optional[str] = None,
+        chapter_id: Optional[str] = None
+    ) -> List[Segment]:
+        return run_sync(self.aprocess(
+            lines, chunk_size=chunk_size, metadata=metadata, work_id=work_id, chapter_id=chapter_id
+        ))
+
+    async def aprocess(
+        self,
+        lines: Iterable[Line],
+        *,
+        chunk_size: Optional[int] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        work_id: Optional[str] = None,
+        chapter_id: Optional[str] = None
+    ) -> List[Segment]:
+        blocks = self._make_blocks(lines, chunk_size, metadata)
+        logger.info("Iniciando processamento assíncrono de %d linhas em %d bloco(s)", sum(map(len, blocks)), len(blocks))
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(index: int, block: List[Line]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self._aprocess_block(index, block, metadata, work_id, chapter_id)
+
+        outcomes = await asyncio.gather(
+            *(run(index, block) for index, block in enumerate(blocks)),
+            return_exceptions=True
+        )
+
+        results: Dict[int, List[Dict[str, Any]]] = {}
+        failures: Dict[int, Exception] = {}
+        for index, outcome in enumerate(outcomes):
+            if isinstance(outcome, Exception):
+                failures[index] = outcome
+            else:
+                results[index] = outcome
+
+        return self._merge_results(results, failures)
+
+    async def _aprocess_block(
+        self,
+        index: int,
+        block: List[Line],
+        metadata: Optional[Dict[str, Any]],
+        work_id: Optional[str],
+        chapter_id: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        messages = self._build_block_messages(index, block, metadata)
+        fingerprint = self._block_fingerprint(messages)
+
+        # O cache grava com fsync/transações: fora do event loop, para não
+        # travar as demais requisições em andamento.
+        cached = await asyncio.to_thread(self._load_cached_block, work_id, chapter_id, index, fingerprint)
+        if cached is not None:
+            return cached
+
+        segments_data = await self._arequest_block(index, block, metadata, messages)
+        await asyncio.to_thread(self._save_cached_block, work_id, chapter_id, index, fingerprint, segments_data)
+        return segments_data
+
+    async def _arequest_block(
+        self,
+        index: int,
+        block: List[Line],
+        metadata: Optional[Dict[str, Any]],
+        messages: Optional[List[LLMMessage]] = None
+    ) -> List[Dict[str, Any]]:
+        messages = messages or self._build_block_messages(index, block, metadata)
+        try:
+            response: LLMResponse = await self.llm.achat(messages=messages, **self._request_params())
+            logger.debug("Resposta recebida da LLM: %s", response.text[:1000] + "..." if len(response.text) > 1000 else response.text)
+        except Exception as e:
+            logger.exception("Erro ao chamar a LLM: %s", str(e))
+            raise
+
+        segments_data = self._parse_or_split(index, block, response)
+        if segments_data is not None:
+            return segments_data
+
+        # As metades rodam em sequência, dentro da mesma vaga do semáforo.
+        left, right = self._halves(block)
+        return await self._arequest_block(index, left, metadata) + await self._arequest_block(index, right, metadata)
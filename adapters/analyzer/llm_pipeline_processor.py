@@ -1,35 +1,79 @@
 import json
 import logging
-from typing import List, Dict, Any, Optional
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Set, Tuple, Union
 
-from core.interfaces.llm import IBlockProcessor, IPromptTemplate, ILLMClient
+from adapters.analyzer.segment_validator import validate_segments
+from adapters.analyzer.streaming_segment_parser import iter_stream_segments
+
+from core.interfaces.llm import IBlockProcessor, IPromptTemplate, ILLMClient, IAsyncLLMClient, BlockProcessingError
+from core.interfaces.repository import IBlockCache
 from core.models.line import Line
 from core.models.llm import LLMMessage, LLMResponse
 from core.models.segment import Segment
 from core.repositories.character_repository import CharacterRepository
+from core.utils.file_utils import compute_fingerprint
+from core.utils.iteration import chunk_list, chunk_by_budget
+from core.utils.tokens import count_tokens, count_message_tokens
 
 logger = logging.getLogger(__name__)
 
+# Tokens de estrutura JSON por linha na entrada ({"line_number": ..., "text": ...})
+# e por segmento na saída (chaves, speaker, enums).
+LINE_INPUT_OVERHEAD = 12
+SEGMENT_OUTPUT_OVERHEAD = 70
+
 
-class LLMPipelineProcessor(IBlockProcessor):
+def is_truncated(response: LLMResponse) -> bool:
     """
-    Processa blocos de Line em Segment usando uma LLM por meio de:
-      - IPromptTemplate: constrói as mensagens
-      - ILLMClient: executa a chamada à LLM
+    Indica se a LLM interrompeu a resposta por limite de tokens.
+    """
+    try:
+        return response.raw["choices"][0]["finish_reason"] == "length"
+    except (TypeError, KeyError, IndexError):
+        return False
+
+
+class BaseLLMPipelineProcessor(IBlockProcessor):
     """
-    
+    Base comum dos processadores de blocos por LLM (LLMPipelineProcessor e
+    AsyncLLMPipelineProcessor): montagem dos blocos e das mensagens, cache,
+    parse, bissecção e construção dos Segments. As subclasses definem como
+    os blocos são enviados à LLM.
+
+    Se um IBlockCache for fornecido e `process` receber work_id/chapter_id,
+    cada bloco é consultado no cache antes da chamada à LLM e persistido
+    logo após um parse bem-sucedido, permitindo retomar capítulos
+    interrompidos sem pagar novamente pelos blocos já concluídos.
+
+    Com `max_input_tokens`, os blocos deixam de ter `chunk_size` linhas fixas
+    e passam a ser preenchidos por orçamento de tokens (tiktoken): cada bloco
+    recebe o máximo de linhas que cabe em `max_input_tokens` (prompt incluso)
+    e cuja saída estimada (`output_ratio` × tokens da linha + estrutura JSON)
+    cabe em `max_tokens`.
+
+    Com `split_on_failure` (padrão), um bloco cuja resposta vem truncada
+    ou com JSON inválido é bissectado e as metades são reenviadas, em vez
+    de derrubar o capítulo inteiro.
+    """
+
     def __init__(
         self,
-        llm_client: ILLMClient,
+        llm_client: Union[ILLMClient, IAsyncLLMClient],
         prompt_template: IPromptTemplate,
         character_repository: CharacterRepository,
-        *, 
+        *,
         chunk_size: int = 10,
         temperature: float = 0.3,
         max_tokens: Optional[int] = None,
         top_p: float = 1.0,
         frequency_penalty: float = 0.0,
-        presence_penalty: float = 0.0
+        presence_penalty: float = 0.0,
+        block_cache: Optional[IBlockCache] = None,
+        max_input_tokens: Optional[int] = None,
+        output_ratio: float = 2.5,
+        split_on_failure: bool = True
     ):
         self.llm = llm_client
         self.template = prompt_template
@@ -40,72 +84,527 @@ class LLMPipelineProcessor(IBlockProcessor):
         self.top_p = top_p
         self.frequency_penalty = frequency_penalty
         self.presence_penalty = presence_penalty
-        
+        self.block_cache = block_cache
+        self.max_input_tokens = max_input_tokens
+        self.output_ratio = output_ratio
+        self.split_on_failure = split_on_failure
+
+    def _make_blocks(
+        self,
+        lines: Iterable[Line],
+        chunk_size: Optional[int],
+        metadata: Optional[Dict[str, Any]]
+    ) -> List[List[Line]]:
+        blocks = list(self._iter_blocks(lines, chunk_size, metadata))
+        logger.debug("Blocos montados: %s linhas por bloco", [len(b) for b in blocks])
+        return blocks
+
+    def _iter_blocks(
+        self,
+        lines: Iterable[Line],
+        chunk_size: Optional[int],
+        metadata: Optional[Dict[str, Any]]
+    ) -> Iterator[List[Line]]:
+        if not self.max_input_tokens:
+            return iter(chunk_list(lines, chunk_size or self.chunk_size))
+
+        model = self._model_name() or "gpt-4o"
+        empty_payload: Dict[str, Any] = {"lines": []}
+        if metadata:
+            empty_payload["metadata"] = metadata
+        prompt_overhead = count_message_tokens(self.template.build_messages(empty_payload), model)
+        limits = [max(1, self.max_input_tokens - prompt_overhead)]
+        if self.max_tokens:
+            limits.append(self.max_tokens)
+
+        def costs(line: Line) -> List[float]:
+            text_tokens = count_tokens(line.original_text, model)
+            return [
+                text_tokens + LINE_INPUT_OVERHEAD,
+                self.output_ratio * text_tokens + SEGMENT_OUTPUT_OVERHEAD,
+            ]
+
+        logger.debug("Blocos montados por orçamento de tokens (entrada=%s, saída=%s)", limits[0], self.max_tokens)
+        return iter(chunk_by_budget(lines, costs, limits))
+
+    def _merge_results(
+        self,
+        results: Dict[int, List[Dict[str, Any]]],
+        failures: Dict[int, Exception]
+    ) -> List[Segment]:
+        """
+        Constrói os Segments na ordem dos blocos e os ordena por
+        (line_number, segment_index). Se houver falhas, lança
+        BlockProcessingError com os segmentos dos blocos concluídos.
+        """
+        all_segments: List[Segment] = []
+        for index in sorted(results):
+            all_segments.extend(self._build_segments(results[index]))
+
+        all_segments.sort(key=lambda s: (s.line_number, s.segment_index))
+
+        if failures:
+            logger.error(
+                "Processamento finalizado com %d bloco(s) com falha e %d segmento(s) válidos",
+                len(failures), len(all_segments)
+            )
+            first = failures[min(failures)]
+            raise BlockProcessingError(failures=failures, segments=all_segments) from first
+
+        logger.info("Processamento finalizado. Total de segmentos: %d", len(all_segments))
+        return all_segments
+
+    def _block_fingerprint(self, messages: List[LLMMessage]) -> str:
+        """
+        Hash das mensagens renderizadas, do modelo e dos parâmetros de amostragem:
+        identifica o conteúdo exato de uma requisição, independentemente da
+        posição do bloco no capítulo.
+        """
+        return compute_fingerprint({
+            "messages": [msg.to_dict() for msg in messages],
+            "model": self._model_name(),
+            "params": self._sampling_params(),
+        })
+
+    def _model_name(self) -> Optional[str]:
+        model = getattr(self.llm, "model", None)
+        return model if isinstance(model, str) else None
+
+    def _cache_enabled(self, work_id: Optional[str], chapter_id: Optional[str]) -> bool:
+        if self.block_cache is None:
+            return False
+        if self.block_cache.keyed_by_content:
+            return True
+        return bool(work_id) and bool(chapter_id)
+
+    def _load_cached_block(
+        self,
+        work_id: Optional[str],
+        chapter_id: Optional[str],
+        index: int,
+        fingerprint: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        if not self._cache_enabled(work_id, chapter_id):
+            return None
+        try:
+            cached = self.block_cache.load_block(work_id, chapter_id, index, fingerprint=fingerprint)
+        except Exception:
+            logger.warning("Falha ao ler bloco %d do cache (%s/%s); reprocessando", index, work_id, chapter_id, exc_info=True)
+            return None
+        if cached is None:
+            return None
+        try:
+            self._check_segments(cached)
+        except ValueError:
+            logger.warning("Bloco %d inválido no cache (%s/%s); reprocessando", index, work_id, chapter_id, exc_info=True)
+            return None
+        logger.info("Bloco %d de %s/%s recuperado do cache", index, work_id, chapter_id)
+        return cached
+
+    def _save_cached_block(
+        self,
+        work_id: Optional[str],
+        chapter_id: Optional[str],
+        index: int,
+        fingerprint: str,
+        segments_data: List[Dict[str, Any]]
+    ) -> None:
+        if not self._cache_enabled(work_id, chapter_id):
+            return
+        try:
+            self.block_cache.save_block(work_id, chapter_id, index, segments_data, fingerprint=fingerprint)
+            logger.debug("Bloco %d de %s/%s salvo no cache", index, work_id, chapter_id)
+        except Exception:
+            logger.warning("Falha ao salvar bloco %d no cache (%s/%s)", index, work_id, chapter_id, exc_info=True)
+
+    def _parse_or_split(
+        self,
+        index: int,
+        block: List[Line],
+        response: LLMResponse
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Interpreta a resposta do bloco. Retorna None quando ela não pôde ser
+        interpretada e o bloco deve ser dividido (ver `_halves`); se a divisão
+        não for possível, propaga o ValueError. Compartilhado pelos caminhos
+        síncrono e assíncrono.
+        """
+        try:
+            return self._parse_response(response, block)
+        except ValueError:
+            if not self._should_split(index, block, response):
+                raise
+        return None
+
+    @staticmethod
+    def _halves(block: List[Line]) -> Tuple[List[Line], List[Line]]:
+        middle = len(block) // 2
+        return block[:middle], block[middle:]
+
+    def _should_split(self, index: int, block: List[Line], response: LLMResponse) -> bool:
+        if not self.split_on_failure or len(block) <= 1:
+            return False
+        reason = "truncada (finish_reason=length)" if is_truncated(response) else "inválida"
+        logger.warning(
+            "Resposta %s para o bloco %d (linhas %d até %d); dividindo em duas metades",
+            reason, index, block[0].line_number, block[-1].line_number
+        )
+        return True
+
+    def _build_block_messages(
+        self,
+        index: int,
+        block: List[Line],
+        metadata: Optional[Dict[str, Any]]
+    ) -> List[LLMMessage]:
+        logger.debug(
+            "Processando bloco %d (linhas %d até %d)",
+            index, block[0].line_number, block[-1].line_number
+        )
+
+        payload: Dict[str, Any] = {
+            "lines": [
+                {"line_number": ln.line_number, "text": ln.original_text}
+                for ln in block
+            ]
+        }
+        if metadata:
+            payload["metadata"] = metadata
+
+        messages: List[LLMMessage] = self.template.build_messages(payload)
+        logger.debug("Mensagens construídas: %s", messages)
+        return messages
+
+    def _sampling_params(self) -> Dict[str, Any]:
+        return {
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "top_p": self.top_p,
+            "frequency_penalty": self.frequency_penalty,
+            "presence_penalty": self.presence_penalty,
+        }
+
+    def _request_params(self) -> Dict[str, Any]:
+        """
+        Parâmetros da chamada à LLM: os de amostragem e, se o template declarar,
+        o JSON Schema da resposta. O schema fica fora do fingerprint dos blocos,
+        pois já é determinado pelo template (cujo prompt entra nas mensagens).
+        """
+        params = self._sampling_params()
+        if self.template.response_schema is not None:
+            params["response_schema"] = self.template.response_schema
+        return params
+
+    def _decode_segments(self, segments_data: List[Dict[str, Any]], block: List[Line]) -> List[Dict[str, Any]]:
+        """
+        Converte os segmentos pelo template e, se ele declarar um schema,
+        valida o resultado (ValueError leva à divisão do bloco).
+        """
+        segments = self.template.parse_segments(segments_data, block)
+        if self.template.response_schema is not None:
+            validate_segments(segments, (ln.line_number for ln in block))
+        self._check_segments(segments)
+        return segments
+
+    @staticmethod
+    def _check_segments(segments_data: List[Dict[str, Any]]) -> None:
+        """
+        Garante que cada segmento cru gera um Segment válido (ex: texto não
+        vazio) antes de ser cacheado. ValueError leva à divisão do bloco,
+        em vez de gravar no cache um bloco que derrubaria o capítulo a cada
+        nova execução.
+        """
+        for obj in segments_data:
+            try:
+                Segment.from_dict(obj)
+            except (KeyError, TypeError, AttributeError, ValueError) as e:
+                raise ValueError(f"Segmento inválido na resposta da LLM: {obj!r} ({e})") from e
+
+    def _parse_response(self, response: LLMResponse, block: List[Line]) -> List[Dict[str, Any]]:
+        try:
+            data = json.loads(response.text)
+            if not isinstance(data, dict) or not isinstance(data.get("segments", []), list):
+                raise ValueError("Esperava um objeto JSON com 'segments' como lista")
+            segments_data = self._decode_segments(data.get("segments", []), block)
+            logger.info("Foram retornados %d segmentos pela LLM", len(segments_data))
+        except ValueError as e:
+            logger.exception("Erro ao fazer o parse do JSON retornado pela LLM: %s", str(e))
+            raise
+
+        return segments_data
+
+    def _build_segments(self, segments_data: List[Dict[str, Any]]) -> List[Segment]:
+        """
+        Converte os segmentos crus em Segment, associando o Character correspondente.
+        """
+        segments: List[Segment] = []
+        for obj in segments_data:
+            seg = Segment.from_dict(obj)
+
+            character = self.char_repo.upsert(
+                name=obj.get("speaker", "Narrador"),
+                character_type=obj.get("character_type", "unknown"),
+                gender=obj.get("gender", "unknown")
+            )
+
+            logger.debug("Personagem processado: %s (%s, %s)", character.name, character.type, character.gender)
+            seg.character = character
+            segments.append(seg)
+        return segments
+
+
+class LLMPipelineProcessor(BaseLLMPipelineProcessor):
+    """
+    Processa blocos de Line em Segment usando uma LLM por meio de:
+      - IPromptTemplate: constrói as mensagens
+      - ILLMClient: executa a chamada à LLM
+
+    Com `max_workers > 1`, os blocos são enviados em paralelo (no máximo
+    `max_workers` requisições em andamento). Os segmentos continuam sendo
+    ordenados por (line_number, segment_index) ao final. Em ambos os modos,
+    a falha de um bloco não interrompe os demais: ao final, é lançado
+    BlockProcessingError com os segmentos dos blocos concluídos.
+
+    Cache, blocos por orçamento de tokens e bissecção: ver BaseLLMPipelineProcessor.
+
+    `iter_process` usa o streaming do ILLMClient e produz os Segments de cada
+    linha assim que a LLM passa para a linha seguinte, na ordem em que os gera.
+    """
+
+    def __init__(
+        self,
+        llm_client: ILLMClient,
+        prompt_template: IPromptTemplate,
+        character_repository: CharacterRepository,
+        *,
+        max_workers: int = 1,
+        **kwargs
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers deve ser maior ou igual a 1")
+
+        super().__init__(llm_client, prompt_template, character_repository, **kwargs)
+        self.max_workers = max_workers
+
     def process(
         self,
-        lines: List[Line],
+        lines: Iterable[Line],
         *,
         chunk_size: Optional[int] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        work_id: Optional[str] = None,
+        chapter_id: Optional[str] = None
     ) -> List[Segment]:
-        logger.info(
-            "Iniciando processamento de %d linhas com chunk_size=%d", 
-            len(lines), chunk_size or self.chunk_size
+        blocks = self._make_blocks(lines, chunk_size, metadata)
+        logger.info("Iniciando processamento de %d linhas em %d bloco(s)", sum(map(len, blocks)), len(blocks))
+
+        if self.max_workers > 1 and len(blocks) > 1:
+            results, failures = self._dispatch_concurrent(blocks, metadata, work_id, chapter_id)
+        else:
+            # Um batch por capítulo: as gravações no cache (feitas nesta
+            # thread) são confirmadas juntas, quando o cache suportar.
+            batch = self.block_cache.batch() if self._cache_enabled(work_id, chapter_id) else nullcontext()
+            with batch:
+                results, failures = self._dispatch_sequential(blocks, metadata, work_id, chapter_id)
+
+        return self._merge_results(results, failures)
+
+    def iter_process(
+        self,
+        lines: Iterable[Line],
+        *,
+        chunk_size: Optional[int] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        work_id: Optional[str] = None,
+        chapter_id: Optional[str] = None
+    ) -> Iterator[Segment]:
+        """
+        Processa os blocos em sequência, produzindo os Segments durante a
+        geração da resposta. Ignora `max_workers`: o objetivo aqui é reduzir
+        o tempo até o primeiro segmento, não o tempo total.
+
+        `lines` é consumido sob demanda, bloco a bloco (ex: FileTextLoader.iter_lines),
+        sem materializar o arquivo inteiro.
+        """
+        logger.info("Iniciando processamento em streaming")
+        for index, block in enumerate(self._iter_blocks(lines, chunk_size, metadata)):
+            yield from self._stream_block(index, block, metadata, work_id, chapter_id)
+
+    def _stream_block(
+        self,
+        index: int,
+        block: List[Line],
+        metadata: Optional[Dict[str, Any]],
+        work_id: Optional[str],
+        chapter_id: Optional[str]
+    ) -> Iterator[Segment]:
+        messages = self._build_block_messages(index, block, metadata)
+        fingerprint = self._block_fingerprint(messages)
+
+        cached = self._load_cached_block(work_id, chapter_id, index, fingerprint)
+        if cached is not None:
+            yield from self._build_segments(cached)
+            return
+
+        received: List[Dict[str, Any]] = []
+        # Os segmentos de uma linha só saem quando a próxima linha começa (ou
+        # o stream termina): se o stream falhar no meio de uma linha, ela vem
+        # inteira da nova resposta, sem misturar as duas.
+        held: List[Dict[str, Any]] = []
+        done_lines = set()
+        try:
+            for item in iter_stream_segments(self._stream_llm(messages)):
+                for obj in self._decode_segments([item], block):
+                    line_number = obj.get("line_number")
+                    if held and held[0].get("line_number") != line_number:
+                        done_lines.add(held[0].get("line_number"))
+                        received.extend(held)
+                        yield from self._build_segments(held)
+                        held = []
+                    if line_number in done_lines:
+                        raise ValueError(f"Segmento da linha {line_number} chegou depois de a linha terminar")
+                    held.append(obj)
+        except ValueError as e:
+            logger.exception("Erro ao fazer o parse do stream do bloco %d", index)
+            held = self._recover_stream(index, block, metadata, done_lines, e)
+        received.extend(held)
+        yield from self._build_segments(held)
+
+        self._save_cached_block(work_id, chapter_id, index, fingerprint, received)
+
+    def _stream_llm(self, messages: List[LLMMessage]) -> Iterator[str]:
+        try:
+            yield from self.llm.stream_chat(messages=messages, **self._request_params())
+        except Exception as e:
+            logger.exception("Erro ao chamar a LLM (streaming): %s", str(e))
+            raise
+
+    def _recover_stream(
+        self,
+        index: int,
+        block: List[Line],
+        metadata: Optional[Dict[str, Any]],
+        done_lines: Set[int],
+        error: ValueError
+    ) -> List[Dict[str, Any]]:
+        """
+        Reenvia (sem streaming, com bissecção) as linhas do bloco que o stream
+        interrompido não completou e retorna os segmentos delas, todos da
+        nova resposta.
+        """
+        remaining = [ln for ln in block if ln.line_number not in done_lines]
+        if not self.split_on_failure or not remaining:
+            raise error
+
+        logger.warning(
+            "Stream do bloco %d interrompido após %d linha(s) completa(s); reenviando %d linha(s)",
+            index, len(done_lines), len(remaining)
         )
-        size = chunk_size or self.chunk_size
-        all_segments: List[Segment] = []
-        
-        for i in range(0, len(lines), size):
-            block = lines[i : i + size]
-            logger.debug("Processando bloco de linhas %d até %d", i, i + size)
-            
-            payload: Dict[str, Any] = {
-                "lines": [
-                    {"line_number": ln.line_number, "text": ln.original_text}
-                    for ln in block
-                ]
-            }
-            if metadata:
-                payload["metadata"] = metadata
-                
-            messages: List[LLMMessage] = self.template.build_messages(payload)
-            logger.debug("Mensagens construídas: %s", messages)
-            
+        requested = {ln.line_number for ln in remaining}
+        return [obj for obj in self._request_block(index, remaining, metadata) if obj.get("line_number") in requested]
+
+    def _dispatch_sequential(
+        self,
+        blocks: List[List[Line]],
+        metadata: Optional[Dict[str, Any]],
+        work_id: Optional[str],
+        chapter_id: Optional[str]
+    ) -> Tuple[Dict[int, List[Dict[str, Any]]], Dict[int, Exception]]:
+        """
+        Envia os blocos um a um. Como no modo concorrente, a falha de um
+        bloco é coletada e os blocos seguintes continuam sendo processados.
+        """
+        results: Dict[int, List[Dict[str, Any]]] = {}
+        failures: Dict[int, Exception] = {}
+        for index, block in enumerate(blocks):
             try:
-                response: LLMResponse = self.llm.chat(
-                    messages=messages,
-                    temperature=self.temperature,
-                    max_tokens=self.max_tokens,
-                    top_p=self.top_p,
-                    frequency_penalty=self.frequency_penalty,
-                    presence_penalty=self.presence_penalty
-                )
-                logger.debug("Resposta recebida da LLM: %s", response.text[:1000] + "..." if len(response.text) > 1000 else response.text)
+                results[index] = self._process_block(index, block, metadata, work_id, chapter_id)
             except Exception as e:
-                logger.exception("Erro ao chamar a LLM: %s", str(e))
-                raise
-        
-            try:
-                data = json.loads(response.text)
-                segments_data = data.get("segments", [])
-                logger.info("Foram retornados %d segmentos pela LLM", len(segments_data))
-            except json.JSONDecodeError as e:
-                logger.exception("Erro ao fazer o parse do JSON retornado pela LLM: %s", str(e))
-                raise
-            
-            for obj in segments_data:
-                seg = Segment.from_dict(obj)
-                
-                character = self.char_repo.upsert(
-                    name=obj.get("speaker", "Narrador"),
-                    character_type=obj.get("character_type", "unknown"),
-                    gender=obj.get("gender", "unknown")
-                )
-
-                logger.debug("Personagem processado: %s (%s, %s)", character.name, character.type, character.gender)
-                seg.character = character
-                all_segments.append(seg)
-            
-        all_segments.sort(key=lambda s: (s.line_number, s.segment_index))
-        logger.info("Processamento finalizado. Total de segmentos: %d", len(all_segments))
-        return all_segments
+                failures[index] = e
+        return results, failures
+
+    def _dispatch_concurrent(
+        self,
+        blocks: List[List[Line]],
+        metadata: Optional[Dict[str, Any]],
+        work_id: Optional[str],
+        chapter_id: Optional[str]
+    ) -> Tuple[Dict[int, List[Dict[str, Any]]], Dict[int, Exception]]:
+        """
+        Envia os blocos em paralelo. Falhas são coletadas por índice de bloco
+        sem interromper os demais.
+        """
+        logger.info("Despachando %d blocos com até %d requisições simultâneas", len(blocks), self.max_workers)
+        results: Dict[int, List[Dict[str, Any]]] = {}
+        failures: Dict[int, Exception] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._process_block, index, block, metadata, work_id, chapter_id): index
+                for index, block in enumerate(blocks)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    failures[index] = e
+
+        return results, failures
+
+    def _process_block(
+        self,
+        index: int,
+        block: List[Line],
+        metadata: Optional[Dict[str, Any]],
+        work_id: Optional[str],
+        chapter_id: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Retorna os segmentos crus do bloco, do cache quando disponível
+        ou a partir de uma nova chamada à LLM (que é então cacheada).
+        """
+        messages = self._build_block_messages(index, block, metadata)
+        fingerprint = self._block_fingerprint(messages)
+
+        cached = self._load_cached_block(work_id, chapter_id, index, fingerprint)
+        if cached is not None:
+            return cached
+
+        segments_data = self._request_block(index, block, metadata, messages)
+        self._save_cached_block(work_id, chapter_id, index, fingerprint, segments_data)
+        return segments_data
+
+    def _request_block(
+        self,
+        index: int,
+        block: List[Line],
+        metadata: Optional[Dict[str, Any]],
+        messages: Optional[List[LLMMessage]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Executa a chamada à LLM para um bloco e retorna os segmentos crus (dicts).
+        Não toca no CharacterRepository, podendo rodar em qualquer thread.
+
+        Se a resposta vier truncada ou não puder ser interpretada, o bloco é
+        dividido ao meio e cada metade é requisitada separadamente, até o
+        limite de uma linha (quando o erro é propagado).
+        """
+        messages = messages or self._build_block_messages(index, block, metadata)
+        response = self._call_llm(messages)
+        segments_data = self._parse_or_split(index, block, response)
+        if segments_data is not None:
+            return segments_data
+
+        left, right = self._halves(block)
+        return self._request_block(index, left, metadata) + self._request_block(index, right, metadata)
+
+    def _call_llm(self, messages: List[LLMMessage]) -> LLMResponse:
+        try:
+            response: LLMResponse = self.llm.chat(messages=messages, **self._request_params())
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Resposta recebida da LLM: %s", response.text[:1000] + "..." if len(response.text) > 1000 else response.text)
+        except Exception as e:
+            logger.exception("Erro ao chamar a LLM: %s", str(e))
+            raise
+        return response
@@ -0,0 +1,33 @@
+from typing import Any, Dict, Iterable, List
+
+# Checagens por campo do formato completo de segmento (o mesmo de
+# PIPELINE_RESPONSE_SCHEMA), sem passar por um validador de JSON Schema.
+# Os campos de enum só precisam ser texto: valores fora da lista são
+# tolerados, como antes do schema, e caem no padrão via `.safe`
+# (SegmentType/EmotionType) e no CharacterRepository (tipo e gênero).
+_ENUM_FIELDS = ("segment_type", "character_type", "gender", "emotion")
+_INT_FIELDS = ("line_number", "segment_index")
+_STR_FIELDS = ("original_text", "translated_text", "speaker") + _ENUM_FIELDS
+
+
+def validate_segments(segments: List[Dict[str, Any]], line_numbers: Iterable[int]) -> None:
+    """
+    Valida os segmentos (já no formato completo) de um bloco: campos
+    obrigatórios com o tipo certo, `original_text` não vazio e `line_number`
+    pertencente ao bloco. Lança ValueError no primeiro problema.
+    """
+    expected = set(line_numbers)
+    for position, seg in enumerate(segments):
+        if not isinstance(seg, dict):
+            raise ValueError(f"Segmento {position} não é um objeto: {seg!r}")
+        for field in _INT_FIELDS:
+            value = seg.get(field)
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise ValueError(f"Segmento {position}: '{field}' deve ser inteiro, veio {value!r}")
+        for field in _STR_FIELDS:
+            if not isinstance(seg.get(field), str):
+                raise ValueError(f"Segmento {position}: '{field}' deve ser texto, veio {seg.get(field)!r}")
+        if not seg["original_text"].strip():
+            raise ValueError(f"Segmento {position}: 'original_text' está vazio")
+        if seg["line_number"] not in expected:
+            raise ValueError(f"Segmento {position}: linha {seg['line_number']} não pertence ao bloco")
@@ -0,0 +1,118 @@
+import re
+import json
+import logging
+from typing import Any, Dict, Iterable, Iterator, List
+
+logger = logging.getLogger(__name__)
+
+_SEGMENTS_ARRAY = re.compile(r'"segments"\s*:\s*\[')
+
+
+class StreamingSegmentParser:
+    """
+    Parser incremental da resposta `{"segments": [ {...}, {...} ]}`.
+
+    Recebe o texto em pedaços (`feed`) e devolve cada objeto do array
+    `segments` assim que a chave de fechamento correspondente chega,
+    sem esperar o fim da resposta. Strings e escapes são respeitados ao
+    contar chaves, e o buffer é descartado após cada objeto emitido.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0
+        self._in_array = False
+        self._done = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._start = 0
+        self.count = 0
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """
+        Acrescenta um pedaço de texto e retorna os segmentos completados por ele.
+        """
+        if self._done or not chunk:
+            return []
+        self._buffer += chunk
+
+        if not self._in_array:
+            match = _SEGMENTS_ARRAY.search(self._buffer)
+            if not match:
+                return []
+            self._in_array = True
+            self._buffer = self._buffer[match.end():]
+            self._pos = 0
+
+        return self._scan()
+
+    def finish(self) -> None:
+        """
+        Valida o fim do stream: o array `segments` precisa ter sido fechado.
+        """
+        if not self._done:
+            raise ValueError("Resposta incompleta: o array 'segments' não foi fechado")
+
+    def _scan(self) -> List[Dict[str, Any]]:
+        segments: List[Dict[str, Any]] = []
+        buffer = self._buffer
+        pos = self._pos
+
+        while pos < len(buffer):
+            ch = buffer[pos]
+            if self._depth == 0:
+                if ch == "{":
+                    self._start = pos
+                    self._depth = 1
+                elif ch == "]":
+                    self._done = True
+                    pos += 1
+                    break
+                elif not (ch.isspace() or ch == ","):
+                    raise ValueError(f"Caractere inesperado no array 'segments': {ch!r}")
+            elif self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    segment = json.loads(buffer[self._start:pos + 1])
+                    if not isinstance(segment, dict):
+                        raise ValueError("Esperava objetos JSON no array 'segments'")
+                    segments.append(segment)
+            pos += 1
+
+        # Mantém apenas o objeto em aberto (se houver) no buffer.
+        keep_from = self._start if self._depth else pos
+        self._buffer = buffer[keep_from:]
+        self._start = 0
+        self._pos = pos - keep_from
+
+        self.count += len(segments)
+        return segments
+
+
+def iter_stream_segments(chunks: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """
+    Percorre os pedaços de uma resposta em streaming e produz cada segmento
+    assim que ele se completa. Lança ValueError se a resposta terminar antes
+    do fechamento do array `segments`.
+    """
+    parser = StreamingSegmentParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    parser.finish()
+    logger.info("Foram retornados %d segmentos pela LLM (streaming)", parser.count)
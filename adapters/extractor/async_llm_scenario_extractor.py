@@ -0,0 +1,67 @@
+import asyncio
+import logging
+from typing import List, Optional
+
+from adapters.extractor.llm_scenario_extractor import LLMScenarioExtractor
+from core.interfaces.llm import IAsyncLLMClient, IPromptTemplate
+from core.models.chapter import Chapter
+from core.models.scenario import Scenario
+from core.utils.event_loop import run_sync
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncLLMScenarioExtractor(LLMScenarioExtractor):
+    """
+    Variante assíncrona do LLMScenarioExtractor, baseada em IAsyncLLMClient.
+    `extract` continua disponível como fachada síncrona, executada no
+    event loop persistente de run_sync. No modo map-reduce, até
+    `max_concurrency` trechos são extraídos ao mesmo tempo no event loop
+    (como no AsyncLLMPipelineProcessor, não há `max_workers`).
+    """
+
+    def __init__(
+        self,
+        llm_client: IAsyncLLMClient,
+        prompt_template: IPromptTemplate,
+        *,
+        max_input_tokens: Optional[int] = None,
+        max_concurrency: int = 8
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency deve ser maior ou igual a 1")
+        super().__init__(llm_client, prompt_template, max_input_tokens=max_input_tokens)
+        self.max_concurrency = max_concurrency
+
+    def extract(self, chapter: Chapter) -> List[Scenario]:
+        return run_sync(self.aextract(chapter))
+
+    async def aextract(self, chapter: Chapter) -> List[Scenario]:
+        shards = self._shard_narration(chapter)
+        if not shards:
+            return []
+
+        logger.info("Extraindo cenários do capítulo '%s' (%d trecho(s))...", chapter.id, len(shards))
+        if len(shards) == 1:
+            return await self._aextract_text(shards[0])
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(narration_text: str) -> List[Scenario]:
+            async with semaphore:
+                return await self._aextract_text(narration_text)
+
+        results = await asyncio.gather(*(run(shard) for shard in shards))
+        return self._reduce(chapter, list(results))
+
+    async def _aextract_text(self, narration_text: str) -> List[Scenario]:
+        messages = self.prompt.build_messages({"narration_text": narration_text})
+
+        try:
+            response = await self.client.achat(messages)
+            logger.debug("Resposta bruta da LLM: %s", response.text[:200] + "..." if len(response.text) > 200 else response.text)
+        except Exception:
+            logger.exception("Erro ao consultar a LLM para extração de cenários")
+            raise
+
+        return self._parse_scenarios(response)
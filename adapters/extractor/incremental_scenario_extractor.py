@@ -0,0 +1,94 @@
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from adapters.extractor.llm_scenario_extractor import LLMScenarioExtractor
+from core.interfaces.llm import ILLMClient, IPromptTemplate
+from core.interfaces.repository import IScenarioRegistryAdapter
+from core.models.chapter import Chapter
+from core.models.llm import LLMResponse
+from core.models.scenario import Scenario
+from core.repositories.scenario_registry import ScenarioRegistry
+
+logger = logging.getLogger(__name__)
+
+
+class IncrementalScenarioExtractor(LLMScenarioExtractor):
+    """
+    Extrai cenários capítulo a capítulo usando o registro de cenários da obra
+    (IScenarioRegistryAdapter): a LLM recebe apenas a lista de locais já
+    conhecidos e a narração do capítulo, descreve por completo só os locais
+    novos e, para os conhecidos, apenas detalhes novos. As atualizações são
+    incorporadas ao registro (ScenarioRegistry.merge) e gravadas a cada capítulo.
+
+    Usar com IncrementalScenarioPrompt. A divisão em trechos (`max_input_tokens`)
+    funciona como no LLMScenarioExtractor; as atualizações de todos os trechos
+    são aplicadas juntas.
+    """
+
+    def __init__(
+        self,
+        llm_client: ILLMClient,
+        prompt_template: IPromptTemplate,
+        registry: IScenarioRegistryAdapter,
+        *,
+        max_input_tokens: Optional[int] = None,
+        max_workers: int = 1
+    ):
+        super().__init__(llm_client, prompt_template, max_input_tokens=max_input_tokens, max_workers=max_workers)
+        self.registry = registry
+
+    def extract(self, chapter: Chapter) -> List[Scenario]:
+        known = self.registry.load(chapter.work_id).known_locations()
+        shards = self._shard_narration(chapter, {"known_locations": known})
+        if not shards:
+            return []
+
+        logger.info(
+            "Extraindo cenários do capítulo '%s' (%d trecho(s), %d local(is) conhecido(s))...",
+            chapter.id, len(shards), len(known)
+        )
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(shards))) as executor:
+            results = list(executor.map(lambda text: self._extract_updates(text, known), shards))
+        updates = [update for result in results for update in result]
+
+        scenarios: List[Scenario] = []
+
+        def apply(registry: ScenarioRegistry) -> None:
+            scenarios.extend(registry.merge(updates, chapter.id))
+
+        registry = self.registry.update(chapter.work_id, apply)
+        logger.info(
+            "Capítulo '%s': %d cenário(s); registro da obra com %d local(is)",
+            chapter.id, len(scenarios), len(registry)
+        )
+        return scenarios
+
+    def _extract_updates(self, narration_text: str, known_locations: List[str]) -> List[Dict[str, Any]]:
+        messages = self.prompt.build_messages({
+            "narration_text": narration_text,
+            "known_locations": known_locations
+        })
+
+        try:
+            response = self.client.chat(messages)
+            logger.debug("Resposta bruta da LLM: %s", response.text[:200] + "..." if len(response.text) > 200 else response.text)
+        except Exception:
+            logger.exception("Erro ao consultar a LLM para extração de cenários")
+            raise
+
+        return self._parse_updates(response)
+
+    def _parse_updates(self, response: LLMResponse) -> List[Dict[str, Any]]:
+        try:
+            data = json.loads(response.text)
+            updates = data.get("scenarios", []) if isinstance(data, dict) else None
+            if not isinstance(updates, list) or not all(isinstance(u, dict) for u in updates):
+                raise ValueError("Esperava 'scenarios' como lista de objetos")
+        except ValueError:
+            logger.exception("Erro ao interpretar resposta da LLM na extração de cenários")
+            raise
+
+        logger.info("Foram retornadas %d atualização(ões) de cenários", len(updates))
+        return updates
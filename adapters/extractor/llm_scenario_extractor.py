@@ -1,12 +1,17 @@
 import json
 import logging
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 
 from core.enums import SegmentType
 from core.interfaces.extraction import IScenarioExtractor
 from core.interfaces.llm import IPromptTemplate, ILLMClient
 from core.models.chapter import Chapter
+from core.models.llm import LLMResponse
 from core.models.scenario import Scenario
+from core.utils.iteration import chunk_by_budget
+from core.utils.scenarios import merge_scenarios
+from core.utils.tokens import count_tokens, count_message_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -15,27 +20,46 @@ class LLMScenarioExtractor(IScenarioExtractor):
     """
     Usa uma única chamada à LLM para extrair os principais cenários
     de um capítulo, baseando-se nos segmentos de narração.
+
+    Com `max_input_tokens`, a narração que não couber numa requisição é
+    dividida em trechos (segmentos consecutivos, até o orçamento de tokens
+    que sobra após as instruções do prompt),
+    extraídos em paralelo (`max_workers`) e depois unidos por local
+    normalizado (ver merge_scenarios), num esquema map-reduce sem chamada
+    extra à LLM.
     """
 
-    def __init__(self, llm_client: ILLMClient, prompt_template: IPromptTemplate):
+    def __init__(
+        self,
+        llm_client: ILLMClient,
+        prompt_template: IPromptTemplate,
+        *,
+        max_input_tokens: Optional[int] = None,
+        max_workers: int = 1
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers deve ser maior ou igual a 1")
         self.client = llm_client
         self.prompt = prompt_template
+        self.max_input_tokens = max_input_tokens
+        self.max_workers = max_workers
 
     def extract(self, chapter: Chapter) -> List[Scenario]:
-        narration_text = "\n".join(
-            seg.translated_text
-            for line in chapter.lines
-            for seg in line.segments
-            if seg.segment_type == SegmentType.NARRATION
-        ).strip()
-        
-        if not narration_text:
-            logger.warning("Nenhum segmento de narração encontrado no capítulo '%s'.", chapter.id)
+        shards = self._shard_narration(chapter)
+        if not shards:
             return []
 
-        logger.info("Extraindo cenários do capítulo '%s'...", chapter.id)
+        logger.info("Extraindo cenários do capítulo '%s' (%d trecho(s))...", chapter.id, len(shards))
+        if len(shards) == 1:
+            return self._extract_text(shards[0])
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(shards))) as executor:
+            results = list(executor.map(self._extract_text, shards))
+        return self._reduce(chapter, results)
+
+    def _extract_text(self, narration_text: str) -> List[Scenario]:
         messages = self.prompt.build_messages({"narration_text": narration_text})
-        
+
         try:
             response = self.client.chat(messages)
             logger.debug("Resposta bruta da LLM: %s", response.text[:200] + "..." if len(response.text) > 200 else response.text)
@@ -43,6 +67,63 @@ class LLMScenarioExtractor(IScenarioExtractor):
             logger.exception("Erro ao consultar a LLM para extração de cenários")
             raise
 
+        return self._parse_scenarios(response)
+
+    def _reduce(self, chapter: Chapter, results: List[List[Scenario]]) -> List[Scenario]:
+        found = sum(len(scenarios) for scenarios in results)
+        merged = merge_scenarios(sc for scenarios in results for sc in scenarios)
+        logger.info(
+            "Capítulo '%s': %d cenário(s) extraído(s) dos trechos, %d após a junção",
+            chapter.id, found, len(merged)
+        )
+        return merged
+
+    def _narration_parts(self, chapter: Chapter) -> List[str]:
+        return [
+            seg.translated_text
+            for line in chapter.lines
+            for seg in line.segments
+            if seg.segment_type == SegmentType.NARRATION and seg.translated_text
+        ]
+
+    def _collect_narration(self, chapter: Chapter) -> str:
+        narration_text = "\n".join(self._narration_parts(chapter)).strip()
+
+        if not narration_text:
+            logger.warning("Nenhum segmento de narração encontrado no capítulo '%s'.", chapter.id)
+        return narration_text
+
+    def _shard_narration(self, chapter: Chapter, extra_payload: Optional[Dict[str, Any]] = None) -> List[str]:
+        """
+        Divide a narração em trechos que, somados ao restante do prompt
+        (instruções e `extra_payload`), cabem em `max_input_tokens` tokens
+        (um só trecho sem limite ou se tudo couber).
+        """
+        narration_text = self._collect_narration(chapter)
+        if not narration_text:
+            return []
+        if self.max_input_tokens is None:
+            return [narration_text]
+
+        model = getattr(self.client, "model", None)
+        model = model if isinstance(model, str) else "gpt-4o"
+        # LLMMessage não aceita conteúdo vazio: mede com um marcador e o desconta.
+        placeholder_payload = {**(extra_payload or {}), "narration_text": "."}
+        prompt_overhead = (
+            count_message_tokens(self.prompt.build_messages(placeholder_payload), model) - count_tokens(".", model)
+        )
+        budget = max(1, self.max_input_tokens - prompt_overhead)
+        if count_tokens(narration_text, model) <= budget:
+            return [narration_text]
+
+        shards = chunk_by_budget(
+            self._narration_parts(chapter),
+            lambda part: [count_tokens(part, model) + 1],  # +1: a quebra de linha
+            [budget]
+        )
+        return [text for text in ("\n".join(parts).strip() for parts in shards) if text]
+
+    def _parse_scenarios(self, response: LLMResponse) -> List[Scenario]:
         try:
             data = json.loads(response.text)
             scenarios_data = data.get("scenarios", [])
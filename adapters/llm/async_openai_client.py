@@ -0,0 +1,100 @@
+import os
+import logging
+from typing import Any, Dict, List, Optional
+
+import httpx
+from openai import AsyncOpenAI, OpenAIError
+
+from adapters.llm.openai_client import RESPONSE_FORMATS, OpenAIRequestMixin, build_llm_response, to_llm_error
+from adapters.llm.rate_limiter import RateLimiter
+from core.interfaces.llm import IAsyncLLMClient
+from core.models.llm import LLMMessage, LLMResponse
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncOpenAIClient(OpenAIRequestMixin, IAsyncLLMClient):
+    """
+    Implementação de IAsyncLLMClient usando AsyncOpenAI.
+
+    Todas as requisições compartilham um único pool de conexões httpx
+    (limitado por `max_connections`); requisições excedentes aguardam
+    uma conexão livre em vez de abrir novos sockets. Um RateLimiter
+    opcional é respeitado da mesma forma que no OpenAIClient.
+    """
+
+    def __init__(
+        self,
+        api_key: str = None,
+        model: str = "gpt-4o",
+        timeout: Optional[int] = None,
+        *,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        http_client: Optional[httpx.AsyncClient] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_retries: int = 2,
+        response_format: str = "json_schema"
+    ):
+        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        self.http_client = http_client or httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections
+            ),
+            timeout=timeout
+        )
+        self.client = AsyncOpenAI(
+            api_key=self.api_key, timeout=timeout, max_retries=max_retries, http_client=self.http_client
+        )
+        self.model = model
+        self.rate_limiter = rate_limiter
+        if response_format not in RESPONSE_FORMATS:
+            raise ValueError(f"response_format inválido: {response_format} (use {', '.join(RESPONSE_FORMATS)})")
+        self.response_format = response_format
+        logger.info("AsyncOpenAIClient inicializando com modelo '%s'", self.model)
+
+    async def achat(
+        self,
+        messages: List[LLMMessage],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        top_p: float = 1.0,
+        frequency_penalty: float = 0.0,
+        presence_penalty: float = 0.0,
+        response_schema: Optional[Dict[str, Any]] = None
+    ) -> LLMResponse:
+        request, estimated_tokens = self._prepare_request(
+            messages, temperature, max_tokens, top_p, frequency_penalty, presence_penalty, response_schema
+        )
+        if self.rate_limiter:
+            await self.rate_limiter.aacquire(estimated_tokens)
+        try:
+            if self.rate_limiter:
+                raw_resp = await self.client.chat.completions.with_raw_response.create(**request)
+                self.rate_limiter.update_from_headers(raw_resp.headers)
+                resp = await raw_resp.parse()
+            else:
+                resp = await self.client.chat.completions.create(**request)
+            logger.debug("Resposta da OpenAI recebida com sucesso.")
+        except OpenAIError as e:
+            logger.exception("Erro durante requisição à OpenAI")
+            self._observe_error(e)
+            raise to_llm_error(e, "[AsyncOpenAIClient.achat]") from e
+
+        response = build_llm_response(resp)
+        if self.rate_limiter and response.usage:
+            self.rate_limiter.reconcile(estimated_tokens, response.usage.total_tokens)
+        return response
+
+    async def aclose(self) -> None:
+        """
+        Fecha o pool de conexões compartilhado.
+        """
+        await self.client.close()
+
+    async def __aenter__(self) -> "AsyncOpenAIClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
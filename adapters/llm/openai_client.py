@@ -1,28 +1,114 @@
 import os
 import logging
-from typing import List, Optional
-from openai import OpenAI, OpenAIError
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from openai import OpenAI, OpenAIError, APIConnectionError, APIStatusError
 
-from core.interfaces.llm import ILLMClient
+from adapters.llm.rate_limiter import RateLimiter
+from core.interfaces.llm import ILLMClient, LLMTransientError, LLMPermanentError
 from core.models.llm import LLMMessage, LLMResponse, LLMUsage
+from core.utils.tokens import count_message_tokens
 
 logger = logging.getLogger(__name__)
 
 
-class OpenAIClient(ILLMClient):
+class OpenAIRequestMixin:
+    """
+    Partes comuns ao OpenAIClient e ao AsyncOpenAIClient: montagem da
+    requisição, estimativa de tokens para o RateLimiter e realimentação
+    do limitador por erros de rate limit. Espera os atributos `model`,
+    `rate_limiter` e `response_format`.
+    """
+
+    model: str
+    rate_limiter: Optional[RateLimiter]
+    response_format: str
+
+    def _prepare_request(
+        self,
+        messages: List[LLMMessage],
+        temperature: float,
+        max_tokens: Optional[int],
+        top_p: float,
+        frequency_penalty: float,
+        presence_penalty: float,
+        response_schema: Optional[Dict[str, Any]],
+        **extra: Any
+    ) -> Tuple[Dict[str, Any], int]:
+        """
+        Retorna os argumentos de `chat.completions.create` e, com RateLimiter,
+        os tokens estimados da requisição (prompt + max_tokens; 0 sem limitador).
+        """
+        payload = [msg.to_dict() for msg in messages]
+        logger.debug("Enviando %d mensagens para o modelo '%s'", len(payload), self.model)
+
+        request: Dict[str, Any] = dict(
+            model=self.model,
+            messages=payload,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            top_p=top_p,
+            frequency_penalty=frequency_penalty,
+            presence_penalty=presence_penalty,
+            **extra
+        )
+        if response_schema is not None:
+            request["response_format"] = build_response_format(response_schema, self.response_format)
+
+        estimated_tokens = 0
+        if self.rate_limiter:
+            estimated_tokens = count_message_tokens(messages, self.model) + (max_tokens or 0)
+        return request, estimated_tokens
+
+    def _observe_error(self, error: OpenAIError) -> None:
+        """
+        Num 429 de rate limit, suspende o RateLimiter (compartilhado pelos
+        workers) pelo tempo indicado pela API, em vez de deixar as demais
+        requisições também receberem 429.
+        """
+        if not self.rate_limiter or not is_rate_limit_error(error):
+            return
+        headers = error.response.headers
+        self.rate_limiter.update_from_headers(headers)
+        pause = _retry_after(error.response) or RATE_LIMIT_PAUSE
+        logger.warning("Rate limit atingido; suspendendo novas requisições por %.2fs", pause)
+        self.rate_limiter.pause(pause)
+
+
+class OpenAIClient(OpenAIRequestMixin, ILLMClient):
     """
     Implementação de ILLMClient usando OpenAI.
+
+    Com um RateLimiter, cada requisição aguarda capacidade de RPM/TPM
+    (tokens de prompt estimados + max_tokens) antes de ser enviada, e os
+    headers `x-ratelimit-*` da resposta realimentam o limitador; um 429
+    o suspende pelo tempo indicado pela API.
+
+    Com `response_schema` (JSON Schema declarado pelo template), a requisição
+    leva `response_format`: "json_schema" (structured outputs estritos, para
+    schemas fechados) ou, para modelos sem esse suporte, "json_object"
+    (apenas JSON válido). Uma recusa do modelo vira LLMPermanentError.
+
+    Erros da OpenAI são convertidos em LLMTransientError ou LLMPermanentError
+    (ambos RuntimeError). Ao usar um RetryingLLMClient por cima, passe
+    `max_retries=0` para desativar as retentativas internas do SDK.
     """
     
     def __init__(
         self,
         api_key: str = None,
         model: str = "gpt-4o",
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_retries: int = 2,
+        response_format: str = "json_schema"
     ):
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
-        self.client = OpenAI(api_key=self.api_key, timeout=timeout)
+        self.client = OpenAI(api_key=self.api_key, timeout=timeout, max_retries=max_retries)
         self.model = model
+        self.rate_limiter = rate_limiter
+        if response_format not in RESPONSE_FORMATS:
+            raise ValueError(f"response_format inválido: {response_format} (use {', '.join(RESPONSE_FORMATS)})")
+        self.response_format = response_format
         logger.info("OpenAIClient inicializando com modelo '%s'", self.model)
         
     def chat(
@@ -32,39 +118,179 @@ class OpenAIClient(ILLMClient):
         max_tokens: Optional[int] = None,
         top_p: float = 1.0,
         frequency_penalty: float = 0.0,
-        presence_penalty: float = 0.0
+        presence_penalty: float = 0.0,
+        response_schema: Optional[Dict[str, Any]] = None
     ) -> LLMResponse:
-        payload = [msg.to_dict() for msg in messages]
-        logger.debug("Enviando %d mensagens para o modelo '%s'", len(payload), self.model)
-        
+        request, estimated_tokens = self._prepare_request(
+            messages, temperature, max_tokens, top_p, frequency_penalty, presence_penalty, response_schema
+        )
+        if self.rate_limiter:
+            self.rate_limiter.acquire(estimated_tokens)
         try: 
-            resp = self.client.chat.completions.create(
-                model=self.model,
-                messages=payload,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                top_p=top_p,
-                frequency_penalty=frequency_penalty,
-                presence_penalty=presence_penalty
-            )
+            resp = self._create(request)
             logger.debug("Resposta da OpenAI recebida com sucesso.")
         except OpenAIError as e:
             logger.exception("Erro durante requisição à OpenAI")
-            raise RuntimeError(f"[OpenAIClient.chat] Error: {e}")
+            self._observe_error(e)
+            raise to_llm_error(e, "[OpenAIClient.chat]") from e
         
-        choice = resp.choices[0].message
-        usage = None
-        if hasattr(resp, "usage"):
-            usage = LLMUsage(
-                prompt_tokens=resp.usage.prompt_tokens,
-                completion_tokens=resp.usage.completion_tokens,
-                total_tokens=resp.usage.total_tokens
-            )
-            logger.info("Uso de tokens - Prompt: %d, Completion: %d, Total: %d",
-                        usage.prompt_tokens, usage.completion_tokens, usage.total_tokens)
-    
-        return LLMResponse(
-            text=choice.content.strip(),
-            usage=usage,
-            raw=resp.to_dict()
+        response = build_llm_response(resp)
+        if self.rate_limiter and response.usage:
+            self.rate_limiter.reconcile(estimated_tokens, response.usage.total_tokens)
+        return response
+
+    def stream_chat(
+        self,
+        messages: List[LLMMessage],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        top_p: float = 1.0,
+        frequency_penalty: float = 0.0,
+        presence_penalty: float = 0.0,
+        response_schema: Optional[Dict[str, Any]] = None
+    ) -> Iterator[str]:
+        """
+        Igual a `chat`, mas com `stream=True`: produz o texto em pedaços
+        conforme a OpenAI os envia. O uso de tokens chega no último chunk
+        (`include_usage`) e é usado para reconciliar o RateLimiter; os
+        headers de rate limit são lidos na abertura do stream.
+        """
+        request, estimated_tokens = self._prepare_request(
+            messages, temperature, max_tokens, top_p, frequency_penalty, presence_penalty, response_schema,
+            stream=True, stream_options={"include_usage": True}
         )
+        if self.rate_limiter:
+            self.rate_limiter.acquire(estimated_tokens)
+        refusal = ""
+        try:
+            stream = self._create(request)
+            for chunk in stream:
+                if chunk.choices:
+                    delta = chunk.choices[0].delta
+                    if delta.content:
+                        yield delta.content
+                    if isinstance(getattr(delta, "refusal", None), str):
+                        refusal += delta.refusal
+                usage = getattr(chunk, "usage", None)
+                if usage is not None:
+                    logger.info("Uso de tokens (streaming) - Prompt: %s (cache: %d), Completion: %s",
+                                usage.prompt_tokens, cached_prompt_tokens(usage), usage.completion_tokens)
+                    if self.rate_limiter:
+                        self.rate_limiter.reconcile(estimated_tokens, usage.total_tokens)
+            logger.debug("Streaming da OpenAI concluído.")
+            if refusal:
+                raise LLMPermanentError(f"[OpenAIClient.stream_chat] Recusa do modelo: {refusal}")
+        except OpenAIError as e:
+            logger.exception("Erro durante streaming da OpenAI")
+            self._observe_error(e)
+            raise to_llm_error(e, "[OpenAIClient.stream_chat]") from e
+
+    def _create(self, request: Dict[str, Any]) -> Any:
+        """
+        Chama `chat.completions.create`; com RateLimiter, pela resposta crua,
+        para realimentá-lo com os headers `x-ratelimit-*` (também em streaming).
+        """
+        if not self.rate_limiter:
+            return self.client.chat.completions.create(**request)
+        raw_resp = self.client.chat.completions.with_raw_response.create(**request)
+        self.rate_limiter.update_from_headers(raw_resp.headers)
+        return raw_resp.parse()
+
+
+RETRYABLE_STATUS = {408, 409, 429}
+
+# Pausa do RateLimiter após um 429 sem retry-after.
+RATE_LIMIT_PAUSE = 1.0
+
+RESPONSE_FORMATS = ("json_schema", "json_object")
+
+
+def build_response_format(schema: Dict[str, Any], mode: str = "json_schema") -> Dict[str, Any]:
+    """
+    Monta o `response_format` da OpenAI para um JSON Schema. O nome vem de
+    `title` no schema. Só schemas fechados (additionalProperties=false,
+    todos os campos obrigatórios) vão em modo estrito; os demais, como o
+    compacto de arrays posicionais, que o modo estrito não aceita, e o
+    modo "json_object" pedem apenas JSON válido.
+    """
+    if mode == "json_object" or schema.get("additionalProperties") is not False:
+        return {"type": "json_object"}
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": schema.get("title", "response"), "schema": schema, "strict": True}
+    }
+
+
+def _retry_after(response) -> Optional[float]:
+    headers = getattr(response, "headers", None) or {}
+    for header, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        value = headers.get(header)
+        if value is None:
+            continue
+        try:
+            return float(value) * scale
+        except ValueError:
+            continue
+    return None
+
+
+def is_rate_limit_error(error: OpenAIError) -> bool:
+    """
+    429 por limite de taxa (não por falta de créditos, que é permanente).
+    """
+    return (
+        isinstance(error, APIStatusError)
+        and error.status_code == 429
+        and getattr(error, "code", None) != "insufficient_quota"
+    )
+
+
+def to_llm_error(error: OpenAIError, context: str) -> RuntimeError:
+    """
+    Classifica um erro da OpenAI como transitório (vale repetir) ou permanente.
+    """
+    message = f"{context} Error: {error}"
+    if isinstance(error, APIConnectionError):
+        return LLMTransientError(message)
+    if isinstance(error, APIStatusError):
+        if error.status_code == 429 and getattr(error, "code", None) == "insufficient_quota":
+            return LLMPermanentError(message)
+        if error.status_code in RETRYABLE_STATUS or error.status_code >= 500:
+            return LLMTransientError(message, retry_after=_retry_after(error.response))
+    return LLMPermanentError(message)
+
+
+def cached_prompt_tokens(usage) -> int:
+    """
+    Tokens do prompt atendidos pelo cache de prefixo da OpenAI
+    (usage.prompt_tokens_details.cached_tokens); 0 se ausente.
+    """
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", None)
+    return cached if isinstance(cached, int) else 0
+
+
+def build_llm_response(resp) -> LLMResponse:
+    """
+    Converte a resposta do SDK da OpenAI (síncrono ou assíncrono) em LLMResponse.
+    """
+    choice = resp.choices[0].message
+    if choice.content is None:
+        refusal = getattr(choice, "refusal", None)
+        raise LLMPermanentError(f"[OpenAI] Resposta sem conteúdo; recusa do modelo: {refusal or 'não informada'}")
+    usage = None
+    if hasattr(resp, "usage"):
+        usage = LLMUsage(
+            prompt_tokens=resp.usage.prompt_tokens,
+            completion_tokens=resp.usage.completion_tokens,
+            total_tokens=resp.usage.total_tokens,
+            cached_tokens=cached_prompt_tokens(resp.usage)
+        )
+        logger.info("Uso de tokens - Prompt: %d (cache: %d), Completion: %d, Total: %d",
+                    usage.prompt_tokens, usage.cached_tokens, usage.completion_tokens, usage.total_tokens)
+
+    return LLMResponse(
+        text=choice.content.strip(),
+        usage=usage,
+        raw=resp.to_dict()
+    )
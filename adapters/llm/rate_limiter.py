@@ -0,0 +1,172 @@
+import re
+import time
+import asyncio
+import logging
+import threading
+from typing import Callable, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_reset_duration(value: str) -> Optional[float]:
+    """
+    Converte durações no formato dos headers da OpenAI
+    (ex: '20ms', '1s', '6m0s', '1h2m3.5s') em segundos.
+    """
+    parts = _DURATION_PART.findall(value or "")
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+class _Bucket:
+    """
+    Balde com vazamento contínuo: `capacity` unidades por minuto.
+    O nível pode ficar negativo, o que representa reservas em fila.
+    """
+
+    def __init__(self, per_minute: int, now: float):
+        self.capacity = float(per_minute)
+        self.level = float(per_minute)
+        self.updated = now
+
+    @property
+    def rate(self) -> float:
+        return self.capacity / 60.0
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, amount: float) -> float:
+        """
+        Consome `amount` e retorna quantos segundos o chamador deve esperar.
+        Pedidos maiores que a capacidade são limitados a ela, para não travar.
+        """
+        self.level -= min(amount, self.capacity)
+        return 0.0 if self.level >= 0 else -self.level / self.rate
+
+
+class RateLimiter:
+    """
+    Agendador client-side para os limites de RPM (requisições por minuto)
+    e TPM (tokens por minuto) da conta.
+
+    Cada chamada reserva 1 requisição e o número estimado de tokens antes
+    de ser enviada; se algum balde estiver vazio, o chamador aguarda a sua
+    vez em vez de receber um 429. Os headers `x-ratelimit-*` das respostas
+    ajustam os limites e o saldo restante, já que a cota é compartilhada
+    com outros processos.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        now = clock()
+        self._requests = _Bucket(requests_per_minute, now) if requests_per_minute else None
+        self._tokens = _Bucket(tokens_per_minute, now) if tokens_per_minute else None
+        self._paused_until = 0.0
+
+    def reserve(self, tokens: int) -> float:
+        """
+        Reserva capacidade para uma requisição de `tokens` tokens e
+        retorna o tempo de espera (segundos) antes de enviá-la.
+        """
+        with self._lock:
+            now = self._clock()
+            wait = max(0.0, self._paused_until - now)
+            if self._requests:
+                self._requests.refill(now)
+                wait = max(wait, self._requests.reserve(1))
+            if self._tokens:
+                self._tokens.refill(now)
+                wait = max(wait, self._tokens.reserve(tokens))
+        if wait > 0:
+            logger.info("Limite de taxa atingido; aguardando %.2fs antes da requisição (%d tokens)", wait, tokens)
+        return wait
+
+    def acquire(self, tokens: int) -> float:
+        wait = self.reserve(tokens)
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    async def aacquire(self, tokens: int) -> float:
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """
+        Suspende novas requisições por `seconds` (ex: reset informado pela API).
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+    def reconcile(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """
+        Corrige o balde de tokens com o uso real informado pela API.
+        """
+        if not self._tokens:
+            return
+        with self._lock:
+            self._tokens.level = min(self._tokens.capacity, self._tokens.level + estimated_tokens - actual_tokens)
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """
+        Ajusta limites e saldo a partir dos headers `x-ratelimit-*`.
+        """
+        with self._lock:
+            now = self._clock()
+            self._requests = self._adapt(
+                self._requests, now,
+                headers.get("x-ratelimit-limit-requests"),
+                headers.get("x-ratelimit-remaining-requests")
+            )
+            self._tokens = self._adapt(
+                self._tokens, now,
+                headers.get("x-ratelimit-limit-tokens"),
+                headers.get("x-ratelimit-remaining-tokens")
+            )
+
+        for kind in ("requests", "tokens"):
+            if headers.get(f"x-ratelimit-remaining-{kind}") == "0":
+                reset = parse_reset_duration(headers.get(f"x-ratelimit-reset-{kind}", ""))
+                if reset:
+                    self.pause(reset)
+
+    @staticmethod
+    def _adapt(
+        bucket: Optional[_Bucket],
+        now: float,
+        limit: Optional[str],
+        remaining: Optional[str]
+    ) -> Optional[_Bucket]:
+        try:
+            limit_value = int(limit) if limit is not None else None
+            remaining_value = int(remaining) if remaining is not None else None
+        except ValueError:
+            return bucket
+
+        if limit_value:
+            if bucket is None:
+                bucket = _Bucket(limit_value, now)
+            elif bucket.capacity != limit_value:
+                logger.info("Limite ajustado pelos headers: %d → %d por minuto", bucket.capacity, limit_value)
+                bucket.capacity = float(limit_value)
+        if bucket is not None and remaining_value is not None:
+            bucket.refill(now)
+            bucket.level = min(bucket.level, float(remaining_value))
+        return bucket
@@ -0,0 +1,263 @@
+import time
+import random
+import asyncio
+import logging
+import threading
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from core.interfaces.llm import ILLMClient, IAsyncLLMClient, LLMTransientError
+from core.models.llm import LLMMessage, LLMResponse
+
+logger = logging.getLogger(__name__)
+
+# Erros de rede da biblioteca padrão também são tratados como transitórios.
+TRANSIENT_ERRORS = (LLMTransientError, TimeoutError, ConnectionError)
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Backoff exponencial com teto e "full jitter":
+    espera = random(0, min(max_delay, base_delay * 2 ** tentativa)).
+    Um `retry_after` informado pelo provedor é respeitado como espera mínima.
+    """
+    max_attempts: int = 5
+    base_delay: float = 1.0
+    max_delay: float = 60.0
+    jitter: bool = True
+
+    def __post_init__(self):
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts deve ser maior ou igual a 1")
+        if self.base_delay < 0 or self.max_delay < 0:
+            raise ValueError("Os atrasos não podem ser negativos")
+
+    def delay_for(
+        self,
+        attempt: int,
+        retry_after: Optional[float] = None,
+        rng: Callable[[], float] = random.random
+    ) -> float:
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        if self.jitter:
+            delay *= rng()
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+
+@dataclass
+class RetryStats:
+    """
+    Estatísticas de uma única chamada: tentativas feitas, tempo total
+    de espera e os erros transitórios encontrados.
+    """
+    attempts: int = 0
+    total_wait: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def retries(self) -> int:
+        return max(0, self.attempts - 1)
+
+
+class _RetryTracker:
+    """
+    Guarda as estatísticas da última chamada e os totais acumulados.
+
+    A última chamada fica numa ContextVar: cada thread e cada task asyncio
+    (ex: as criadas por asyncio.gather) enxergam apenas as suas próprias
+    estatísticas, e quem faz `await client.achat(...)` lê as da sua chamada.
+    """
+
+    def __init__(self):
+        self._last: ContextVar[Optional[RetryStats]] = ContextVar(f"retry_stats_{id(self)}", default=None)
+        self._lock = threading.Lock()
+        self.total_calls = 0
+        self.total_retries = 0
+        self.total_wait = 0.0
+
+    @property
+    def last_stats(self) -> Optional[RetryStats]:
+        return self._last.get()
+
+    def record(self, stats: RetryStats) -> None:
+        self._last.set(stats)
+        with self._lock:
+            self.total_calls += 1
+            self.total_retries += stats.retries
+            self.total_wait += stats.total_wait
+
+
+class RetryingLLMClient(ILLMClient):
+    """
+    Decorator de ILLMClient que repete chamadas com falhas transitórias
+    (LLMTransientError, timeouts, conexões perdidas) usando RetryPolicy.
+    Falhas permanentes são propagadas imediatamente.
+
+    As estatísticas da última chamada ficam em `last_stats` (por thread/task);
+    os totais acumulados, em `stats`.
+    """
+
+    def __init__(
+        self,
+        inner: ILLMClient,
+        policy: Optional[RetryPolicy] = None,
+        *,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Callable[[], float] = random.random
+    ):
+        self.inner = inner
+        self.policy = policy or RetryPolicy()
+        self.model = getattr(inner, "model", None)
+        self.stats = _RetryTracker()
+        self._sleep = sleep
+        self._rng = rng
+
+    @property
+    def last_stats(self) -> Optional[RetryStats]:
+        return self.stats.last_stats
+
+    def chat(
+        self,
+        messages: List[LLMMessage],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        top_p: float = 1.0,
+        frequency_penalty: float = 0.0,
+        presence_penalty: float = 0.0,
+        response_schema: Optional[Dict[str, Any]] = None
+    ) -> LLMResponse:
+        stats = RetryStats()
+        try:
+            while True:
+                stats.attempts += 1
+                try:
+                    return self.inner.chat(
+                        messages=messages,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        top_p=top_p,
+                        frequency_penalty=frequency_penalty,
+                        presence_penalty=presence_penalty,
+                        response_schema=response_schema
+                    )
+                except TRANSIENT_ERRORS as e:
+                    delay = _next_delay(self.policy, stats, e, self._rng)
+                    self._sleep(delay)
+        finally:
+            self.stats.record(stats)
+
+    def stream_chat(
+        self,
+        messages: List[LLMMessage],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        top_p: float = 1.0,
+        frequency_penalty: float = 0.0,
+        presence_penalty: float = 0.0,
+        response_schema: Optional[Dict[str, Any]] = None
+    ) -> Iterator[str]:
+        """
+        Repete o streaming apenas enquanto nenhum pedaço tiver sido produzido;
+        depois disso, repetir duplicaria o texto já entregue ao chamador.
+        """
+        stats = RetryStats()
+        try:
+            while True:
+                stats.attempts += 1
+                started = False
+                try:
+                    for chunk in self.inner.stream_chat(
+                        messages=messages,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        top_p=top_p,
+                        frequency_penalty=frequency_penalty,
+                        presence_penalty=presence_penalty,
+                        response_schema=response_schema
+                    ):
+                        started = True
+                        yield chunk
+                    return
+                except TRANSIENT_ERRORS as e:
+                    if started:
+                        raise
+                    delay = _next_delay(self.policy, stats, e, self._rng)
+                    self._sleep(delay)
+        finally:
+            self.stats.record(stats)
+
+
+class AsyncRetryingLLMClient(IAsyncLLMClient):
+    """
+    Variante assíncrona do RetryingLLMClient, para IAsyncLLMClient.
+    """
+
+    def __init__(
+        self,
+        inner: IAsyncLLMClient,
+        policy: Optional[RetryPolicy] = None,
+        *,
+        rng: Callable[[], float] = random.random
+    ):
+        self.inner = inner
+        self.policy = policy or RetryPolicy()
+        self.model = getattr(inner, "model", None)
+        self.stats = _RetryTracker()
+        self._rng = rng
+
+    @property
+    def last_stats(self) -> Optional[RetryStats]:
+        return self.stats.last_stats
+
+    async def achat(
+        self,
+        messages: List[LLMMessage],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        top_p: float = 1.0,
+        frequency_penalty: float = 0.0,
+        presence_penalty: float = 0.0,
+        response_schema: Optional[Dict[str, Any]] = None
+    ) -> LLMResponse:
+        stats = RetryStats()
+        try:
+            while True:
+                stats.attempts += 1
+                try:
+                    return await self.inner.achat(
+                        messages=messages,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        top_p=top_p,
+                        frequency_penalty=frequency_penalty,
+                        presence_penalty=presence_penalty,
+                        response_schema=response_schema
+                    )
+                except TRANSIENT_ERRORS as e:
+                    delay = _next_delay(self.policy, stats, e, self._rng)
+                    await asyncio.sleep(delay)
+        finally:
+            self.stats.record(stats)
+
+
+def _next_delay(policy: RetryPolicy, stats: RetryStats, error: Exception, rng: Callable[[], float]) -> float:
+    """
+    Registra o erro em `stats` e retorna a espera antes da próxima tentativa,
+    ou propaga o erro se as tentativas tiverem se esgotado.
+    """
+    stats.errors.append(str(error))
+    if stats.attempts >= policy.max_attempts:
+        logger.error("Desistindo após %d tentativas: %s", stats.attempts, error)
+        raise error
+
+    delay = policy.delay_for(stats.attempts - 1, getattr(error, "retry_after", None), rng)
+    stats.total_wait += delay
+    logger.warning(
+        "Falha transitória na tentativa %d/%d (%s); nova tentativa em %.2fs",
+        stats.attempts, policy.max_attempts, error, delay
+    )
+    return delay
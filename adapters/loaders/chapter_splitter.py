@@ -0,0 +1,144 @@
+import re
+import mmap
+import codecs
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional, Pattern, Sequence
+
+from adapters.loaders.file_text_loader import FileTextLoader, decode_lines
+from core.models.line import Line
+
+logger = logging.getLogger(__name__)
+
+# Títulos de capítulo comuns em webnovels chinesas e em traduções.
+DEFAULT_CHAPTER_PATTERNS = (
+    r"第[0-9０-９零〇一二两三四五六七八九十百千万]+[章回节卷]",
+    r"(?:Chapter|CHAPTER|Capítulo|CAPÍTULO)\s+[0-9IVXLCDM]+\b",
+)
+
+_NON_BLANK = re.compile(rb"\S")
+
+# Codificações em que '\n' não é o byte 0x0A isolado (a varredura por linhas não funciona).
+_UNSUPPORTED_ENCODINGS = ("utf-16", "utf-32")
+
+
+@dataclass(frozen=True)
+class RawChapter:
+    """
+    Capítulo localizado dentro de um arquivo concatenado: guarda apenas os
+    offsets em bytes do corpo (após a linha de título). As linhas são
+    decodificadas sob demanda em `lines()`, numeradas a partir de 0 dentro
+    do capítulo.
+
+    `title` é None para o texto anterior ao primeiro título (front matter).
+    """
+    path: Path
+    encoding: str
+    index: int
+    title: Optional[str]
+    start: int
+    end: int
+    read_size: int = 1024 * 1024
+
+    @property
+    def size(self) -> int:
+        return self.end - self.start
+
+    def lines(self) -> Iterator[Line]:
+        if self.size <= 0:
+            return
+        with self.path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            chunks = (
+                mm[pos:min(pos + self.read_size, self.end)]
+                for pos in range(self.start, self.end, self.read_size)
+            )
+            yield from decode_lines(chunks, self.encoding)
+
+
+class ChapterSplitter:
+    """
+    Divide um .txt com vários capítulos concatenados numa única passada
+    sobre o arquivo mapeado em memória (mmap): cada linha é decodificada
+    e comparada com as regexes de título (`patterns`, aplicadas com `match`
+    à linha sem espaços nas pontas).
+
+    `iter_chapters` produz cada RawChapter assim que o título seguinte é
+    encontrado, sem reler o arquivo nem manter o texto em memória.
+    """
+
+    def __init__(
+        self,
+        patterns: Sequence[str] = DEFAULT_CHAPTER_PATTERNS,
+        *,
+        loader: Optional[FileTextLoader] = None,
+        max_heading_length: int = 120
+    ):
+        self.patterns: Sequence[Pattern[str]] = [re.compile(p) for p in patterns]
+        self.loader = loader or FileTextLoader()
+        self.max_heading_length = max_heading_length
+
+    def iter_chapters(self, file_path: str) -> Iterator[RawChapter]:
+        path = Path(file_path)
+        encoding = self.loader.detect_encoding(path)
+        if codecs.lookup(encoding).name.startswith(_UNSUPPORTED_ENCODINGS):
+            raise ValueError(f"Codificação não suportada para divisão em capítulos: {encoding}")
+        if path.stat().st_size == 0:
+            return
+
+        index = 0
+        title: Optional[str] = None
+        body_start = 0
+        with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            pos = 0
+            while pos < size:
+                newline = mm.find(b"\n", pos)
+                line_end = size if newline == -1 else newline + 1
+                heading = self._match_heading(mm, pos, line_end, encoding)
+                if heading is not None:
+                    chapter = self._make_chapter(path, encoding, index, title, body_start, pos, mm)
+                    if chapter:
+                        yield chapter
+                        index += 1
+                    title, body_start = heading, line_end
+                pos = line_end
+
+            chapter = self._make_chapter(path, encoding, index, title, body_start, size, mm)
+            if chapter:
+                yield chapter
+
+    def _match_heading(self, mm: mmap.mmap, start: int, end: int, encoding: str) -> Optional[str]:
+        if end - start > self.max_heading_length * 4:
+            return None
+        text = mm[start:end].decode(encoding, errors="replace").strip()
+        if not text or len(text) > self.max_heading_length:
+            return None
+        for pattern in self.patterns:
+            if pattern.match(text):
+                return text
+        return None
+
+    def _make_chapter(
+        self,
+        path: Path,
+        encoding: str,
+        index: int,
+        title: Optional[str],
+        start: int,
+        end: int,
+        mm: mmap.mmap
+    ) -> Optional[RawChapter]:
+        # O front matter só vira capítulo se tiver algum texto.
+        if title is None and not _NON_BLANK.search(mm, start, end):
+            return None
+        logger.debug("Capítulo %d detectado: %r (bytes %d-%d)", index, title, start, end)
+        return RawChapter(
+            path=path,
+            encoding=encoding,
+            index=index,
+            title=title,
+            start=start,
+            end=end,
+            read_size=self.loader.read_size
+        )
@@ -1,38 +1,177 @@
+import codecs
 import chardet
 import logging
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 from core.interfaces.input import ITextLoader
 from core.models.line import Line
 
 logger = logging.getLogger(__name__)
 
+# Caracteres tratados como quebra de linha por str.splitlines().
+_LINE_BREAKS = frozenset("\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029")
+
+# Última opção para uma linha que nem a codificação do arquivo nem o chardet decodificam.
+_FALLBACK_ENCODING = "cp1252"
+
 
 class FileTextLoader(ITextLoader):
     """
     Adapter que lê arquivos .txt locais, detecta codificação e retorna linhas numeradas.
+
+    A codificação é detectada sobre os primeiros `sniff_bytes` bytes (UTF-8,
+    senão chardet) e o arquivo é decodificado incrementalmente, em blocos de
+    `read_size` bytes; linhas inválidas no restante do arquivo têm a
+    codificação detectada de novo (ver decode_lines).
+    `iter_lines` produz as Lines sem carregar o arquivo inteiro na memória.
     """
 
+    def __init__(self, *, sniff_bytes: int = 64 * 1024, read_size: int = 1024 * 1024):
+        self.sniff_bytes = sniff_bytes
+        self.read_size = read_size
+
     def load(self, file_path: str) -> List[Line]:
+        lines = list(self.iter_lines(file_path))
+        logger.debug("Total de linhas válidas carregadas: %d", len(lines))
+        return lines
+
+    def iter_lines(self, file_path: str) -> Iterator[Line]:
         path = Path(file_path)
-        raw = path.read_bytes()
-        logger.debug("Arquivo lido: %s (%d bytes)", path.name, len(raw))
+        encoding = self.detect_encoding(path)
+        with path.open("rb") as f:
+            yield from decode_lines(iter(lambda: f.read(self.read_size), b""), encoding)
 
+    def detect_encoding(self, path: Path) -> str:
+        """
+        Detecta a codificação a partir de um prefixo limitado do arquivo.
+        """
+        with path.open("rb") as f:
+            prefix = f.read(self.sniff_bytes)
+        logger.debug("Prefixo lido para detecção: %s (%d bytes)", path.name, len(prefix))
+
+        if prefix.startswith(codecs.BOM_UTF8):
+            return "utf-8-sig"
         try:
-            text = raw.decode("utf-8")
+            # final=False: o prefixo pode terminar no meio de um caractere multibyte.
+            codecs.getincrementaldecoder("utf-8")().decode(prefix, final=False)
             logger.info("Arquivo '%s' decodificado com UTF-8 com sucesso", path.name)
+            return "utf-8"
         except UnicodeDecodeError:
-            detection = chardet.detect(raw)
-            encoding = detection.get("encoding") or "utf-8"
-            confidence = detection.get("confidence", 0.0)
-            logger.warning("UTF-8 falhou para '%s', detectado encoding '%s' (confiança %.2f)", path.name, encoding, confidence)
-            text = raw.decode(encoding, errors="replace")
-
-        lines: List[Line] = []
-        for idx, line in enumerate(text.splitlines()):
-            if line.strip():
-                lines.append(Line(original_text=line, line_number=idx))
-        
-        logger.debug("Total de linhas válidas carregadas: %d", len(lines))
-        return lines
+            pass
+
+        detection = chardet.detect(prefix)
+        encoding = detection.get("encoding") or "utf-8"
+        confidence = detection.get("confidence", 0.0)
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            encoding = "utf-8"
+        logger.warning("UTF-8 falhou para '%s', detectado encoding '%s' (confiança %.2f)", path.name, encoding, confidence)
+        return encoding
+
+
+def decode_lines(chunks: Iterable[bytes], encoding: str) -> Iterator[Line]:
+    """
+    Decodifica incrementalmente blocos de bytes e produz as Lines não vazias,
+    numeradas a partir de 0 como em `str.splitlines()` sobre o texto inteiro.
+
+    A decodificação é estrita: uma linha inválida em `encoding` (ex: um
+    trecho em cp1252 num arquivo UTF-8, depois do prefixo usado na detecção)
+    tem a codificação detectada de novo só para ela, com um aviso indicando
+    o número da linha.
+    """
+    idx = 0
+    pending = ""
+    for text, fallback in _decode_pieces(chunks, encoding):
+        if fallback:
+            logger.warning("Linha %d inválida em %s; decodificada como %s", idx, encoding, fallback)
+        parts = (pending + text).splitlines(keepends=True)
+        # A última parte pode estar incompleta (ou ser um '\r' seguido de '\n' no próximo bloco).
+        pending = parts.pop() if parts and (parts[-1][-1] not in _LINE_BREAKS or parts[-1][-1] == "\r") else ""
+        for part in parts:
+            line = _new_line(part, idx)
+            if line:
+                yield line
+            idx += 1
+
+    for part in pending.splitlines(keepends=True):
+        line = _new_line(part, idx)
+        if line:
+            yield line
+        idx += 1
+
+
+def _decode_pieces(chunks: Iterable[bytes], encoding: str) -> Iterator[Tuple[str, Optional[str]]]:
+    """
+    Produz (texto, codificação de fallback ou None) em pedaços que terminam
+    em quebra de linha. Em codificações compatíveis com ASCII, '\n' e '\r'
+    nunca fazem parte de um caractere multibyte, então cada pedaço pode ser
+    decodificado sozinho e, se falhar, linha a linha.
+    """
+    strip_bom = codecs.lookup(encoding).name == "utf-8-sig"
+    if strip_bom:
+        encoding = "utf-8"
+    if not _ascii_compatible(encoding):
+        # UTF-16/32: sem corte seguro por bytes; bytes inválidos são substituídos.
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        for raw in chunks:
+            yield decoder.decode(raw), None
+        yield decoder.decode(b"", final=True), None
+        return
+
+    buffer = b""
+    for raw in chunks:
+        buffer += raw
+        cut = max(buffer.rfind(b"\n"), buffer.rfind(b"\r")) + 1
+        if not cut:
+            continue
+        complete, buffer = buffer[:cut], buffer[cut:]
+        if strip_bom:
+            complete, strip_bom = _strip_bom(complete), False
+        yield from _decode_strict(complete, encoding)
+    if buffer:
+        yield from _decode_strict(_strip_bom(buffer) if strip_bom else buffer, encoding)
+
+
+def _decode_strict(data: bytes, encoding: str) -> Iterator[Tuple[str, Optional[str]]]:
+    try:
+        yield data.decode(encoding), None
+        return
+    except UnicodeDecodeError:
+        pass
+    for raw_line in data.splitlines(keepends=True):
+        try:
+            yield raw_line.decode(encoding), None
+        except UnicodeDecodeError:
+            fallback = _detect_line_encoding(raw_line)
+            yield raw_line.decode(fallback, errors="replace"), fallback
+
+
+def _detect_line_encoding(raw_line: bytes) -> str:
+    encoding = chardet.detect(raw_line).get("encoding")
+    try:
+        if encoding:
+            raw_line.decode(encoding)
+            return encoding
+    except (LookupError, UnicodeDecodeError):
+        pass
+    return _FALLBACK_ENCODING
+
+
+def _ascii_compatible(encoding: str) -> bool:
+    try:
+        return "\n\r".encode(encoding) == b"\n\r"
+    except (LookupError, UnicodeEncodeError):
+        return False
+
+
+def _strip_bom(data: bytes) -> bytes:
+    return data[len(codecs.BOM_UTF8):] if data.startswith(codecs.BOM_UTF8) else data
+
+
+def _new_line(part: str, idx: int) -> Optional[Line]:
+    text = part.splitlines()[0] if part else part
+    if text.strip():
+        return Line(original_text=text, line_number=idx)
+    return None
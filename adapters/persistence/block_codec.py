@@ -0,0 +1,73 @@
+import gzip
+import json
+from typing import Any, Dict
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Cabeçalho dos arquivos de bloco no formato compacto:
+# MAGIC (4 bytes) + versão do formato (1 byte) + id do codec (1 byte).
+MAGIC = b"BLKC"
+FORMAT_VERSION = 1
+HEADER_SIZE = len(MAGIC) + 2
+
+# Codecs de compressão do corpo (JSON minificado, UTF-8).
+CODEC_IDS: Dict[str, int] = {"json": 0, "gzip": 1, "zstd": 2}
+_CODEC_NAMES = {code: name for name, code in CODEC_IDS.items()}
+
+
+def check_codec(codec: str) -> None:
+    if codec not in CODEC_IDS:
+        raise ValueError(f"Codec de bloco desconhecido: {codec} (use {', '.join(CODEC_IDS)})")
+    if codec == "zstd" and zstandard is None:
+        raise ValueError("Codec 'zstd' requer o pacote zstandard (pip install zstandard)")
+
+
+def encode_block(payload: Any, codec: str = "gzip") -> bytes:
+    """
+    Serializa um bloco em JSON minificado, comprimido com `codec`,
+    precedido do cabeçalho com a versão do formato.
+    """
+    check_codec(codec)
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if codec == "gzip":
+        # mtime fixo: o mesmo bloco gera sempre os mesmos bytes.
+        body = gzip.compress(body, compresslevel=6, mtime=0)
+    elif codec == "zstd":
+        body = zstandard.ZstdCompressor(level=3).compress(body)
+    return MAGIC + bytes((FORMAT_VERSION, CODEC_IDS[codec])) + body
+
+
+def decode_block(raw: bytes) -> Any:
+    """
+    Lê um bloco no formato compacto ou, sem o cabeçalho, no formato
+    antigo (JSON em texto, indentado ou não).
+
+    Lança ValueError para versões/codecs desconhecidos ou conteúdo corrompido
+    (json.JSONDecodeError é subclasse de ValueError).
+    """
+    if not raw.startswith(MAGIC):
+        return json.loads(raw.decode("utf-8"))
+
+    if len(raw) < HEADER_SIZE:
+        raise ValueError("Cabeçalho de bloco truncado")
+    version, codec_id = raw[len(MAGIC)], raw[len(MAGIC) + 1]
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Versão de formato de bloco não suportada: {version}")
+    codec = _CODEC_NAMES.get(codec_id)
+    if codec is None:
+        raise ValueError(f"Codec de bloco desconhecido: {codec_id}")
+
+    check_codec(codec)
+
+    body = raw[HEADER_SIZE:]
+    try:
+        if codec == "gzip":
+            body = gzip.decompress(body)
+        elif codec == "zstd":
+            body = zstandard.ZstdDecompressor().decompress(body)
+    except Exception as e:  # gzip: OSError/EOFError; zstd: ZstdError
+        raise ValueError(f"Bloco comprimido corrompido: {e}") from e
+    return json.loads(body.decode("utf-8"))
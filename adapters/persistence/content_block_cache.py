@@ -0,0 +1,71 @@
+import logging
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+from adapters.persistence.block_codec import check_codec, decode_block, encode_block
+from core.interfaces.repository import IBlockCache
+from core.utils.file_utils import atomic_write_bytes
+
+logger = logging.getLogger(__name__)
+
+
+class ContentAddressedBlockCache(IBlockCache):
+    """
+    Persiste cada chunk de resposta LLM pelo fingerprint da requisição
+    (mensagens renderizadas + modelo + parâmetros) em
+    data/store/blocks/content/{fp[:2]}/{fp}.blk
+
+    Como a chave ignora work_id/chapter_id/block_index, blocos idênticos
+    são reaproveitados entre capítulos, obras e re-chunkings, e qualquer
+    mudança no texto, prompt ou modelo gera uma chave nova.
+
+    O formato em disco é o mesmo do FileBlockCache (ver block_codec);
+    arquivos {fp}.json antigos continuam sendo lidos.
+    """
+
+    keyed_by_content = True
+
+    def __init__(self, store_dir: Path, *, codec: str = "gzip"):
+        check_codec(codec)
+        self.store_dir = store_dir / "blocks" / "content"
+        self.codec = codec
+
+    def _path_for(self, fingerprint: str, suffix: str = ".blk") -> Path:
+        return self.store_dir / fingerprint[:2] / f"{fingerprint}{suffix}"
+
+    def load_block(
+        self,
+        work_id: str,
+        chapter_id: str,
+        block_index: int,
+        *,
+        fingerprint: Optional[str] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        if not fingerprint:
+            return None
+        p = self._path_for(fingerprint)
+        if not p.exists():
+            p = self._path_for(fingerprint, ".json")
+            if not p.exists():
+                return None
+        try:
+            return decode_block(p.read_bytes())
+        except ValueError:
+            logger.warning("Bloco corrompido em %s; será reprocessado", p)
+            return None
+
+    def save_block(
+        self,
+        work_id: str,
+        chapter_id: str,
+        block_index: int,
+        data: List[Dict[str, Any]],
+        *,
+        fingerprint: Optional[str] = None
+    ) -> None:
+        if not fingerprint:
+            logger.warning("Bloco %d de %s/%s sem fingerprint; não será cacheado", block_index, work_id, chapter_id)
+            return
+        p = self._path_for(fingerprint)
+        atomic_write_bytes(p, encode_block(data, self.codec))
+        p.with_suffix(".json").unlink(missing_ok=True)
@@ -1,48 +1,82 @@
-import json
+import logging
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
+from adapters.persistence.block_codec import check_codec, decode_block, encode_block
 from core.interfaces.repository import IBlockCache
+from core.utils.file_utils import atomic_write_bytes
+
+logger = logging.getLogger(__name__)
 
 
 class FileBlockCache(IBlockCache):
     """
     Persiste cada chunk de resposta LLM em
-    data/store/{work_id}/blocks/{chapter_id}/block_{i}.json
+    data/store/blocks/{work_id}/{chapter_id}/block_{i}.blk
+
+    O arquivo guarda {"fingerprint": ..., "segments": [...]} em JSON
+    minificado e comprimido (`codec`: gzip, zstd ou json sem compressão),
+    com cabeçalho de versão (ver block_codec). Blocos cujo fingerprint não
+    confere com o da leitura são ignorados (obsoletos).
+
+    Arquivos antigos block_{i}.json continuam sendo lidos quando não há
+    .blk. Os que guardam apenas a lista de segmentos (sem fingerprint) não
+    servem para leituras com fingerprint, como as do LLMPipelineProcessor:
+    esses blocos são reprocessados uma vez e regravados no formato novo.
     """
 
-    def __init__(self, store_dir: Path):
+    def __init__(self, store_dir: Path, *, codec: str = "gzip"):
+        check_codec(codec)
         self.store_dir = store_dir / "blocks"
+        self.codec = codec
 
     def _path_for(
         self,
         work_id: str,
         chapter_id: str,
-        block_index: int
+        block_index: int,
+        suffix: str = ".blk"
     ) -> Path:
-        return self.store_dir / work_id / chapter_id / f"block_{block_index}.json"
+        return self.store_dir / work_id / chapter_id / f"block_{block_index}{suffix}"
 
     def load_block(
         self,
         work_id: str,
         chapter_id: str,
-        block_index: int
+        block_index: int,
+        *,
+        fingerprint: Optional[str] = None
     ) -> Optional[List[Dict[str, Any]]]:
         p = self._path_for(work_id, chapter_id, block_index)
         if not p.exists():
-            return None
+            p = self._path_for(work_id, chapter_id, block_index, ".json")
+            if not p.exists():
+                return None
         try:
-            return json.loads(p.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
+            data = decode_block(p.read_bytes())
+        except ValueError:
+            logger.warning("Bloco corrompido em %s; será reprocessado", p)
+            return None
+
+        if isinstance(data, list):
+            stored, segments = None, data
+        else:
+            stored, segments = data.get("fingerprint"), data.get("segments")
+        if segments is None or self.is_stale(stored, fingerprint):
             return None
+        return segments
 
     def save_block(
         self,
         work_id: str,
         chapter_id: str,
         block_index: int,
-        data: List[Dict[str, Any]]
+        data: List[Dict[str, Any]],
+        *,
+        fingerprint: Optional[str] = None
     ) -> None:
         p = self._path_for(work_id, chapter_id, block_index)
-        p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        payload = {"fingerprint": fingerprint, "segments": data}
+        atomic_write_bytes(p, encode_block(payload, self.codec))
+        # O .blk passa a valer; o .json antigo, se houver, só ocuparia espaço.
+        p.with_suffix(".json").unlink(missing_ok=True)
@@ -1,33 +1,96 @@
+import os
 import json
+import logging
 from pathlib import Path
-from typing import Dict, Any
+from typing import Callable, Dict, Any
 
 from core.interfaces.repository import IManifestAdapter
+from core.utils.file_utils import atomic_write_text, file_lock
+
+logger = logging.getLogger(__name__)
 
 
 class FileManifestAdapter(IManifestAdapter):
     """
     Persiste o manifest em data/store/{work_id}/manifest.json
+
+    As gravações são atômicas (arquivo temporário + fsync + rename) e
+    `save`, `save_chapter` e `update` seguram o mesmo lock exclusivo
+    (manifest.json.lock); em `update` ele cobre todo o ciclo
+    ler-modificar-gravar, para uso por vários processos ao mesmo tempo.
+
+    `save_chapter` não reescreve o manifest: acrescenta a entrada do
+    capítulo a um journal (manifest.journal.jsonl, uma linha por entrada),
+    aplicado por cima do manifest.json em `load`. A cada `compact_every`
+    entradas, o journal é incorporado ao manifest.json e removido.
     """
 
-    def __init__(self, store_dir: Path):
+    def __init__(self, store_dir: Path, *, compact_every: int = 256):
+        if compact_every < 1:
+            raise ValueError("compact_every deve ser maior ou igual a 1")
         self.store_dir = store_dir
+        self.compact_every = compact_every
 
     def _path_for(self, work_id: str) -> Path:
         return self.store_dir / work_id / "manifest.json"
 
+    def _journal_for(self, work_id: str) -> Path:
+        return self.store_dir / work_id / "manifest.journal.jsonl"
+
     def load(self, work_id: str) -> Dict[str, Any]:
+        chapters: Dict[str, Any] = {}
         p = self._path_for(work_id)
-        if not p.exists():
-            return {"chapters": {}}
-        raw = p.read_text(encoding="utf-8")
-        try:
-            data = json.loads(raw)
-        except json.JSONDecodeError:
-            return {"chapters": {}}
-        return {"chapters": data.get("chapters", {})}
+        if p.exists():
+            raw = p.read_text(encoding="utf-8")
+            try:
+                chapters = json.loads(raw).get("chapters", {})
+            except json.JSONDecodeError:
+                logger.warning("Manifest corrompido em %s; tratando como vazio", p)
+
+        journal = self._journal_for(work_id)
+        if journal.exists():
+            with journal.open(encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        chapters[record["chapter_id"]] = record["entry"]
+                    except (json.JSONDecodeError, KeyError, TypeError):
+                        # Linha truncada por uma interrupção no meio da gravação.
+                        logger.warning("Entrada inválida no journal %s; ignorada", journal)
+        return {"chapters": chapters}
 
     def save(self, work_id: str, manifest: Dict[str, Any]) -> None:
-        p = self._path_for(work_id)
-        p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+        with file_lock(self._path_for(work_id)):
+            self._save_unlocked(work_id, manifest)
+
+    def _save_unlocked(self, work_id: str, manifest: Dict[str, Any]) -> None:
+        # Chamador deve segurar file_lock (o lock não é reentrante).
+        atomic_write_text(self._path_for(work_id), json.dumps(manifest, ensure_ascii=False, indent=2))
+        # O manifest gravado já contém tudo o que estava no journal.
+        self._journal_for(work_id).unlink(missing_ok=True)
+
+    def update(self, work_id: str, mutator: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+        with file_lock(self._path_for(work_id)):
+            manifest = self.load(work_id)
+            mutator(manifest)
+            self._save_unlocked(work_id, manifest)
+            return manifest
+
+    def save_chapter(self, work_id: str, chapter_id: str, entry: Any) -> None:
+        journal = self._journal_for(work_id)
+        record = json.dumps({"chapter_id": chapter_id, "entry": entry}, ensure_ascii=False).encode("utf-8")
+        with file_lock(self._path_for(work_id)):
+            journal.parent.mkdir(parents=True, exist_ok=True)
+            with journal.open("a+b") as f:
+                f.seek(0)
+                existing = f.read()
+                # Uma linha truncada não pode engolir a entrada nova.
+                if existing and not existing.endswith(b"\n"):
+                    record = b"\n" + record
+                f.write(record + b"\n")
+                f.flush()
+                os.fsync(f.fileno())
+            pending = existing.count(b"\n") + 1
+            if pending >= self.compact_every:
+                logger.debug("Incorporando %d entrada(s) do journal ao manifest de %s", pending, work_id)
+                self._save_unlocked(work_id, self.load(work_id))
@@ -0,0 +1,45 @@
+import json
+import logging
+from pathlib import Path
+from typing import Callable
+
+from core.interfaces.repository import IScenarioRegistryAdapter
+from core.repositories.scenario_registry import MAX_DESCRIPTION_CHARS, ScenarioRegistry
+from core.utils.file_utils import atomic_write_text, file_lock
+
+logger = logging.getLogger(__name__)
+
+
+class FileScenarioRegistryAdapter(IScenarioRegistryAdapter):
+    """
+    Persiste o registro de cenários em data/store/{work_id}/scenarios.json,
+    com gravação atômica e lock em `update`, como o FileManifestAdapter.
+    """
+
+    def __init__(self, store_dir: Path, *, max_description_chars: int = MAX_DESCRIPTION_CHARS):
+        self.store_dir = store_dir
+        self.max_description_chars = max_description_chars
+
+    def _path_for(self, work_id: str) -> Path:
+        return self.store_dir / work_id / "scenarios.json"
+
+    def load(self, work_id: str) -> ScenarioRegistry:
+        p = self._path_for(work_id)
+        if not p.exists():
+            return self._empty()
+        try:
+            data = json.loads(p.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            logger.warning("Registro de cenários corrompido em %s; tratando como vazio", p)
+            return self._empty()
+        return ScenarioRegistry.from_dict(data, max_description_chars=self.max_description_chars)
+
+    def _empty(self) -> ScenarioRegistry:
+        return ScenarioRegistry(max_description_chars=self.max_description_chars)
+
+    def save(self, work_id: str, registry: ScenarioRegistry) -> None:
+        atomic_write_text(self._path_for(work_id), json.dumps(registry.to_dict(), ensure_ascii=False, indent=2))
+
+    def update(self, work_id: str, mutator: Callable[[ScenarioRegistry], None]) -> ScenarioRegistry:
+        with file_lock(self._path_for(work_id)):
+            return super().update(work_id, mutator)
@@ -0,0 +1,125 @@
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from core.interfaces.repository import IBlockCache
+
+logger = logging.getLogger(__name__)
+
+# Entrada em memória: (fingerprint gravado, segmentos).
+_Entry = Tuple[Optional[str], List[Dict[str, Any]]]
+
+
+class LRUBlockCache(IBlockCache):
+    """
+    Camada em memória, limitada a `max_entries` blocos, na frente de outro
+    IBlockCache (arquivo, SQLite, content-addressed...).
+
+    - Leituras repetidas do mesmo bloco no mesmo processo não voltam ao
+      disco; a entrada menos usada recentemente é descartada ao estourar
+      o limite.
+    - Gravações são write-through: vão primeiro para o cache interno e só
+      então para a memória (uma falha ao gravar não deixa o bloco apenas
+      em memória).
+    - O fingerprint gravado é guardado junto do bloco e comparado com
+      `is_stale`, como nos caches indexados por posição.
+
+    Os segmentos devolvidos são cópias rasas (lista e dicts novos), para
+    que o chamador não altere a entrada em memória. É seguro entre threads;
+    com pool de processos, cada processo tem a sua própria camada.
+    """
+
+    def __init__(self, inner: IBlockCache, *, max_entries: int = 256):
+        if max_entries < 1:
+            raise ValueError("max_entries deve ser maior ou igual a 1")
+        self.inner = inner
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def keyed_by_content(self) -> bool:  # type: ignore[override]
+        return self.inner.keyed_by_content
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @contextmanager
+    def batch(self) -> Iterator["LRUBlockCache"]:
+        with self.inner.batch():
+            yield self
+
+    def _key(
+        self,
+        work_id: str,
+        chapter_id: str,
+        block_index: int,
+        fingerprint: Optional[str]
+    ) -> Optional[Hashable]:
+        if self.keyed_by_content:
+            return fingerprint or None
+        return (work_id, chapter_id, block_index)
+
+    def load_block(
+        self,
+        work_id: str,
+        chapter_id: str,
+        block_index: int,
+        *,
+        fingerprint: Optional[str] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        key = self._key(work_id, chapter_id, block_index, fingerprint)
+        if key is not None:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and not self.is_stale(entry[0], fingerprint):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return _copy(entry[1])
+                self.misses += 1
+
+        segments = self.inner.load_block(work_id, chapter_id, block_index, fingerprint=fingerprint)
+        if segments is not None and key is not None:
+            # Sem fingerprint na leitura, não sabemos com qual o bloco foi gravado.
+            self._put(key, fingerprint, segments)
+            return _copy(segments)
+        return segments
+
+    def save_block(
+        self,
+        work_id: str,
+        chapter_id: str,
+        block_index: int,
+        data: List[Dict[str, Any]],
+        *,
+        fingerprint: Optional[str] = None
+    ) -> None:
+        self.inner.save_block(work_id, chapter_id, block_index, data, fingerprint=fingerprint)
+        key = self._key(work_id, chapter_id, block_index, fingerprint)
+        if key is not None:
+            self._put(key, fingerprint, _copy(data))
+
+    def _put(self, key: Hashable, fingerprint: Optional[str], segments: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            self._entries[key] = (fingerprint, segments)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                logger.debug("Bloco %s descartado do cache em memória", evicted)
+
+
+def _copy(segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [dict(item) for item in segments]
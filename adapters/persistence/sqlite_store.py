@@ -0,0 +1,260 @@
+import json
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, List, Dict, Any, Optional, Iterator, Iterable, Tuple
+
+from core.interfaces.repository import IBlockCache, IManifestAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteDatabase:
+    """
+    Arquivo SQLite único (ex: data/store/store.sqlite3) compartilhado
+    pelo cache de blocos e pelo manifest.
+
+    - journal_mode=WAL: leitores não bloqueiam o escritor;
+    - busy_timeout: processos concorrentes aguardam o lock em vez de falhar;
+    - uma conexão por thread, pois conexões sqlite3 não são thread-safe.
+    """
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS blocks (
+            work_id     TEXT    NOT NULL,
+            chapter_id  TEXT    NOT NULL,
+            block_index INTEGER NOT NULL,
+            fingerprint TEXT,
+            data        TEXT    NOT NULL,
+            PRIMARY KEY (work_id, chapter_id, block_index)
+        ) WITHOUT ROWID
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS manifest_chapters (
+            work_id    TEXT NOT NULL,
+            chapter_id TEXT NOT NULL,
+            entry      TEXT NOT NULL,
+            PRIMARY KEY (work_id, chapter_id)
+        ) WITHOUT ROWID
+        """,
+    )
+
+    def __init__(self, db_path: Path, timeout: float = 30.0):
+        self.db_path = db_path
+        self.timeout = timeout
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.transaction() as conn:
+            for statement in self.SCHEMA:
+                conn.execute(statement)
+        logger.info("Banco SQLite inicializado em %s", self.db_path)
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # check_same_thread=False só para que `close` (chamado de outra
+            # thread) possa fechá-la; cada conexão segue usada por uma thread.
+            conn = sqlite3.connect(self.db_path, timeout=self.timeout, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={int(self.timeout * 1000)}")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Transação de escrita (BEGIN IMMEDIATE): adquire o lock de escrita
+        no início, evitando deadlocks entre processos que leem e depois escrevem.
+        """
+        conn = self.connection
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def close(self) -> None:
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+
+class SQLiteBlockCache(IBlockCache):
+    """
+    Persiste cada chunk de resposta LLM numa tabela indexada por
+    (work_id, chapter_id, block_index). O fingerprint gravado é comparado
+    na leitura, descartando blocos obsoletos.
+
+    Dentro de `batch()`, as gravações da thread são acumuladas e confirmadas
+    numa única transação ao final, reduzindo fsyncs em capítulos com muitos
+    blocos (o LLMPipelineProcessor sequencial abre um batch por capítulo).
+    O estado do batch é por thread: gravações de outras threads seguem
+    imediatas.
+    """
+
+    def __init__(self, database: SQLiteDatabase):
+        self.db = database
+        self._local = threading.local()
+
+    def _pending(self) -> Dict[Tuple[str, str, int], Tuple[Optional[str], str]]:
+        pending = getattr(self._local, "pending", None)
+        if pending is None:
+            pending = self._local.pending = {}
+        return pending
+
+    def load_block(
+        self,
+        work_id: str,
+        chapter_id: str,
+        block_index: int,
+        *,
+        fingerprint: Optional[str] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        key = (work_id, chapter_id, block_index)
+        row = self._pending().get(key)
+        if row is None:
+            row = self.db.connection.execute(
+                "SELECT fingerprint, data FROM blocks WHERE work_id = ? AND chapter_id = ? AND block_index = ?",
+                key
+            ).fetchone()
+        if row is None or self.is_stale(row[0], fingerprint):
+            return None
+        try:
+            return json.loads(row[1])
+        except json.JSONDecodeError:
+            return None
+
+    def save_block(
+        self,
+        work_id: str,
+        chapter_id: str,
+        block_index: int,
+        data: List[Dict[str, Any]],
+        *,
+        fingerprint: Optional[str] = None
+    ) -> None:
+        key = (work_id, chapter_id, block_index)
+        value = (fingerprint, json.dumps(data, ensure_ascii=False, separators=(",", ":")))
+        if getattr(self._local, "depth", 0):
+            self._pending()[key] = value
+            return
+        self._write([(key, value)])
+
+    def list_block_indexes(self, work_id: str, chapter_id: str) -> List[int]:
+        """
+        Retorna os índices de bloco já persistidos para o capítulo.
+        """
+        rows = self.db.connection.execute(
+            "SELECT block_index FROM blocks WHERE work_id = ? AND chapter_id = ? ORDER BY block_index",
+            (work_id, chapter_id)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    @contextmanager
+    def batch(self) -> Iterator["SQLiteBlockCache"]:
+        """
+        Agrupa as gravações feitas por esta thread no bloco `with` numa
+        única transação. Os blocos pendentes são gravados mesmo se o bloco
+        `with` falhar, pois correspondem a respostas já pagas.
+        """
+        self._local.depth = getattr(self._local, "depth", 0) + 1
+        try:
+            yield self
+        finally:
+            self._local.depth -= 1
+            if not self._local.depth:
+                pending = self._pending()
+                items = list(pending.items())
+                pending.clear()
+                if items:
+                    self._write(items)
+
+    def _write(self, items: Iterable[Tuple[Tuple[str, str, int], Tuple[Optional[str], str]]]) -> None:
+        rows = [(*key, fingerprint, data) for key, (fingerprint, data) in items]
+        with self.db.transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO blocks (work_id, chapter_id, block_index, fingerprint, data) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+        logger.debug("%d bloco(s) gravados no SQLite", len(rows))
+
+
+class SQLiteManifestAdapter(IManifestAdapter):
+    """
+    Persiste o manifest com uma linha por capítulo, indexada por
+    (work_id, chapter_id). `save_chapter` atualiza um único capítulo
+    sem reescrever o manifest inteiro.
+    """
+
+    UPSERT = (
+        "INSERT INTO manifest_chapters (work_id, chapter_id, entry) VALUES (?, ?, ?) "
+        "ON CONFLICT (work_id, chapter_id) DO UPDATE SET entry = excluded.entry"
+    )
+
+    def __init__(self, database: SQLiteDatabase):
+        self.db = database
+
+    def load(self, work_id: str) -> Dict[str, Any]:
+        rows = self.db.connection.execute(
+            "SELECT chapter_id, entry FROM manifest_chapters WHERE work_id = ? ORDER BY chapter_id",
+            (work_id,)
+        ).fetchall()
+        return {"chapters": {chapter_id: json.loads(entry) for chapter_id, entry in rows}}
+
+    def save(self, work_id: str, manifest: Dict[str, Any]) -> None:
+        rows = [
+            (work_id, chapter_id, json.dumps(entry, ensure_ascii=False))
+            for chapter_id, entry in manifest.get("chapters", {}).items()
+        ]
+        with self.db.transaction() as conn:
+            conn.execute("DELETE FROM manifest_chapters WHERE work_id = ?", (work_id,))
+            conn.executemany(
+                "INSERT INTO manifest_chapters (work_id, chapter_id, entry) VALUES (?, ?, ?)",
+                rows
+            )
+
+    def update(self, work_id: str, mutator: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+        """
+        Ler-modificar-gravar dentro de uma única transação BEGIN IMMEDIATE,
+        que já serializa escritores concorrentes. Só as linhas dos capítulos
+        alterados ou removidos por `mutator` são gravadas.
+        """
+        with self.db.transaction() as conn:
+            rows = conn.execute(
+                "SELECT chapter_id, entry FROM manifest_chapters WHERE work_id = ?",
+                (work_id,)
+            ).fetchall()
+            before = dict(rows)
+            manifest = {"chapters": {chapter_id: json.loads(entry) for chapter_id, entry in rows}}
+            mutator(manifest)
+
+            chapters = manifest.get("chapters", {})
+            encoded = {chapter_id: json.dumps(entry, ensure_ascii=False) for chapter_id, entry in chapters.items()}
+            conn.executemany(
+                "DELETE FROM manifest_chapters WHERE work_id = ? AND chapter_id = ?",
+                [(work_id, chapter_id) for chapter_id in before if chapter_id not in encoded]
+            )
+            conn.executemany(
+                self.UPSERT,
+                [(work_id, chapter_id, entry) for chapter_id, entry in encoded.items() if before.get(chapter_id) != entry]
+            )
+        return manifest
+
+    def save_chapter(self, work_id: str, chapter_id: str, entry: Any) -> None:
+        with self.db.transaction() as conn:
+            conn.execute(self.UPSERT, (work_id, chapter_id, json.dumps(entry, ensure_ascii=False)))
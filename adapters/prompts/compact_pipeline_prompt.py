@@ -0,0 +1,145 @@
+from typing import List, Dict, Any, Sequence, Tuple
+
+from adapters.prompts.prompt_prefix import build_prefixed_messages
+from adapters.prompts.response_schemas import COMPACT_PIPELINE_RESPONSE_SCHEMA
+from core.enums import SegmentType, CharacterType, GenderType, EmotionType
+from core.interfaces.llm import IPromptTemplate
+from core.models.line import Line
+from core.models.llm import LLMMessage
+
+# Códigos curtos usados na resposta compacta → valores completos dos enums.
+SEGMENT_TYPE_CODES = {
+    "n": SegmentType.NARRATION.value,
+    "d": SegmentType.DIALOGUE.value,
+    "h": SegmentType.HIGHLIGHT.value,
+}
+CHARACTER_TYPE_CODES = {
+    "n": CharacterType.NARRATOR.value,
+    "p": CharacterType.PROTAGONIST.value,
+    "sm": CharacterType.SUPPORTING_MALE.value,
+    "sf": CharacterType.SUPPORTING_FEMALE.value,
+    "s": CharacterType.SYSTEM.value,
+    "u": CharacterType.UNKNOWN.value,
+}
+GENDER_CODES = {
+    "m": GenderType.MALE.value,
+    "f": GenderType.FEMALE.value,
+    "u": GenderType.UNKNOWN.value,
+}
+EMOTION_CODES = {
+    "n": EmotionType.NEUTRAL.value,
+    "j": EmotionType.JOY.value,
+    "a": EmotionType.ANGER.value,
+    "s": EmotionType.SURPRISE.value,
+    "h": EmotionType.HESITATION.value,
+    "x": EmotionType.SHOUT.value,
+}
+
+# Posições dos campos em cada segmento compacto.
+_FIELDS = ("start", "end", "translated_text", "segment_type", "speaker", "character_type", "gender", "emotion")
+
+
+def _expand(table: Dict[str, str], value: Any) -> Any:
+    # Valores fora da tabela (ex: o enum por extenso) seguem como vieram.
+    return table.get(value, value) if isinstance(value, str) else value
+
+
+def _codes(table: Dict[str, str]) -> str:
+    return ", ".join(f"{code}={value}" for code, value in table.items())
+
+
+class CompactPipelinePrompt(IPromptTemplate):
+    """
+    Variante do PipelinePrompt com resposta compacta: em vez de repetir o
+    texto original e os enums por extenso, a LLM devolve um objeto por linha
+    com os segmentos como arrays posicionais:
+
+        {"segments": [{"l": 1, "s": [[0, 12, "tradução", "d", "Ye Hong", "p", "m", "n"], ...]}]}
+
+    onde [0, 12] é o intervalo (offsets de caractere, fim exclusivo) do
+    segmento no texto original da linha. `parse_segments` reconstrói os
+    segmentos no formato completo a partir do texto das linhas do bloco.
+    """
+
+    response_schema = COMPACT_PIPELINE_RESPONSE_SCHEMA
+
+    SYSTEM_PROMPT = (
+        "Você é um assistente especializado em análise literária, tradução, segmentação de texto, "
+        "classificação de personagens e detecção de emoções.\n\n"
+        "Você receberá um bloco com múltiplas linhas de uma obra literária. "
+        "Cada linha tem um número e um texto original (em outro idioma).\n\n"
+        "Para **cada linha**:\n"
+        "1. Divida o texto original em segmentos consecutivos (narração, fala ou fala enfática).\n"
+        "2. Traduza cada segmento para Português Brasileiro, mantendo o estilo e a naturalidade.\n"
+        "3. Identifique quem fala (\"Narrador\" para narração, \"Sistema\" para falas automáticas), "
+        "o tipo e o gênero do personagem.\n"
+        "4. Identifique a emoção predominante do segmento.\n\n"
+        "**Retorno:** um único JSON válido, sem texto fora dele, no formato:\n"
+        "{\"segments\": [{\"l\": número_da_linha, \"s\": [[início, fim, tradução, tipo, falante, "
+        "tipo_personagem, gênero, emoção], ...]}, ...]}\n\n"
+        "- início/fim: posições (em caracteres, a partir de 0, fim exclusivo) do segmento no texto "
+        "original da linha. NÃO repita o texto original.\n"
+        f"- tipo: {_codes(SEGMENT_TYPE_CODES)}\n"
+        f"- tipo_personagem: {_codes(CHARACTER_TYPE_CODES)}\n"
+        f"- gênero: {_codes(GENDER_CODES)}\n"
+        f"- emoção: {_codes(EMOTION_CODES)}\n\n"
+        "Preserve a ordem das linhas e dos segmentos. Use apenas os códigos listados."
+    )
+
+    def build_messages(self, payload: Dict[str, Any]) -> List[LLMMessage]:
+        return build_prefixed_messages(self.SYSTEM_PROMPT, payload)
+
+    def parse_segments(
+        self,
+        segments_data: List[Dict[str, Any]],
+        lines: Sequence[Line]
+    ) -> List[Dict[str, Any]]:
+        texts = {ln.line_number: ln.original_text for ln in lines}
+        seen = set()
+        segments: List[Dict[str, Any]] = []
+        for item in segments_data:
+            if not isinstance(item, dict) or not isinstance(item.get("s"), list):
+                raise ValueError(f"Linha compacta inválida: {item!r}")
+            line_number = item.get("l")
+            if not isinstance(line_number, int) or line_number not in texts:
+                raise ValueError(f"Linha {line_number!r} não pertence ao bloco")
+            if line_number in seen:
+                raise ValueError(f"Linha {line_number} aparece mais de uma vez na resposta")
+            seen.add(line_number)
+            text = texts[line_number]
+            previous_end = 0
+            for index, values in enumerate(item["s"]):
+                segment, start, end = self._decode(line_number, index, text, values)
+                # Intervalos fora de ordem ou sobrepostos duplicariam trechos do original.
+                if start < previous_end:
+                    raise ValueError(
+                        f"Intervalo [{start}, {end}] da linha {line_number} começa antes do fim "
+                        f"do segmento anterior ({previous_end})"
+                    )
+                previous_end = end
+                segments.append(segment)
+        return segments
+
+    @staticmethod
+    def _decode(line_number: int, index: int, text: str, values: Any) -> Tuple[Dict[str, Any], int, int]:
+        if not isinstance(values, list) or len(values) != len(_FIELDS):
+            raise ValueError(f"Segmento compacto inválido na linha {line_number}: {values!r}")
+        fields = dict(zip(_FIELDS, values))
+        start, end = fields["start"], fields["end"]
+        if not (isinstance(start, int) and isinstance(end, int) and 0 <= start < end <= len(text)):
+            raise ValueError(f"Intervalo [{start}, {end}] inválido para a linha {line_number} ({len(text)} caracteres)")
+        original = text[start:end].strip()
+        if not original:
+            raise ValueError(f"Intervalo [{start}, {end}] da linha {line_number} contém apenas espaços")
+        segment = {
+            "line_number": line_number,
+            "segment_index": index,
+            "original_text": original,
+            "translated_text": fields["translated_text"],
+            "segment_type": _expand(SEGMENT_TYPE_CODES, fields["segment_type"]),
+            "speaker": fields["speaker"],
+            "character_type": _expand(CHARACTER_TYPE_CODES, fields["character_type"]),
+            "gender": _expand(GENDER_CODES, fields["gender"]),
+            "emotion": _expand(EMOTION_CODES, fields["emotion"]),
+        }
+        return segment, start, end
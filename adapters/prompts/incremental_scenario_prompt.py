@@ -0,0 +1,53 @@
+import json
+from typing import List, Dict, Any
+
+from core.enums import LLMRole
+from core.interfaces.llm import IPromptTemplate
+from core.models.llm import LLMMessage
+
+
+class IncrementalScenarioPrompt(IPromptTemplate):
+    """
+    Prompt para extração incremental de cenários ao longo de uma obra:
+    além da narração do capítulo, recebe a lista de locais já registrados
+    (`known_locations`) e pede descrição completa apenas para locais novos.
+    """
+
+    SYSTEM_PROMPT = (
+        "Você é um especialista em análise literária e descrição de cenários narrativos.\n\n"
+        "Receberá trechos de narração de um capítulo de uma obra literária e, possivelmente, "
+        "a lista de locais que já foram descritos em capítulos anteriores.\n\n"
+        "**Instruções:**\n"
+        "1. Identifique os locais e ambientes principais em que a narração se passa.\n"
+        "2. Para um local que **não** está na lista de conhecidos, forneça uma descrição curta "
+        "(2 a 3 frases) com os principais detalhes perceptíveis, estilo e clima do lugar.\n"
+        "3. Para um local que **já está** na lista, use exatamente o nome listado e, em 'text', "
+        "escreva apenas detalhes novos que o capítulo revela; se não houver nada novo, use \"\".\n"
+        "4. (Opcional) Liste os personagens que aparecem em cada local.\n\n"
+        "**Formato de retorno esperado:**\n"
+        "```json\n"
+        "{\n"
+        "  \"scenarios\": [\n"
+        "    {\n"
+        "      \"location\": \"Nome do lugar\",\n"
+        "      \"text\": \"Descrição (local novo) ou detalhes novos (local conhecido)\",\n"
+        "      \"characters\": [\"Ye Hong\"]\n"
+        "    }\n"
+        "  ]\n"
+        "}\n"
+        "```\n\n"
+        "**Observações:**\n"
+        "- Não repita descrições de locais conhecidos.\n"
+        "- Não invente cenários não mencionados ou implícitos no texto."
+    )
+
+    def build_messages(self, payload: Dict[str, Any]) -> List[LLMMessage]:
+        messages = [LLMMessage(role=LLMRole.SYSTEM, content=self.SYSTEM_PROMPT)]
+        known = payload.get("known_locations") or []
+        if known:
+            messages.append(LLMMessage(
+                role=LLMRole.SYSTEM,
+                content="Locais conhecidos: " + json.dumps(known, ensure_ascii=False)
+            ))
+        messages.append(LLMMessage(role=LLMRole.USER, content=payload.get("narration_text", "")))
+        return messages
@@ -1,7 +1,7 @@
-import json
 from typing import List, Dict, Any
 
-from core.enums import LLMRole
+from adapters.prompts.prompt_prefix import build_prefixed_messages
+from adapters.prompts.response_schemas import PIPELINE_RESPONSE_SCHEMA
 from core.interfaces.llm import IPromptTemplate
 from core.models.llm import LLMMessage
 
@@ -11,7 +11,9 @@ class PipelinePrompt(IPromptTemplate):
     Prompt para o pipeline completo: tradução, segmentação,
     classificação de personagens e detecção de emoções.
     """
-    
+
+    response_schema = PIPELINE_RESPONSE_SCHEMA
+
     SYSTEM_PROMPT = (
         "Você é um assistente especializado em análise literária, tradução, segmentação de texto, "
         "classificação de personagens e detecção de emoções.\n\n"
@@ -59,7 +61,8 @@ class PipelinePrompt(IPromptTemplate):
     )
 
     def build_messages(self, payload: Dict[str, Any]) -> List[LLMMessage]:
-        return [
-            LLMMessage(role=LLMRole.SYSTEM, content=self.SYSTEM_PROMPT),
-            LLMMessage(role=LLMRole.USER, content=json.dumps(payload, ensure_ascii=False))
-        ]
+        """
+        Prompt fixo e metadados da obra formam um prefixo estável (ver
+        build_prefixed_messages); as linhas do bloco vão na mensagem final.
+        """
+        return build_prefixed_messages(self.SYSTEM_PROMPT, payload)
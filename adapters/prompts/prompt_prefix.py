@@ -0,0 +1,30 @@
+import json
+from typing import Any, Dict, List
+
+from core.enums import LLMRole
+from core.models.llm import LLMMessage
+
+
+def build_prefixed_messages(system_prompt: str, payload: Any) -> List[LLMMessage]:
+    """
+    Monta as mensagens com um prefixo estável, idêntico byte a byte entre
+    todos os blocos da mesma obra, para aproveitar o cache de prefixo do
+    provedor:
+
+    1. system: o prompt fixo do template;
+    2. system: os metadados da obra (`payload["metadata"]`, se houver),
+       em JSON com chaves ordenadas;
+    3. user: o restante do payload (o bloco variável).
+    """
+    messages = [LLMMessage(role=LLMRole.SYSTEM, content=system_prompt)]
+    body = payload
+    if isinstance(payload, dict) and "metadata" in payload:
+        body = {key: value for key, value in payload.items() if key != "metadata"}
+        if payload["metadata"]:
+            messages.append(LLMMessage(role=LLMRole.SYSTEM, content=metadata_message(payload["metadata"])))
+    messages.append(LLMMessage(role=LLMRole.USER, content=json.dumps(body, ensure_ascii=False, separators=(",", ":"))))
+    return messages
+
+
+def metadata_message(metadata: Dict[str, Any]) -> str:
+    return "Metadados da obra: " + json.dumps(metadata, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
@@ -0,0 +1,60 @@
+from core.enums import SegmentType, CharacterType, GenderType, EmotionType
+
+# JSON Schemas das respostas, enviados à LLM como `response_format` pelos
+# clientes com suporte a structured outputs (ver IPromptTemplate.response_schema).
+# O schema completo é fechado (additionalProperties=false) para o modo estrito;
+# o compacto usa arrays posicionais, que o modo estrito não aceita, e segue
+# como JSON livre.
+
+PIPELINE_RESPONSE_SCHEMA = {
+    "title": "pipeline_segments",
+    "type": "object",
+    "properties": {
+        "segments": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": [
+                    "line_number", "segment_index", "original_text", "translated_text",
+                    "segment_type", "speaker", "character_type", "gender", "emotion"
+                ],
+                "properties": {
+                    "line_number": {"type": "integer"},
+                    "segment_index": {"type": "integer"},
+                    "original_text": {"type": "string"},
+                    "translated_text": {"type": "string"},
+                    "segment_type": {"type": "string", "enum": SegmentType.list()},
+                    "speaker": {"type": "string"},
+                    "character_type": {"type": "string", "enum": CharacterType.list()},
+                    "gender": {"type": "string", "enum": GenderType.list()},
+                    "emotion": {"type": "string", "enum": EmotionType.list()}
+                },
+                "additionalProperties": False
+            }
+        }
+    },
+    "required": ["segments"],
+    "additionalProperties": False
+}
+
+COMPACT_PIPELINE_RESPONSE_SCHEMA = {
+    "title": "compact_pipeline_segments",
+    "type": "object",
+    "properties": {
+        "segments": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["l", "s"],
+                "properties": {
+                    "l": {"type": "integer"},
+                    "s": {
+                        "type": "array",
+                        "items": {"type": "array", "minItems": 8, "maxItems": 8}
+                    }
+                }
+            }
+        }
+    },
+    "required": ["segments"]
+}
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterator, List
 
 from core.models.line import Line
 
@@ -15,3 +15,10 @@ class ITextLoader(ABC):
         Carrega o arquivo em `file_path` e retorna uma lista de Lines
         com `original_text` e `line_number` preenchidos.
         """
+
+    def iter_lines(self, file_path: str) -> Iterator[Line]:
+        """
+        Variante incremental de `load`, que produz as Lines sob demanda.
+        A implementação padrão apenas percorre o resultado de `load`.
+        """
+        yield from self.load(file_path)
@@ -1,5 +1,14 @@
-from .llm_client import ILLMClient
+from .llm_client import ILLMClient, LLMTransientError, LLMPermanentError
+from .async_llm_client import IAsyncLLMClient
 from .prompt_template import IPromptTemplate
-from .block_processor import IBlockProcessor
+from .block_processor import IBlockProcessor, BlockProcessingError
 
-__all__ = ["ILLMClient", "IPromptTemplate", "IBlockProcessor"]
+__all__ = [
+    "ILLMClient",
+    "IAsyncLLMClient",
+    "IPromptTemplate",
+    "IBlockProcessor",
+    "BlockProcessingError",
+    "LLMTransientError",
+    "LLMPermanentError"
+]
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+from core.models.llm import LLMMessage, LLMResponse
+
+
+class IAsyncLLMClient(ABC):
+    """
+    Variante assíncrona de ILLMClient, para executar muitas requisições
+    concorrentes num único event loop sem ocupar uma thread por chamada.
+    """
+
+    @abstractmethod
+    async def achat(
+        self,
+        messages: List[LLMMessage],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        top_p: float = 1.0,
+        frequency_penalty: float = 0.0,
+        presence_penalty: float = 0.0,
+        response_schema: Optional[Dict[str, Any]] = None
+    ) -> LLMResponse:
+        """
+        Envia uma lista de mensagens e retorna um LLMResponse contendo
+        o texto da resposta, uso de tokens e o payload bruto.
+        """
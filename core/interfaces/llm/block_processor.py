@@ -1,10 +1,24 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import Iterable, Iterator, List, Dict, Any
 
 from core.models.line import Line
 from core.models.segment import Segment
 
 
+class BlockProcessingError(RuntimeError):
+    """
+    Lançado quando um ou mais blocos falham durante o processamento.
+    Preserva os segmentos dos blocos concluídos com sucesso, para que
+    o chamador possa aproveitá-los em vez de descartar o capítulo inteiro.
+    """
+
+    def __init__(self, failures: Dict[int, Exception], segments: List[Segment]):
+        self.failures = failures
+        self.segments = segments
+        indexes = ", ".join(str(i) for i in sorted(failures))
+        super().__init__(f"{len(failures)} bloco(s) falharam: [{indexes}]")
+
+
 class IBlockProcessor(ABC):
     """
     Interface para processar blocos de Linhas 
@@ -14,14 +28,38 @@ class IBlockProcessor(ABC):
     @abstractmethod
     def process(
         self,
-        lines: List[Line],
+        lines: Iterable[Line],
         *,
         chunk_size: int = None,
-        metadata: Dict[str, Any] = None
+        metadata: Dict[str, Any] = None,
+        work_id: str = None,
+        chapter_id: str = None
     ) -> List[Segment]:
         """
-        - lines: lista de Line (com line_number e original_text).  
+        - lines: lista (ou iterável) de Line (com line_number e original_text).  
         - chunk_size: quantas lines enviar por requisição (fallback interno se None).  
         - metadata: dados adicionais a injetar no prompt (ex: work_id, chapter_id).  
+        - work_id / chapter_id: identificam o capítulo para cache de blocos (opcional).  
         Retorna lista de Segment completos.
         """
+
+    def iter_process(
+        self,
+        lines: Iterable[Line],
+        *,
+        chunk_size: int = None,
+        metadata: Dict[str, Any] = None,
+        work_id: str = None,
+        chapter_id: str = None
+    ) -> Iterator[Segment]:
+        """
+        Variante incremental de `process`: produz os Segments à medida que
+        ficam prontos. A implementação padrão apenas percorre o resultado de `process`.
+        """
+        yield from self.process(
+            lines,
+            chunk_size=chunk_size,
+            metadata=metadata,
+            work_id=work_id,
+            chapter_id=chapter_id
+        )
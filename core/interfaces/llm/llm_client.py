@@ -1,9 +1,27 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from core.models.llm import LLMMessage, LLMResponse
 
 
+class LLMTransientError(RuntimeError):
+    """
+    Falha temporária ao chamar a LLM (429, 5xx, timeout, conexão perdida).
+    Pode ser repetida; `retry_after` traz a espera sugerida pelo provedor, se houver.
+    """
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class LLMPermanentError(RuntimeError):
+    """
+    Falha definitiva ao chamar a LLM (autenticação, requisição inválida, cota esgotada).
+    Repetir a chamada não resolve.
+    """
+
+
 class ILLMClient(ABC):
     """
     Interface genérica para comunicação via chat com qualquer LLM.
@@ -17,9 +35,38 @@ class ILLMClient(ABC):
         max_tokens: Optional[int] = None,
         top_p: float = 1.0,
         frequency_penalty: float = 0.0,
-        presence_penalty: float = 0.0
+        presence_penalty: float = 0.0,
+        response_schema: Optional[Dict[str, Any]] = None
     ) -> LLMResponse:
         """
         Envia uma lista de mensagens e retorna um LLMResponse contendo
         o texto da resposta, uso de tokens e o payload bruto.
+
+        `response_schema` (JSON Schema) pede ao provedor uma resposta nesse
+        formato, quando houver suporte; clientes sem suporte podem ignorá-lo.
+        """
+
+    def stream_chat(
+        self,
+        messages: List[LLMMessage],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        top_p: float = 1.0,
+        frequency_penalty: float = 0.0,
+        presence_penalty: float = 0.0,
+        response_schema: Optional[Dict[str, Any]] = None
+    ) -> Iterator[str]:
+        """
+        Envia uma lista de mensagens e produz o texto da resposta em pedaços,
+        à medida que é gerado. Clientes sem suporte a streaming herdam esta
+        implementação, que produz a resposta completa de `chat` de uma vez.
         """
+        yield self.chat(
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            top_p=top_p,
+            frequency_penalty=frequency_penalty,
+            presence_penalty=presence_penalty,
+            response_schema=response_schema
+        ).text
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Sequence
 
+from core.models.line import Line
 from core.models.llm import LLMMessage
 
 
@@ -8,8 +9,14 @@ class IPromptTemplate(ABC):
     """
     Template genérico para prompts de LLM: encapsula
     a construção de mensagens 'system' e 'user'.
+
+    `response_schema`, se definido, é o JSON Schema da resposta esperada:
+    o processador o repassa ao cliente (structured outputs) e valida os
+    segmentos recebidos antes de aceitá-los.
     """
 
+    response_schema: Optional[Dict[str, Any]] = None
+
     @abstractmethod
     def build_messages(self, payload: Dict[str, Any]) -> List[LLMMessage]:
         """
@@ -19,4 +26,20 @@ class IPromptTemplate(ABC):
         Exemplo de payload para pipeline:
           {"lines": [{"line_number":1,"text":"..."}, ...], "metadata": {...}}
         """
-    
\ No newline at end of file
+
+    def parse_segments(
+        self,
+        segments_data: List[Dict[str, Any]],
+        lines: Sequence[Line]
+    ) -> List[Dict[str, Any]]:
+        """
+        Converte os itens de 'segments' retornados pela LLM para o formato
+        completo de segmento (line_number, segment_index, original_text,
+        translated_text, segment_type, speaker, character_type, gender,
+        emotion). `lines` são as linhas do bloco enviado.
+
+        O padrão assume que a resposta já vem nesse formato. Templates com
+        formato de resposta próprio sobrescrevem e lançam ValueError quando
+        a resposta não puder ser convertida.
+        """
+        return segments_data
@@ -1,5 +1,6 @@
 # from .character_persistence import ICharacterPersistence
 from .manifest_adapter import IManifestAdapter
 from .block_cache import IBlockCache
+from .scenario_registry_adapter import IScenarioRegistryAdapter
 
-__all__ = ["ICharacterPersistence", "IManifestAdapter", "IBlockCache"]
+__all__ = ["ICharacterPersistence", "IManifestAdapter", "IBlockCache", "IScenarioRegistryAdapter"]
@@ -1,23 +1,47 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from contextlib import contextmanager
+from typing import Iterator, List, Dict, Any, Optional
 
 
 class IBlockCache(ABC):
     """
     Interface para cache de respostas de blocos de LLM,
     de modo que não seja necessário reprocessar o mesmo chunk.
+
+    Cada bloco é identificado pela posição (work_id, chapter_id, block_index)
+    e, opcionalmente, por um `fingerprint` do conteúdo da requisição
+    (mensagens renderizadas, modelo e parâmetros). Implementações com
+    `keyed_by_content = True` usam apenas o fingerprint como chave.
+
+    Nas implementações indexadas por posição, o fingerprint gravado junto
+    do bloco é comparado na leitura: se a requisição mudou (ex: linhas
+    corrigidas), o bloco é considerado obsoleto e `load_block` retorna None.
     """
 
+    keyed_by_content: bool = False
+
+    @staticmethod
+    def is_stale(stored: Optional[str], requested: Optional[str]) -> bool:
+        """
+        Indica se um bloco gravado com o fingerprint `stored` não serve para
+        uma leitura com `requested`. Sem fingerprint na leitura, qualquer bloco
+        serve; com fingerprint, só um bloco gravado com o mesmo valor.
+        """
+        return requested is not None and stored != requested
+
     @abstractmethod
     def load_block(
         self,
         work_id: str,
         chapter_id: str,
-        block_index: int
+        block_index: int,
+        *,
+        fingerprint: Optional[str] = None
     ) -> Optional[List[Dict[str, Any]]]:
         """
         Retorna a lista de dicts (raw segments) para o bloco
-        se existir no cache, ou None caso contrário.
+        se existir no cache, ou None caso contrário. Com `fingerprint`,
+        blocos gravados com outro fingerprint (ou sem nenhum) também retornam None.
         """
 
     @abstractmethod
@@ -26,8 +50,19 @@ class IBlockCache(ABC):
         work_id: str,
         chapter_id: str,
         block_index: int,
-        data: List[Dict[str, Any]]
+        data: List[Dict[str, Any]],
+        *,
+        fingerprint: Optional[str] = None
     ) -> None:
         """
         Persiste a lista de dicts (raw segments) no cache.
         """
+
+    @contextmanager
+    def batch(self) -> Iterator["IBlockCache"]:
+        """
+        Agrupa as gravações feitas dentro do bloco `with` (ex: os blocos de
+        um capítulo), quando a implementação suportar. Por padrão, cada
+        `save_block` é gravado imediatamente.
+        """
+        yield self
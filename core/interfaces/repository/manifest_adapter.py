@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Callable, Dict, Any
 
 
 class IManifestAdapter(ABC):
@@ -21,3 +21,23 @@ class IManifestAdapter(ABC):
         """
         Persiste o manifest para a obra.
         """
+
+    def update(self, work_id: str, mutator: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+        """
+        Carrega o manifest, aplica `mutator` (que o altera in-place) e o grava,
+        retornando o manifest atualizado. Implementações com suporte a lock
+        fazem isso de forma exclusiva, para que workers concorrentes não
+        sobrescrevam as alterações uns dos outros.
+        """
+        manifest = self.load(work_id)
+        mutator(manifest)
+        self.save(work_id, manifest)
+        return manifest
+
+    def save_chapter(self, work_id: str, chapter_id: str, entry: Any) -> None:
+        """
+        Grava (ou substitui) a entrada de um único capítulo. Implementações
+        devem evitar reescrever o manifest inteiro, já que é chamado a cada
+        capítulo concluído; por padrão, recorre a `update`.
+        """
+        self.update(work_id, lambda manifest: manifest.setdefault("chapters", {}).__setitem__(chapter_id, entry))
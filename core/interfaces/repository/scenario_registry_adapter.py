@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from typing import Callable
+
+from core.repositories.scenario_registry import ScenarioRegistry
+
+
+class IScenarioRegistryAdapter(ABC):
+    """
+    Interface para ler e gravar o registro de cenários de uma obra.
+    """
+
+    @abstractmethod
+    def load(self, work_id: str) -> ScenarioRegistry:
+        """
+        Retorna o registro da obra (vazio, se não existir).
+        """
+
+    @abstractmethod
+    def save(self, work_id: str, registry: ScenarioRegistry) -> None:
+        """
+        Persiste o registro da obra.
+        """
+
+    def update(self, work_id: str, mutator: Callable[[ScenarioRegistry], None]) -> ScenarioRegistry:
+        """
+        Carrega o registro, aplica `mutator` e o grava, retornando o registro
+        atualizado. Implementações com suporte a lock fazem isso de forma
+        exclusiva (ver IManifestAdapter.update).
+        """
+        registry = self.load(work_id)
+        mutator(registry)
+        self.save(work_id, registry)
+        return registry
@@ -4,14 +4,16 @@ from typing import List
 
 from core.models.line import Line
 from core.models.scenario import Scenario
+from core.utils.dataclass_utils import build_trusted
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Chapter:
     """
     Cada instância representa um capítulo pertencente a uma obra.
+    Assim como Line e Segment, usa __slots__ para reduzir memória por instância.
     """
     id: str
     work_id: str                    
@@ -56,7 +58,8 @@ class Chapter:
         if not isinstance(line, Line):
             logger.error("Tentando adicionar linha inválida: %s", type(line))
             raise TypeError("line deve ser uma instância de Line")
-        logger.debug("Adicionando linha ao capítulo %s: %s", self.id, line.original_text[:30])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Adicionando linha ao capítulo %s: %s", self.id, line.original_text[:30])
         self.lines.append(line)
 
     def add_scenario(self, scenario: Scenario):
@@ -78,12 +81,19 @@ class Chapter:
         return data
         
     @classmethod
-    def from_dict(cls, data) -> "Chapter":
-        logger.debug("Criando Chapter a partir de dict: %s", data.get("id", "[sem id]"))
-        return cls(
+    def from_dict(cls, data, *, validate: bool = True) -> "Chapter":
+        """
+        Com `validate=False`, monta o capítulo e seus filhos sem __post_init__,
+        evitando revalidar cada linha (ex: capítulos carregados do disco).
+        """
+        fields = dict(
             id=data.get("id"),
             work_id=data.get("work_id"),
             title=data.get("title"),
-            lines=[Line.from_dict(ln) for ln in data.get("lines", [])],
-            scenarios=[Scenario.from_dict(sc) for sc in data.get("scenarios", [])]
+            lines=[Line.from_dict(ln, validate=validate) for ln in data.get("lines", [])],
+            scenarios=[Scenario.from_dict(sc, validate=validate) for sc in data.get("scenarios", [])]
         )
+        if not validate:
+            return build_trusted(cls, **fields)
+        logger.debug("Criando Chapter a partir de dict: %s", data.get("id", "[sem id]"))
+        return cls(**fields)
@@ -4,6 +4,7 @@ from typing import Optional
 
 from core.enums import CharacterType, GenderType
 from core.models.voice_profile import VoiceProfile
+from core.utils.dataclass_utils import build_trusted
 
 logger = logging.getLogger(__name__)
 
@@ -53,11 +54,17 @@ class Character:
         return data
         
     @classmethod
-    def from_dict(cls, data: dict) -> "Character":
-        logger.debug("Criando Character a partir de dict: %s", data.get("name", "[sem nome]"))
-        return cls(
+    def from_dict(cls, data: dict, *, validate: bool = True) -> "Character":
+        """
+        Com `validate=False`, monta a instância sem __post_init__ (dados confiáveis).
+        """
+        fields = dict(
             name=data["name"],
             type=CharacterType.safe(data["type"]),
             gender=GenderType.safe(data["gender"]),
-            voice=VoiceProfile.from_dict(data["voice"]) if data.get("voice") else None
+            voice=VoiceProfile.from_dict(data["voice"], validate=validate) if data.get("voice") else None
         )
+        if not validate:
+            return build_trusted(cls, **fields)
+        logger.debug("Criando Character a partir de dict: %s", data.get("name", "[sem nome]"))
+        return cls(**fields)
@@ -0,0 +1,338 @@
+import logging
+from array import array
+from collections import Counter
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+from core.enums import SegmentType, EmotionType
+from core.models.chapter import Chapter
+from core.models.character import Character
+from core.models.line import Line
+from core.models.scenario import Scenario
+from core.models.segment import Segment
+from core.utils.dataclass_utils import build_trusted
+
+logger = logging.getLogger(__name__)
+
+_SEGMENT_TYPES = list(SegmentType)
+_EMOTIONS = list(EmotionType)
+_SEGMENT_TYPE_CODES = {member: code for code, member in enumerate(_SEGMENT_TYPES)}
+_EMOTION_CODES = {member: code for code, member in enumerate(_EMOTIONS)}
+
+# Código usado nas colunas de códigos para valores ausentes (None).
+MISSING = -1
+
+
+class SegmentRow(NamedTuple):
+    """
+    Visão somente-leitura de um segmento armazenado em ColumnarChapter.
+    """
+    line_number: int
+    segment_index: int
+    text: str
+    translated_text: Optional[str]
+    segment_type: SegmentType
+    emotion: Optional[EmotionType]
+    speaker: Optional[str]
+    character: Optional[str]
+
+
+class _TextColumn:
+    """
+    Coluna de textos opcionais sobre um buffer compartilhado:
+    o valor i é buffer[start[i]:end[i]], ou None se start[i] == MISSING.
+    """
+
+    def __init__(self):
+        self.start = array("q")
+        self.end = array("q")
+
+    def append(self, parts: List[str], size: List[int], value: Optional[str]) -> None:
+        if value is None:
+            self.start.append(MISSING)
+            self.end.append(MISSING)
+            return
+        self.start.append(size[0])
+        size[0] += len(value)
+        self.end.append(size[0])
+        parts.append(value)
+
+    def get(self, buffer: str, index: int) -> Optional[str]:
+        start = self.start[index]
+        return None if start == MISSING else buffer[start:self.end[index]]
+
+
+class ColumnarChapter:
+    """
+    Representação colunar (somente-leitura) de um capítulo: em vez de um
+    objeto por Line/Segment, guarda arrays paralelos (`array` da stdlib)
+    e todos os textos num único buffer, referenciados por offsets.
+
+    Os enums são codificados pela posição do membro (SegmentType/EmotionType);
+    falantes e personagens, por índice nas tabelas `speakers`/`characters`.
+    `MISSING` (-1) representa None.
+
+    Serve para varreduras de análise (distribuição de falantes, histograma
+    de emoções, linhas por personagem) sem inflar o grafo de objetos;
+    `to_chapter()` reconstrói o Chapter completo quando necessário.
+    """
+
+    def __init__(self, id: str, work_id: str, title: str):
+        self.id = id
+        self.work_id = work_id
+        self.title = title
+        self.scenarios: List[Scenario] = []
+        self.speakers: List[str] = []
+        self.characters: List[Character] = []
+        self._text = ""
+
+        # Linhas
+        self._line_number = array("q")
+        self._line_text = _TextColumn()
+        self._line_translated = _TextColumn()
+        self._line_segments = array("q", [0])  # offsets de segmentos por linha (len = linhas + 1)
+
+        # Segmentos
+        self._seg_line_number = array("q")
+        self._seg_index = array("l")
+        self._seg_type = array("b")
+        self._seg_emotion = array("b")
+        self._seg_speaker = array("l")
+        self._seg_character = array("l")
+        self._seg_text = _TextColumn()
+        self._seg_translated = _TextColumn()
+
+    # ------------------------------------------------------------------
+    # Construção
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_chapter(cls, chapter: Chapter) -> "ColumnarChapter":
+        builder = _Builder(cls(chapter.id, chapter.work_id, chapter.title))
+        for line in chapter.lines:
+            builder.add_line(line.line_number, line.original_text, line.translated_text)
+            for seg in line.segments:
+                builder.add_segment(
+                    seg.line_number, seg.segment_index, seg.text, seg.translated_text,
+                    seg.segment_type, seg.emotion, seg.speaker_hint,
+                    seg.character.name if seg.character else None,
+                    lambda seg=seg: seg.character
+                )
+        builder.columns.scenarios = list(chapter.scenarios)
+        return builder.finish()
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ColumnarChapter":
+        """
+        Monta as colunas direto do dict de `Chapter.to_dict()` (ex: JSON em disco),
+        sem criar Line/Segment intermediários.
+        """
+        builder = _Builder(cls(data.get("id"), data.get("work_id"), data.get("title")))
+        for line in data.get("lines", []):
+            builder.add_line(line.get("line_number", -1), line["original_text"], line.get("translated_text"))
+            for seg in line.get("segments", []):
+                character = seg.get("character")
+                builder.add_segment(
+                    seg["line_number"],
+                    seg["segment_index"],
+                    seg.get("text", seg.get("original_text", "")),
+                    seg.get("translated_text"),
+                    SegmentType.safe(seg["segment_type"]),
+                    EmotionType.safe(seg["emotion"]) if seg.get("emotion") else None,
+                    seg.get("speaker_hint", seg.get("speaker")),
+                    character["name"] if character else None,
+                    lambda character=character: Character.from_dict(character, validate=False)
+                )
+        builder.columns.scenarios = [
+            Scenario.from_dict(sc, validate=False) for sc in data.get("scenarios", [])
+        ]
+        return builder.finish()
+
+    def to_chapter(self) -> Chapter:
+        """
+        Reconstrói o Chapter (com Lines e Segments) a partir das colunas.
+        Os objetos Character são compartilhados entre os segmentos.
+        """
+        lines: List[Line] = []
+        for row in range(self.line_count):
+            segments = [self._build_segment(i) for i in self._segment_range(row)]
+            lines.append(build_trusted(
+                Line,
+                original_text=self._line_text.get(self._text, row),
+                translated_text=self._line_translated.get(self._text, row),
+                segments=segments,
+                line_number=self._line_number[row]
+            ))
+        return build_trusted(
+            Chapter,
+            id=self.id,
+            work_id=self.work_id,
+            title=self.title,
+            lines=lines,
+            scenarios=list(self.scenarios)
+        )
+
+    def _build_segment(self, i: int) -> Segment:
+        row = self.row(i)
+        character = self._seg_character[i]
+        return build_trusted(
+            Segment,
+            segment_index=row.segment_index,
+            line_number=row.line_number,
+            text=row.text,
+            translated_text=row.translated_text,
+            segment_type=row.segment_type,
+            speaker_hint=row.speaker,
+            character=None if character == MISSING else self.characters[character],
+            emotion=row.emotion
+        )
+
+    # ------------------------------------------------------------------
+    # Visões
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._seg_index)
+
+    @property
+    def line_count(self) -> int:
+        return len(self._line_number)
+
+    def column(self, name: str) -> memoryview:
+        """
+        Retorna uma coluna de códigos como memoryview somente-leitura:
+        line_number, segment_index, segment_type, emotion, speaker, character.
+        """
+        columns = {
+            "line_number": self._seg_line_number,
+            "segment_index": self._seg_index,
+            "segment_type": self._seg_type,
+            "emotion": self._seg_emotion,
+            "speaker": self._seg_speaker,
+            "character": self._seg_character,
+        }
+        if name not in columns:
+            raise KeyError(f"Coluna desconhecida: {name}")
+        return memoryview(columns[name]).toreadonly()
+
+    def row(self, i: int) -> SegmentRow:
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        emotion = self._seg_emotion[i]
+        speaker = self._seg_speaker[i]
+        character = self._seg_character[i]
+        return SegmentRow(
+            line_number=self._seg_line_number[i],
+            segment_index=self._seg_index[i],
+            text=self._seg_text.get(self._text, i),
+            translated_text=self._seg_translated.get(self._text, i),
+            segment_type=_SEGMENT_TYPES[self._seg_type[i]],
+            emotion=None if emotion == MISSING else _EMOTIONS[emotion],
+            speaker=None if speaker == MISSING else self.speakers[speaker],
+            character=None if character == MISSING else self.characters[character].name
+        )
+
+    def __iter__(self) -> Iterator[SegmentRow]:
+        for i in range(len(self)):
+            yield self.row(i)
+
+    def line_segments(self, line_row: int) -> List[SegmentRow]:
+        """
+        Segmentos da linha na posição `line_row` (não o line_number).
+        """
+        return [self.row(i) for i in self._segment_range(line_row)]
+
+    def _segment_range(self, line_row: int) -> range:
+        return range(self._line_segments[line_row], self._line_segments[line_row + 1])
+
+    # ------------------------------------------------------------------
+    # Agregações (apenas sobre as colunas de códigos)
+    # ------------------------------------------------------------------
+
+    def speaker_counts(self) -> Counter:
+        codes = Counter(self._seg_speaker)
+        return Counter({
+            (None if code == MISSING else self.speakers[code]): count
+            for code, count in codes.items()
+        })
+
+    def emotion_histogram(self) -> Counter:
+        codes = Counter(self._seg_emotion)
+        return Counter({
+            (None if code == MISSING else _EMOTIONS[code]): count
+            for code, count in codes.items()
+        })
+
+    def segment_type_counts(self) -> Counter:
+        return Counter({_SEGMENT_TYPES[code]: count for code, count in Counter(self._seg_type).items()})
+
+    def lines_per_character(self) -> Counter:
+        """
+        Número de linhas distintas em que cada personagem tem ao menos um segmento.
+        """
+        pairs = set(zip(self._seg_character, self._seg_line_number))
+        codes = Counter(code for code, _ in pairs if code != MISSING)
+        return Counter({self.characters[code].name: count for code, count in codes.items()})
+
+
+class _Builder:
+    """
+    Acumula linhas e segmentos nas colunas e monta o buffer de texto ao final.
+    """
+
+    def __init__(self, columns: ColumnarChapter):
+        self.columns = columns
+        self._parts: List[str] = []
+        self._size = [0]
+        self._speaker_codes: Dict[str, int] = {}
+        self._character_codes: Dict[str, int] = {}
+
+    def add_line(self, line_number: int, text: str, translated_text: Optional[str]) -> None:
+        c = self.columns
+        if len(c._line_number):
+            c._line_segments.append(len(c._seg_index))
+        c._line_number.append(line_number)
+        c._line_text.append(self._parts, self._size, text)
+        c._line_translated.append(self._parts, self._size, translated_text)
+
+    def add_segment(
+        self,
+        line_number: int,
+        segment_index: int,
+        text: str,
+        translated_text: Optional[str],
+        segment_type: SegmentType,
+        emotion: Optional[EmotionType],
+        speaker: Optional[str],
+        character_name: Optional[str],
+        make_character
+    ) -> None:
+        c = self.columns
+        c._seg_line_number.append(line_number)
+        c._seg_index.append(segment_index)
+        c._seg_type.append(_SEGMENT_TYPE_CODES[segment_type])
+        c._seg_emotion.append(MISSING if emotion is None else _EMOTION_CODES[emotion])
+        c._seg_speaker.append(self._code(speaker, self._speaker_codes, c.speakers, lambda: speaker))
+        c._seg_character.append(self._code(character_name, self._character_codes, c.characters, make_character))
+        c._seg_text.append(self._parts, self._size, text)
+        c._seg_translated.append(self._parts, self._size, translated_text)
+
+    @staticmethod
+    def _code(key: Optional[str], codes: Dict[str, int], table: list, make) -> int:
+        if key is None:
+            return MISSING
+        code = codes.get(key)
+        if code is None:
+            code = codes[key] = len(table)
+            table.append(make())
+        return code
+
+    def finish(self) -> ColumnarChapter:
+        c = self.columns
+        if len(c._line_number):
+            c._line_segments.append(len(c._seg_index))
+        c._text = "".join(self._parts)
+        logger.debug(
+            "ColumnarChapter %s: %d linhas, %d segmentos, %d caracteres de texto",
+            c.id, c.line_count, len(c), len(c._text)
+        )
+        return c
@@ -3,11 +3,12 @@ from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any
 
 from core.models.segment import Segment
+from core.utils.dataclass_utils import build_trusted
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Line:
     original_text: str
     translated_text: Optional[str] = None
@@ -15,7 +16,8 @@ class Line:
     line_number: int = field(default=-1)
     
     def __post_init__(self):
-        logger.debug("Inicializando Line: #%d - \"%s...\"", self.line_number, self.original_text[:50])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Inicializando Line: #%d - \"%s...\"", self.line_number, self.original_text[:50])
 
         if not self.original_text.strip():
             logger.error("O campo 'original_text' está vazio.")
@@ -46,11 +48,17 @@ class Line:
         return data
     
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Line":
-        logger.debug("Criando Line a partir de dict: line_number=%s", data.get("line_number", -1))
-        return cls(
+    def from_dict(cls, data: Dict[str, Any], *, validate: bool = True) -> "Line":
+        """
+        Com `validate=False`, monta a instância sem __post_init__ (dados confiáveis).
+        """
+        fields = dict(
             original_text=data["original_text"],
             translated_text=data.get("translated_text"),
-            segments=[Segment.from_dict(s) for s in data.get("segments", [])],
+            segments=[Segment.from_dict(s, validate=validate) for s in data.get("segments", [])],
             line_number=data.get("line_number", -1)
         )
+        if not validate:
+            return build_trusted(cls, **fields)
+        logger.debug("Criando Line a partir de dict: line_number=%s", fields["line_number"])
+        return cls(**fields)
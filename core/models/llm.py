@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from typing import Dict, Any, Optional
 
 from core.enums import LLMRole
+from core.utils.dataclass_utils import build_trusted
 
 logger = logging.getLogger(__name__)
 
@@ -33,37 +34,49 @@ class LLMMessage:
         return data
     
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "LLMMessage":
-        logger.debug("Criando LLMMessage a partir de dict: %s", data)
-        return cls(
+    def from_dict(cls, data: Dict[str, Any], *, validate: bool = True) -> "LLMMessage":
+        """
+        Com `validate=False`, monta a instância sem __post_init__ (dados confiáveis).
+        """
+        fields = dict(
             role=LLMRole.safe(data["role"]),
             content=data["content"],
             name=data.get("name")
         )
+        if not validate:
+            return build_trusted(cls, **fields)
+        logger.debug("Criando LLMMessage a partir de dict: %s", data)
+        return cls(**fields)
 
 @dataclass
 class LLMUsage:
     prompt_tokens: int
     completion_tokens: int
     total_tokens: int
+    # Tokens do prompt servidos pelo cache de prefixo do provedor (já incluídos em prompt_tokens).
+    cached_tokens: int = 0
 
     def __post_init__(self):
         logger.debug(
-            "LLMUsage: prompt=%d, completion=%d, total=%d",
-            self.prompt_tokens, self.completion_tokens, self.total_tokens
+            "LLMUsage: prompt=%d (cache=%d), completion=%d, total=%d",
+            self.prompt_tokens, self.cached_tokens, self.completion_tokens, self.total_tokens
         )
-        if self.prompt_tokens < 0 or self.completion_tokens < 0 or self.total_tokens < 0:
+        if self.prompt_tokens < 0 or self.completion_tokens < 0 or self.total_tokens < 0 or self.cached_tokens < 0:
             logger.error("Tokens negativos: %s", self)
             raise ValueError("Tokens não podem ser negativos")
         if self.total_tokens != self.prompt_tokens + self.completion_tokens:
             logger.error("Total de tokens inconsistente: %s", self)
             raise ValueError("total_tokens deve ser igual à soma de prompt_tokens e completion_tokens")
-    
+        if self.cached_tokens > self.prompt_tokens:
+            logger.error("Tokens em cache acima do prompt: %s", self)
+            raise ValueError("cached_tokens não pode exceder prompt_tokens")
+
     def to_dict(self) -> Dict[str, Any]:
         data = {
             "prompt_tokens": self.prompt_tokens,
             "completion_tokens": self.completion_tokens,
-            "total_tokens": self.total_tokens
+            "total_tokens": self.total_tokens,
+            "cached_tokens": self.cached_tokens
         }
         logger.debug("Serializando LLMUsage: %s", data)
         return data
@@ -74,7 +87,8 @@ class LLMUsage:
         return cls(
             prompt_tokens=data["prompt_tokens"],
             completion_tokens=data["completion_tokens"],
-            total_tokens=data["total_tokens"]
+            total_tokens=data["total_tokens"],
+            cached_tokens=data.get("cached_tokens", 0)
         )
 
 @dataclass
@@ -84,7 +98,8 @@ class LLMResponse:
     raw: Optional[Dict[str, Any]] = None
     
     def __post_init__(self):
-        logger.debug("Inicializando LLMResponse com texto: %s...", self.text[:60])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Inicializando LLMResponse com texto: %s...", self.text[:60])
         if not self.text.strip():
             logger.error("Resposta LLM vazia.")
             raise ValueError("A resposta não pode estar vazia")
@@ -3,6 +3,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 
 from core.models.chapter import Chapter
+from core.utils.dataclass_utils import build_trusted
 
 logger = logging.getLogger(__name__)
 
@@ -55,17 +56,24 @@ class MediaWork:
             "description": self.description,
             "chapters": [c.to_dict() for c in self.chapters],
         }
-        logger.debug("Serializando MediaWork para dict: %s", data)
+        logger.debug("Serializando MediaWork para dict: %s (%d capítulos)", self.id, len(self.chapters))
         return data
         
     @classmethod
-    def from_dict(cls, data) -> "MediaWork":
-        logger.debug("Criando MediaWork a partir de dict: %s", data)
-        return cls(
+    def from_dict(cls, data, *, validate: bool = True) -> "MediaWork":
+        """
+        Com `validate=False`, monta a obra inteira sem __post_init__ nem
+        validações repetidas por capítulo/linha/segmento (dados confiáveis).
+        """
+        fields = dict(
             id=data.get("id"),
             title=data.get("title"),
             author=data.get("author"),
             original_language=data.get("original_language"),
             description=data.get("description"),
-            chapters=[Chapter.from_dict(chapter) for chapter in data.get("chapters", [])],
+            chapters=[Chapter.from_dict(chapter, validate=validate) for chapter in data.get("chapters", [])],
         )
+        if not validate:
+            return build_trusted(cls, **fields)
+        logger.debug("Criando MediaWork a partir de dict: %s", fields["id"])
+        return cls(**fields)
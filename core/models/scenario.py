@@ -2,6 +2,8 @@ import logging
 from dataclasses import dataclass
 from typing import Optional
 
+from core.utils.dataclass_utils import build_trusted
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,7 +45,18 @@ class Scenario:
         return data
 
     @classmethod
-    def from_dict(cls, data: dict) -> "Scenario":
+    def from_dict(cls, data: dict, *, validate: bool = True) -> "Scenario":
+        """
+        Com `validate=False`, monta a instância sem __post_init__ (dados confiáveis).
+        """
+        if not validate:
+            return build_trusted(
+                cls,
+                index=data["index"],
+                text=data["text"],
+                location=data.get("location"),
+                characters=data.get("characters") or [],
+            )
         logger.debug("Criando Scenario a partir de dict: %s", data)
         return cls(
             index=data["index"],
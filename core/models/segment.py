@@ -1,15 +1,22 @@
+import sys
 import logging
 from dataclasses import dataclass
 from typing import Optional, Dict, Any
 
 from core.enums import SegmentType, EmotionType
 from core.models.character import Character
+from core.utils.dataclass_utils import build_trusted
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Segment:
+    """
+    Usa __slots__ (sem __dict__ por instância), pois uma obra processada
+    mantém milhões de segmentos em memória. `speaker_hint` é internado:
+    os mesmos poucos nomes se repetem em todos os segmentos.
+    """
     segment_index: int
     line_number: int
     text: str
@@ -43,9 +50,12 @@ class Segment:
         
         if self.character and not isinstance(self.character, Character):
             raise TypeError(f"'character' deve ser uma instância de Character ou None, recebido: {type(self.character)}")
+
+        if self.speaker_hint:
+            self.speaker_hint = sys.intern(self.speaker_hint)
     
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Segment":
+    def from_dict(cls, data: Dict[str, Any], *, validate: bool = True) -> "Segment":
         """
         Factory que cria um Segment a partir de um dict vindo da LLM.
         Espera as chaves:
@@ -56,19 +66,23 @@ class Segment:
           - segment_type (str: one of SegmentType)
           - speaker (str)
           - emotion (str)
+        Com `validate=False`, monta a instância sem __post_init__ (dados confiáveis).
         """
-        logger.debug("Criando Segment a partir de dict: %s", data)
-        original_text = data.get("text", data.get("original_text", ""))
-        return cls(
+        speaker = data.get("speaker", "Narrador")
+        fields = dict(
             segment_index=data["segment_index"],
             line_number=data["line_number"],
-            text=original_text,
+            text=data.get("text", data.get("original_text", "")),
             translated_text=data["translated_text"],
             segment_type=SegmentType.safe(data["segment_type"]),
-            speaker_hint=data.get("speaker", "Narrador"),
-            emotion=EmotionType.safe(data.get("emotion")),
-            character=Character.from_dict(data.get("character")) if data.get("character") else None
+            speaker_hint=sys.intern(speaker) if isinstance(speaker, str) else speaker,
+            character=Character.from_dict(data["character"], validate=validate) if data.get("character") else None,
+            emotion=EmotionType.safe(data.get("emotion"))
         )
+        if not validate:
+            return build_trusted(cls, **fields)
+        logger.debug("Criando Segment a partir de dict: %s", data)
+        return cls(**fields)
 
     def to_dict(self) -> dict:
         data = {
@@ -79,7 +93,7 @@ class Segment:
             "segment_type": self.segment_type.value,
             "speaker_hint": self.speaker_hint,
             "character": self.character.to_dict() if self.character else None,
-            "emotion": self.emotion.value,
+            "emotion": self.emotion.value if self.emotion else None,
         }
         logger.debug("Serializando Segment para dict: %s", data)
         return data
@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Dict, Any
 
 from core.enums import GenderType
+from core.utils.dataclass_utils import build_trusted
 
 logger = logging.getLogger(__name__)
 
@@ -47,12 +48,18 @@ class VoiceProfile:
         return data
 
     @classmethod
-    def from_dict(cls, data: dict) -> "VoiceProfile":
-        logger.debug("Criando VoiceProfile a partir de dict: %s", data)
-        return cls(
+    def from_dict(cls, data: dict, *, validate: bool = True) -> "VoiceProfile":
+        """
+        Com `validate=False`, monta a instância sem __post_init__ (dados confiáveis).
+        """
+        fields = dict(
             id=data["id"],
             name=data["name"],
             gender=GenderType.safe(data["gender"]),
             language=data["language"],
             vendor=data["vendor"]
         )
+        if not validate:
+            return build_trusted(cls, **fields)
+        logger.debug("Criando VoiceProfile a partir de dict: %s", data)
+        return cls(**fields)
@@ -0,0 +1,143 @@
+import re
+import logging
+from typing import Any, Dict, List, Optional
+
+from core.models.scenario import Scenario
+from core.utils.dataclass_utils import build_trusted
+from core.utils.normalizer import normalize_location
+
+logger = logging.getLogger(__name__)
+
+# Tamanho máximo, em caracteres, da descrição de um cenário após os
+# detalhes acrescentados capítulo a capítulo.
+MAX_DESCRIPTION_CHARS = 1200
+
+_SENTENCE_END = re.compile(r"(?<=[.!?…])\s+|(?<=[。！？])")
+
+
+class ScenarioRegistry:
+    """
+    Cenários já conhecidos de uma obra, indexados pelo nome de local
+    normalizado (ver normalize_location), com os capítulos em que aparecem.
+
+    `merge` aplica as atualizações extraídas de um capítulo: locais novos
+    são registrados com a descrição completa; para locais conhecidos,
+    apenas as frases ainda ausentes da descrição são acrescentadas, até
+    `max_description_chars`. Atingido o limite, novos detalhes são
+    descartados, para que as descrições (devolvidas a cada capítulo) não
+    cresçam indefinidamente ao longo da obra.
+    """
+
+    def __init__(self, *, max_description_chars: int = MAX_DESCRIPTION_CHARS):
+        if max_description_chars < 1:
+            raise ValueError("max_description_chars deve ser maior ou igual a 1")
+        self.max_description_chars = max_description_chars
+        self._scenarios: Dict[str, Scenario] = {}
+        self._chapters: Dict[str, List[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._scenarios)
+
+    def get(self, location: str) -> Optional[Scenario]:
+        return self._scenarios.get(normalize_location(location))
+
+    def list(self) -> List[Scenario]:
+        return list(self._scenarios.values())
+
+    def known_locations(self) -> List[str]:
+        """
+        Nomes dos locais registrados, na ordem de registro.
+        """
+        return [scenario.location for scenario in self._scenarios.values()]
+
+    def chapters_for(self, location: str) -> List[str]:
+        return list(self._chapters.get(normalize_location(location), []))
+
+    def merge(self, updates: List[Dict[str, Any]], chapter_id: str) -> List[Scenario]:
+        """
+        Aplica as atualizações de um capítulo ({"location", "text", "characters"},
+        com `text` vazio para locais conhecidos sem detalhes novos) e retorna
+        os cenários do capítulo, com a descrição completa do registro e
+        índices a partir de 0.
+
+        Atualizações sem local não entram no registro, mas são devolvidas
+        se tiverem texto; locais novos sem texto são descartados.
+        """
+        chapter: Dict[str, Scenario] = {}
+        unlocated: List[Scenario] = []
+        for update in updates:
+            location = (update.get("location") or "").strip()
+            text = (update.get("text") or "").strip()
+            characters = [c for c in update.get("characters") or [] if isinstance(c, str)]
+            key = normalize_location(location) if location else ""
+
+            if not key:
+                if text:
+                    unlocated.append(build_trusted(Scenario, index=0, text=text, location=None, characters=characters))
+                continue
+
+            scenario = self._scenarios.get(key)
+            if scenario is None:
+                if not text:
+                    logger.debug("Local novo '%s' sem descrição; ignorado", location)
+                    continue
+                scenario = build_trusted(
+                    Scenario, index=len(self._scenarios), text=text, location=location, characters=characters
+                )
+                self._scenarios[key] = scenario
+                logger.info("Novo cenário registrado: %s", location)
+            else:
+                if text:
+                    scenario.text = self._append_details(scenario, text)
+                scenario.characters = list(dict.fromkeys(scenario.characters + characters))
+
+            chapters = self._chapters.setdefault(key, [])
+            if chapter_id not in chapters:
+                chapters.append(chapter_id)
+            chapter[key] = scenario
+
+        return [
+            build_trusted(
+                Scenario,
+                index=index,
+                text=scenario.text,
+                location=scenario.location,
+                characters=list(scenario.characters)
+            )
+            for index, scenario in enumerate(list(chapter.values()) + unlocated)
+        ]
+
+    def _append_details(self, scenario: Scenario, text: str) -> str:
+        description = scenario.text
+        known = normalize_location(description)
+        for sentence in _SENTENCE_END.split(text):
+            sentence = sentence.strip()
+            key = normalize_location(sentence)
+            if not key or key in known:
+                continue
+            if len(description) + 1 + len(sentence) > self.max_description_chars:
+                logger.debug("Descrição de '%s' no limite de %d caracteres; detalhes descartados", scenario.location, self.max_description_chars)
+                break
+            description = f"{description} {sentence}"
+            known = f"{known} {key}"
+        return description
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "scenarios": [
+                dict(scenario.to_dict(), chapters=list(self._chapters.get(key, [])))
+                for key, scenario in self._scenarios.items()
+            ]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], **kwargs) -> "ScenarioRegistry":
+        registry = cls(**kwargs)
+        for item in data.get("scenarios", []):
+            scenario = Scenario.from_dict(item, validate=False)
+            key = normalize_location(scenario.location or "")
+            if not key:
+                continue
+            registry._scenarios[key] = scenario
+            registry._chapters[key] = list(item.get("chapters", []))
+        return registry
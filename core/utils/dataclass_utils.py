@@ -0,0 +1,17 @@
+from typing import Any, Type, TypeVar
+
+Model = TypeVar("Model")
+
+
+def build_trusted(cls: Type[Model], **values: Any) -> Model:
+    """
+    Instancia um dataclass sem passar por __init__/__post_init__,
+    atribuindo diretamente os campos informados (todos devem ser passados).
+
+    Uso restrito a dados já validados, como o JSON que nós mesmos gravamos:
+    pula as validações e o log de depuração feitos a cada instância.
+    """
+    obj = cls.__new__(cls)
+    for name, value in values.items():
+        object.__setattr__(obj, name, value)
+    return obj
@@ -0,0 +1,55 @@
+import asyncio
+import logging
+import threading
+from typing import Awaitable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_thread: Optional[threading.Thread] = None
+_lock = threading.Lock()
+
+
+def background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Event loop persistente, executado numa thread daemon e criado na
+    primeira chamada. Compartilhado pelas fachadas síncronas dos
+    componentes assíncronos, para que clientes com pool de conexões
+    (ex: httpx.AsyncClient) fiquem sempre ligados ao mesmo loop.
+    """
+    global _loop, _thread
+    with _lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            _thread = threading.Thread(target=_loop.run_forever, name="async-facade-loop", daemon=True)
+            _thread.start()
+            logger.debug("Event loop das fachadas síncronas iniciado")
+        return _loop
+
+
+def run_sync(awaitable: Awaitable[T]) -> T:
+    """
+    Executa `awaitable` no event loop persistente e aguarda o resultado.
+
+    Ao contrário de asyncio.run, não cria (nem fecha) um loop a cada
+    chamada. Pode ser chamado de várias threads ao mesmo tempo; não pode
+    ser chamado de dentro de um event loop em execução (use a versão
+    assíncrona do método diretamente).
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise RuntimeError("run_sync não pode ser chamado de dentro de um event loop; use a versão assíncrona")
+
+    future = asyncio.run_coroutine_threadsafe(_await(awaitable), background_loop())
+    return future.result()
+
+
+async def _await(awaitable: Awaitable[T]) -> T:
+    return await awaitable
@@ -1,7 +1,18 @@
+import os
 import json
 import hashlib
+import logging
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, List, Union
+from typing import Any, Iterator, List, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
 
 
 def compute_checksum(text: Union[str, bytes], algo: str = "sha256") -> str:
@@ -15,6 +26,27 @@ def compute_checksum(text: Union[str, bytes], algo: str = "sha256") -> str:
     return h.hexdigest()
 
 
+def compute_file_checksum(path: Path, algo: str = "sha256", chunk_size: int = 1024 * 1024) -> str:
+    """
+    Retorna o hash (hex) do conteúdo de um arquivo, lido em blocos.
+    """
+    h = hashlib.new(algo)
+    with path.open("rb") as f:
+        while chunk := f.read(chunk_size):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def compute_fingerprint(data: Any, algo: str = "sha256") -> str:
+    """
+    Retorna o hash (hex) de uma estrutura serializável em JSON.
+    A serialização é canônica (chaves ordenadas, sem espaços), de modo que
+    estruturas equivalentes sempre produzem o mesmo hash.
+    """
+    canonical = json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return compute_checksum(canonical, algo)
+
+
 def load_json(path: Path) -> Any:
     """
     Lê um arquivo JSON e retorna o objeto Python.
@@ -22,12 +54,79 @@ def load_json(path: Path) -> Any:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def save_json(path: Path, data: Any, indent: int = 2) -> None:
+def atomic_write_text(path: Path, text: str, encoding: str = "utf-8") -> None:
+    """
+    Grava um texto de forma atômica: escreve num arquivo temporário da mesma
+    pasta, faz fsync e o renomeia sobre o destino (os.replace). Um processo
+    interrompido no meio da escrita deixa o arquivo antigo intacto, nunca
+    um JSON truncado.
     """
-    Salva um objeto Python como JSON.
+    atomic_write_bytes(path, text.encode(encoding))
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Versão binária de `atomic_write_text`.
     """
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=indent), encoding="utf-8")
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+    _fsync_dir(path.parent)
+
+
+def _fsync_dir(directory: Path) -> None:
+    """
+    Persiste a entrada de diretório do rename (POSIX); ignorado onde não é suportado.
+    """
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """
+    Lock exclusivo entre processos (fcntl.flock) sobre `{path}.lock`,
+    para sequências ler-modificar-gravar do mesmo arquivo. Sem fcntl
+    (Windows), não há lock: apenas as gravações continuam atômicas.
+    """
+    lock_path = path.with_name(path.name + ".lock")
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "a") as lock_file:
+        if fcntl is None:
+            logger.debug("fcntl indisponível; seguindo sem lock para %s", path)
+            yield
+            return
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def save_json(path: Path, data: Any, indent: int = 2) -> None:
+    """
+    Salva um objeto Python como JSON (gravação atômica).
+    """
+    atomic_write_text(path, json.dumps(data, ensure_ascii=False, indent=indent))
 
 
 def read_text_lines(path: Path) -> List[str]:
@@ -39,7 +138,6 @@ def read_text_lines(path: Path) -> List[str]:
 
 def write_text(path: Path, text: str) -> None:
     """
-    Grava um texto num arquivo, criando pastas se necessário.
+    Grava um texto num arquivo, criando pastas se necessário (gravação atômica).
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(text, encoding="utf-8")
+    atomic_write_text(path, text)
@@ -1,11 +1,38 @@
-from typing import Iterable, List, TypeVar
+from itertools import islice
+from typing import Callable, Iterable, List, Sequence, TypeVar
 
 Item = TypeVar("Item")
 
 
-def chunk_list(items: List[Item], size: int) -> Iterable[List[Item]]:
+def chunk_list(items: Iterable[Item], size: int) -> Iterable[List[Item]]:
     """
-    Divide uma lista em chunks de tamanho `size`.
+    Divide uma lista (ou qualquer iterável, consumido sob demanda)
+    em chunks de tamanho `size`.
     """
-    for i in range(0, len(items), size):
-        yield items[i : i + size]
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def chunk_by_budget(
+    items: Iterable[Item],
+    costs: Callable[[Item], Sequence[float]],
+    limits: Sequence[float]
+) -> Iterable[List[Item]]:
+    """
+    Agrupa itens consecutivos de modo que a soma de cada dimensão de custo
+    (ex: tokens de entrada e de saída) não ultrapasse o limite correspondente.
+    Um item que sozinho excede algum limite forma um chunk próprio.
+    """
+    chunk: List[Item] = []
+    totals = [0.0] * len(limits)
+    for item in items:
+        item_costs = costs(item)
+        fits = all(total + cost <= limit for total, cost, limit in zip(totals, item_costs, limits))
+        if chunk and not fits:
+            yield chunk
+            chunk, totals = [], [0.0] * len(limits)
+        chunk.append(item)
+        totals = [total + cost for total, cost in zip(totals, item_costs)]
+    if chunk:
+        yield chunk
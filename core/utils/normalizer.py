@@ -31,3 +31,22 @@ def safe_filename(name: str, replace_with: str = "_") -> str:
     filename = unicodedata.normalize("NFKD", name)
     filename = filename.encode("ascii", "ignore").decode("ascii")
     return re.sub(r"[^A-Za-z0-9._-]", replace_with, filename)
+
+
+_LOCATION_ARTICLES = {"o", "a", "os", "as", "the"}
+
+
+def normalize_location(name: str) -> str:
+    """
+    Chave de comparação para nomes de lugar:
+    - sem acentos, minúsculas (casefold)
+    - pontuação trocada por espaço, espaços colapsados
+    - sem artigo inicial ('O Colégio Zhicai' → 'colegio zhicai')
+    Caracteres não latinos (ex: nomes em chinês) são preservados.
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    no_marks = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    words = re.sub(r"[\W_]+", " ", no_marks.casefold()).split()
+    if len(words) > 1 and words[0] in _LOCATION_ARTICLES:
+        words = words[1:]
+    return " ".join(words)
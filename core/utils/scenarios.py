@@ -0,0 +1,49 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from core.models.scenario import Scenario
+from core.utils.dataclass_utils import build_trusted
+from core.utils.normalizer import normalize_location
+
+
+def scenario_key(scenario: Scenario) -> Tuple[str, str]:
+    """
+    Chave de deduplicação: o local normalizado ou, sem local, o texto normalizado.
+    """
+    if scenario.location and normalize_location(scenario.location):
+        return ("location", normalize_location(scenario.location))
+    return ("text", normalize_location(scenario.text))
+
+
+def merge_scenarios(scenarios: Iterable[Scenario]) -> List[Scenario]:
+    """
+    Junta cenários de várias extrações (ex: trechos de um mesmo capítulo)
+    de forma determinística:
+
+    - cenários com o mesmo local normalizado viram um só, com a descrição
+      mais longa e a união (em ordem) dos personagens;
+    - cenários sem local só são unidos se o texto for o mesmo;
+    - a ordem é a da primeira ocorrência, e os índices são refeitos a partir de 0.
+    """
+    merged: Dict[Tuple[str, str], Scenario] = {}
+    for scenario in scenarios:
+        key = scenario_key(scenario)
+        current = merged.get(key)
+        merged[key] = scenario if current is None else _combine(current, scenario)
+
+    return [
+        build_trusted(
+            Scenario,
+            index=index,
+            text=scenario.text,
+            location=scenario.location,
+            characters=list(scenario.characters or [])
+        )
+        for index, scenario in enumerate(merged.values())
+    ]
+
+
+def _combine(current: Scenario, other: Scenario) -> Scenario:
+    text = other.text if len(other.text) > len(current.text) else current.text
+    location: Optional[str] = current.location or other.location
+    characters = list(dict.fromkeys((current.characters or []) + (other.characters or [])))
+    return build_trusted(Scenario, index=current.index, text=text, location=location, characters=characters)
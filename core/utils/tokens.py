@@ -0,0 +1,67 @@
+import math
+import logging
+from functools import lru_cache
+from typing import Any, Iterable, Optional
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+# Tokens extras que a API contabiliza por mensagem (role, separadores)
+# e para o "priming" da resposta do assistente.
+TOKENS_PER_MESSAGE = 4
+TOKENS_PER_REPLY = 3
+
+
+@lru_cache(maxsize=None)
+def _encoder_for(model: str) -> Optional[Any]:
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        pass
+    except Exception:
+        logger.warning("Não foi possível carregar o encoder do tiktoken para '%s'; usando estimativa", model)
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        logger.warning("Não foi possível carregar o encoder 'cl100k_base'; usando estimativa")
+        return None
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimativa sem tokenizer: ~4 caracteres ASCII por token e
+    ~1 token por caractere não-ASCII (CJK, acentos).
+    """
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return math.ceil(ascii_chars / 4) + (len(text) - ascii_chars)
+
+
+def count_tokens(text: str, model: str = "gpt-4o") -> int:
+    """
+    Conta os tokens de um texto com o tokenizer do modelo (tiktoken),
+    recorrendo a `estimate_tokens` se o tokenizer não estiver disponível.
+    """
+    encoder = _encoder_for(model)
+    if encoder is None:
+        return estimate_tokens(text)
+    return len(encoder.encode(text))
+
+
+def count_message_tokens(messages: Iterable[Any], model: str = "gpt-4o") -> int:
+    """
+    Conta os tokens de prompt de uma lista de LLMMessage, incluindo
+    o overhead fixo por mensagem usado pela API de chat.
+    """
+    total = TOKENS_PER_REPLY
+    for msg in messages:
+        total += TOKENS_PER_MESSAGE + count_tokens(msg.content, model)
+        if msg.name:
+            total += count_tokens(msg.name, model)
+    return total
@@ -1,13 +1,27 @@
 import sys
 import shutil
 import typer
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Optional
 
 sys.path.append(str(Path(__file__).resolve().parent.parent))
 
+from adapters.analyzer.llm_pipeline_processor import LLMPipelineProcessor
+from adapters.llm.openai_client import OpenAIClient
+from adapters.llm.rate_limiter import RateLimiter
+from adapters.llm.retrying_llm_client import RetryingLLMClient, RetryPolicy
+from adapters.loaders.file_text_loader import FileTextLoader
+from adapters.persistence.block_codec import check_codec
+from adapters.persistence.file_block_cache import FileBlockCache
+from adapters.persistence.file_manifest_adapter import FileManifestAdapter
+from adapters.persistence.lru_block_cache import LRUBlockCache
+from adapters.prompts.compact_pipeline_prompt import CompactPipelinePrompt
+from adapters.prompts.pipeline_prompt import PipelinePrompt
+from core.repositories.character_repository import CharacterRepository
 from core.utils.normalizer import normalize_work_id
-from core.utils.file_utils import save_json, load_json
+from core.utils.file_utils import save_json, load_json, compute_file_checksum
+from use_cases.process_work import ChapterPipeline, ProcessWorkUseCase, entry_checksum
 
 app = typer.Typer(help="Ferramentas para registrar obras literárias no sistema.")
 
@@ -109,15 +123,12 @@ def list_chapters(work_id: str = typer.Argument(..., help="ID da obra")):
     Lista os capítulos .txt da obra e mostra se foram processados (com base no manifest).
     """
     chapters_dir = BASE_INPUT / work_id / "chapters"
-    manifest_path = BASE_STORE / work_id / "manifest.json"
     
     if not chapters_dir.exists():
         typer.echo("❌ Obra não encontrada.")
         raise typer.Exit()
     
-    manifest = {}
-    if manifest_path.exists():
-        manifest = load_json(manifest_path).get("chapters", {})
+    manifest = FileManifestAdapter(BASE_STORE).load(work_id)["chapters"]
         
     txt_files = sorted(chapters_dir.glob("*.txt"))
     if not txt_files:
@@ -127,11 +138,125 @@ def list_chapters(work_id: str = typer.Argument(..., help="ID da obra")):
     typer.echo(f"📑 Capítulos em '{work_id}':\n")
     for f in txt_files:
         chapter_id = f.stem
-        status = "✅ processado" if chapter_id in manifest else "❌ pendente"
+        if chapter_id not in manifest:
+            status = "❌ pendente"
+        elif entry_checksum(manifest[chapter_id]) != compute_file_checksum(f):
+            status = "⚠️  alterado"
+        else:
+            status = "✅ processado"
         typer.echo(f"  {chapter_id}.txt  → {status}")
 
     typer.echo(f"\nTotal: {len(txt_files)} capítulo(s)")
     
+@lru_cache(maxsize=None)
+def shared_rate_limiter(requests_per_minute: Optional[int], tokens_per_minute: Optional[int]) -> RateLimiter:
+    """
+    Um RateLimiter por processo, compartilhado pelos workers em thread; entre
+    processos, a cota é sincronizada pelos headers `x-ratelimit-*`.
+    """
+    return RateLimiter(requests_per_minute, tokens_per_minute)
+
+
+def build_pipeline(
+    model: str,
+    chunk_size: int,
+    max_tokens: Optional[int],
+    cache_codec: str = "gzip",
+    compact: bool = False,
+    requests_per_minute: Optional[int] = None,
+    tokens_per_minute: Optional[int] = None,
+    max_attempts: int = 5
+) -> ChapterPipeline:
+    """
+    Monta o pipeline de um worker do comando `process` (precisa ser uma
+    função de módulo para poder ser enviada a um pool de processos).
+
+    O cliente da OpenAI respeita os limites de RPM/TPM (RateLimiter) e as
+    falhas transitórias são repetidas pelo RetryingLLMClient, com as
+    retentativas internas do SDK desligadas.
+    """
+    llm_client = RetryingLLMClient(
+        OpenAIClient(
+            model=model,
+            max_retries=0,
+            rate_limiter=shared_rate_limiter(requests_per_minute, tokens_per_minute)
+        ),
+        RetryPolicy(max_attempts=max_attempts)
+    )
+    processor = LLMPipelineProcessor(
+        llm_client=llm_client,
+        prompt_template=CompactPipelinePrompt() if compact else PipelinePrompt(),
+        character_repository=CharacterRepository(),
+        chunk_size=chunk_size,
+        max_tokens=max_tokens,
+        block_cache=LRUBlockCache(FileBlockCache(BASE_STORE, codec=cache_codec))
+    )
+    return ChapterPipeline(loader=FileTextLoader(), processor=processor)
+
+
+@app.command("process")
+def process_work(
+    work_id: str = typer.Argument(..., help="ID da obra"),
+    workers: int = typer.Option(4, "--workers", "-w", help="Capítulos processados em paralelo"),
+    mode: str = typer.Option("thread", "--mode", "-m", help="Tipo de pool: thread ou process"),
+    model: str = typer.Option("gpt-4o", "--model", help="Modelo da LLM"),
+    chunk_size: int = typer.Option(10, "--chunk-size", help="Linhas por requisição"),
+    max_tokens: Optional[int] = typer.Option(None, "--max-tokens", help="Limite de tokens da resposta por bloco"),
+    force: bool = typer.Option(False, "--force", help="Reprocessa também os capítulos inalterados"),
+    cache_codec: str = typer.Option("gzip", "--cache-codec", help="Compressão do cache de blocos: gzip, zstd ou json"),
+    compact: bool = typer.Option(False, "--compact", help="Resposta compacta da LLM (intervalos e códigos curtos)"),
+    rpm: Optional[int] = typer.Option(None, "--rpm", min=1, help="Limite de requisições por minuto (padrão: lido dos headers da API)"),
+    tpm: Optional[int] = typer.Option(None, "--tpm", min=1, help="Limite de tokens por minuto (padrão: lido dos headers da API)"),
+    max_attempts: int = typer.Option(5, "--max-attempts", min=1, help="Tentativas por requisição (1 = sem retentativas)")
+):
+    """
+    Processa os capítulos pendentes ou alterados da obra e registra cada um no
+    manifest ao concluir. Pode ser interrompido e executado novamente: retoma dos
+    capítulos pendentes e pula os inalterados.
+    """
+    metadata_path = BASE_INPUT / work_id / "metadata.json"
+    if not (BASE_INPUT / work_id / "chapters").exists():
+        typer.echo("❌ Obra não encontrada.")
+        raise typer.Exit(code=1)
+    try:
+        check_codec(cache_codec)
+    except ValueError as e:
+        typer.echo(f"❌ {e}")
+        raise typer.Exit(code=1)
+
+    work_metadata = load_json(metadata_path) if metadata_path.exists() else {}
+    prompt_metadata = {
+        key: work_metadata[key] for key in ("title", "original_language") if work_metadata.get(key)
+    }
+
+    def report(chapter_id: str, error: Optional[Exception]) -> None:
+        if error is None:
+            typer.echo(f"  ✅ {chapter_id}")
+        else:
+            typer.echo(f"  ❌ {chapter_id}: {error}")
+
+    use_case = ProcessWorkUseCase(
+        FileManifestAdapter(BASE_STORE),
+        partial(build_pipeline, model, chunk_size, max_tokens, cache_codec, compact, rpm, tpm, max_attempts),
+        input_dir=BASE_INPUT,
+        output_dir=BASE_OUTPUT
+    )
+    try:
+        result = use_case.execute(
+            work_id, max_workers=workers, mode=mode, metadata=prompt_metadata, force=force, on_chapter_done=report
+        )
+    except ValueError as e:
+        typer.echo(f"❌ {e}")
+        raise typer.Exit(code=1)
+
+    typer.echo(
+        f"\nProcessados: {len(result.processed)} | Inalterados: {len(result.skipped)} | "
+        f"Com falha: {len(result.failed)}"
+    )
+    if result.failed:
+        raise typer.Exit(code=1)
+
+
 @app.command("delete-work")
 def delete_work(
     work_id: str = typer.Argument(..., help="ID da obra a ser removida"),
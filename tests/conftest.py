@@ -72,7 +72,7 @@ def sample_metadata(base_input, work_id):
 @pytest.fixture
 def chapters_dir(base_input, work_id):
     d = base_input / work_id / "chapters"
-    d.mkdir(parent=True, exist_ok=True)
+    d.mkdir(parents=True, exist_ok=True)
     return d
 
 @pytest.fixture
@@ -1,35 +1,7 @@
-pipeline_response_schema = {
-    "type": "object",
-    "properties": {
-        "segments": {
-            "type": "array",
-            "items": {
-                "type": "object",
-                "required": [
-                    "line_number", "segment_index", "original_text", "translated_text",
-                    "segment_type", "speaker", "character_type", "gender", "emotion"
-                ],
-                "properties": {
-                    "line_number": {"type": "integer"},
-                    "segment_index": {"type": "integer"},
-                    "original_text": {"type": "string"},
-                    "translated_text": {"type": "string"},
-                    "segment_type": {"enum": ["narration", "dialogue", "highlight"]},
-                    "speaker": {"type": "string"},
-                    "character_type": {"enum": [
-                        "narrator", "protagonist", "supporting_male",
-                        "supporting_female", "system", "unknown"
-                    ]},
-                    "gender": {"enum": ["male", "female", "unknown"]},
-                    "emotion": {"enum": [
-                        "neutral", "joy", "anger", "surprise", "hesitation", "shout"
-                    ]}
-                }
-            }
-        }
-    },
-    "required": ["segments"]
-}
+from adapters.prompts.response_schemas import PIPELINE_RESPONSE_SCHEMA
+
+# O schema do pipeline é o mesmo enviado à LLM (sem cópia que possa divergir).
+pipeline_response_schema = PIPELINE_RESPONSE_SCHEMA
 
 
 scenario_response_schema = {
@@ -0,0 +1,134 @@
+import asyncio
+import threading
+import json
+import pytest
+from unittest.mock import MagicMock
+
+from core.enums import LLMRole
+from core.interfaces.llm import BlockProcessingError
+from core.models.line import Line
+from core.models.llm import LLMMessage, LLMResponse
+
+from adapters.analyzer.async_llm_pipeline_processor import AsyncLLMPipelineProcessor
+from adapters.analyzer.llm_pipeline_processor import LLMPipelineProcessor
+
+
+class EchoAsyncClient:
+    """
+    Cliente assíncrono falso que devolve um segmento por bloco e
+    registra o pico de requisições simultâneas.
+    """
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.in_flight = 0
+        self.peak = 0
+
+    async def achat(self, messages, **kwargs):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+        line_number = json.loads(messages[0].content)["lines"][0]["line_number"]
+        if line_number == self.fail_on:
+            raise RuntimeError("LLM error")
+        return LLMResponse(text=json.dumps({"segments": [{
+            "segment_index": 0,
+            "line_number": line_number,
+            "text": f"Texto {line_number}",
+            "translated_text": f"Texto {line_number}",
+            "segment_type": "narration",
+            "speaker": "Narrador",
+            "character_type": "narrator",
+            "gender": "unknown"
+        }]}))
+
+
+@pytest.fixture
+def lines():
+    return [Line(original_text=f"Texto {i}", line_number=i) for i in range(8)]
+
+
+def _processor(client, sample_character, max_concurrency=2):
+    template = MagicMock()
+    template.parse_segments.side_effect = lambda segments, lines: segments
+    template.response_schema = None
+    template.build_messages.side_effect = lambda payload: [
+        LLMMessage(role=LLMRole.USER, content=json.dumps(payload))
+    ]
+    repo = MagicMock()
+    repo.upsert.return_value = sample_character
+    return AsyncLLMPipelineProcessor(client, template, repo, chunk_size=1, max_concurrency=max_concurrency)
+
+
+def test_aprocess_respects_concurrency_limit(lines, sample_character):
+    client = EchoAsyncClient()
+    processor = _processor(client, sample_character, max_concurrency=3)
+
+    segments = asyncio.run(processor.aprocess(lines))
+
+    assert [s.line_number for s in segments] == list(range(8))
+    assert 1 < client.peak <= 3
+
+
+def test_process_sync_facade_reports_failed_blocks(lines, sample_character):
+    processor = _processor(EchoAsyncClient(fail_on=5), sample_character)
+
+    with pytest.raises(BlockProcessingError) as exc_info:
+        processor.process(lines)
+
+    assert list(exc_info.value.failures) == [5]
+    assert len(exc_info.value.segments) == 7
+
+
+class LoopBoundClient(EchoAsyncClient):
+    """
+    Simula um pool de conexões ligado ao primeiro event loop em que foi usado.
+    """
+    def __init__(self):
+        super().__init__()
+        self.loop = None
+
+    async def achat(self, messages, **kwargs):
+        loop = asyncio.get_running_loop()
+        self.loop = self.loop or loop
+        if loop is not self.loop or self.loop.is_closed():
+            raise RuntimeError("Event loop is closed")
+        return await super().achat(messages, **kwargs)
+
+
+def test_process_sync_facade_reuses_event_loop(lines, sample_character):
+    processor = _processor(LoopBoundClient(), sample_character)
+
+    for _ in range(4):
+        segments = processor.process(lines)
+        assert [s.line_number for s in segments] == list(range(8))
+
+
+def test_iter_process_follows_the_block_processor_contract(lines, sample_character):
+    processor = _processor(EchoAsyncClient(), sample_character)
+
+    assert not isinstance(processor, LLMPipelineProcessor)
+    assert [s.line_number for s in processor.iter_process(lines)] == list(range(8))
+
+
+def test_rejects_max_workers(sample_character):
+    with pytest.raises(TypeError, match="max_concurrency"):
+        AsyncLLMPipelineProcessor(EchoAsyncClient(), MagicMock(), MagicMock(), max_workers=4)
+
+
+def test_block_cache_runs_off_the_event_loop(lines, sample_character):
+    loop_threads, cache_threads = set(), set()
+    cache = MagicMock(keyed_by_content=False)
+    cache.load_block.side_effect = lambda *args, **kwargs: cache_threads.add(threading.get_ident())
+    cache.save_block.side_effect = lambda *args, **kwargs: cache_threads.add(threading.get_ident())
+    processor = _processor(EchoAsyncClient(), sample_character)
+    processor.block_cache = cache
+
+    async def main():
+        loop_threads.add(threading.get_ident())
+        return await processor.aprocess(lines, work_id="w1", chapter_id="ch1")
+
+    assert len(asyncio.run(main())) == 8
+    assert cache.save_block.call_count == 8
+    assert cache_threads and not cache_threads & loop_threads
@@ -0,0 +1,43 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from openai import OpenAIError
+
+from core.models.llm import LLMMessage, LLMRole
+from adapters.llm.async_openai_client import AsyncOpenAIClient
+
+
+@pytest.fixture
+def mock_openai_response():
+    return MagicMock(
+        choices=[MagicMock(message=MagicMock(content="Resposta gerada."))],
+        usage=MagicMock(
+            prompt_tokens=10,
+            completion_tokens=20,
+            total_tokens=30
+        ),
+        to_dict=lambda: {"mock": "yes"}
+    )
+
+
+def test_async_openai_client_achat_success(mock_openai_response):
+    messages = [LLMMessage(role=LLMRole.USER, content="Qual o sentido da vida?")]
+
+    with patch("adapters.llm.async_openai_client.AsyncOpenAI") as mock_openai:
+        mock_instance = mock_openai.return_value
+        mock_instance.chat.completions.create = AsyncMock(return_value=mock_openai_response)
+        client = AsyncOpenAIClient(api_key="test")
+        response = asyncio.run(client.achat(messages))
+
+    assert response.text == "Resposta gerada."
+    assert response.usage.total_tokens == 30
+    assert mock_openai.call_args.kwargs["http_client"] is client.http_client
+
+
+def test_async_openai_client_achat_raises_runtime_error():
+    client = AsyncOpenAIClient(api_key="fake-key", model="gpt-3.5-turbo")
+    message = LLMMessage(role=LLMRole.USER, content="Teste de exceção")
+
+    with patch.object(client.client.chat.completions, "create", AsyncMock(side_effect=OpenAIError("Erro simulado"))):
+        with pytest.raises(RuntimeError, match=r"\[AsyncOpenAIClient.achat\] Error: Erro simulado"):
+            asyncio.run(client.achat([message]))
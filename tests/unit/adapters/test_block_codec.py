@@ -0,0 +1,55 @@
+import gzip
+import json
+
+import pytest
+
+from adapters.persistence import block_codec
+from adapters.persistence.block_codec import MAGIC, FORMAT_VERSION, decode_block, encode_block
+
+
+@pytest.mark.parametrize("codec", ["json", "gzip"])
+def test_roundtrip(codec, dummy_segment_dicts):
+    payload = {"fingerprint": "fp-1", "segments": dummy_segment_dicts}
+    raw = encode_block(payload, codec)
+
+    assert raw[:len(MAGIC)] == MAGIC
+    assert raw[len(MAGIC)] == FORMAT_VERSION
+    assert decode_block(raw) == payload
+
+
+def test_compact_is_smaller_than_indented(dummy_segment_dicts):
+    payload = {"fingerprint": "fp-1", "segments": dummy_segment_dicts * 20}
+    indented = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+
+    assert len(encode_block(payload, "json")) < len(indented)
+    assert len(encode_block(payload, "gzip")) < len(encode_block(payload, "json"))
+
+
+def test_gzip_output_is_deterministic(dummy_segment_dicts):
+    assert encode_block(dummy_segment_dicts, "gzip") == encode_block(dummy_segment_dicts, "gzip")
+
+
+def test_decodes_legacy_json_text(dummy_segment_dicts):
+    raw = json.dumps(dummy_segment_dicts, ensure_ascii=False, indent=2).encode("utf-8")
+    assert decode_block(raw) == dummy_segment_dicts
+
+
+@pytest.mark.parametrize("raw", [
+    MAGIC,
+    MAGIC + bytes((FORMAT_VERSION + 1, 0)) + b"{}",
+    MAGIC + bytes((FORMAT_VERSION, 99)) + b"{}",
+    MAGIC + bytes((FORMAT_VERSION, 1)) + gzip.compress(b'{"segments": [')[:-4],
+    b'{"segments": [',
+])
+def test_invalid_blocks_raise_value_error(raw):
+    with pytest.raises(ValueError):
+        decode_block(raw)
+
+
+def test_unknown_or_unavailable_codec(monkeypatch):
+    with pytest.raises(ValueError):
+        encode_block([], "lz4")
+
+    monkeypatch.setattr(block_codec, "zstandard", None)
+    with pytest.raises(ValueError, match="zstandard"):
+        encode_block([], "zstd")
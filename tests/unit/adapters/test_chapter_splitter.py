@@ -0,0 +1,71 @@
+import pytest
+
+from adapters.loaders.chapter_splitter import ChapterSplitter
+from adapters.loaders.file_text_loader import FileTextLoader
+
+
+@pytest.fixture
+def dump(tmp_path):
+    content = (
+        "Sinopse da obra\n"
+        "\n"
+        "第1章 重生\n"
+        "Primeira linha do capítulo 1\n"
+        "\n"
+        "Segunda linha do capítulo 1\n"
+        "第二章 觉醒\r\n"
+        "Linha única do capítulo 2\r\n"
+        "Chapter 3: The End\n"
+        "Última linha"
+    )
+    file = tmp_path / "dump.txt"
+    file.write_bytes(content.encode("utf-8"))
+    return file
+
+
+def test_splits_chapters_with_relative_numbering(dump):
+    chapters = list(ChapterSplitter().iter_chapters(str(dump)))
+
+    assert [c.title for c in chapters] == [None, "第1章 重生", "第二章 觉醒", "Chapter 3: The End"]
+    assert [c.index for c in chapters] == [0, 1, 2, 3]
+
+    first = list(chapters[1].lines())
+    assert [(l.line_number, l.original_text) for l in first] == [
+        (0, "Primeira linha do capítulo 1"),
+        (2, "Segunda linha do capítulo 1"),
+    ]
+    assert [l.original_text for l in chapters[2].lines()] == ["Linha única do capítulo 2"]
+    assert [l.original_text for l in chapters[3].lines()] == ["Última linha"]
+
+
+def test_chapter_lines_match_small_read_sizes(dump):
+    splitter = ChapterSplitter(loader=FileTextLoader(read_size=3))
+    chapters = list(splitter.iter_chapters(str(dump)))
+    assert [l.original_text for l in chapters[1].lines()][1] == "Segunda linha do capítulo 1"
+
+
+def test_blank_front_matter_is_skipped_and_custom_patterns(tmp_path):
+    file = tmp_path / "custom.txt"
+    file.write_text("\n\n=== Parte A ===\ntexto a\n=== Parte B ===\ntexto b\n", encoding="utf-8")
+
+    chapters = list(ChapterSplitter([r"=== Parte \w+ ==="]).iter_chapters(str(file)))
+
+    assert [c.title for c in chapters] == ["=== Parte A ===", "=== Parte B ==="]
+    assert [c.index for c in chapters] == [0, 1]
+    assert [l.original_text for l in chapters[1].lines()] == ["texto b"]
+
+
+def test_file_without_headings_is_a_single_chapter(tmp_path):
+    file = tmp_path / "plain.txt"
+    file.write_text("uma\nduas\n", encoding="utf-8")
+
+    chapters = list(ChapterSplitter().iter_chapters(str(file)))
+
+    assert len(chapters) == 1 and chapters[0].title is None
+    assert [l.line_number for l in chapters[0].lines()] == [0, 1]
+
+
+def test_empty_file(tmp_path):
+    file = tmp_path / "empty.txt"
+    file.write_bytes(b"")
+    assert list(ChapterSplitter().iter_chapters(str(file))) == []
@@ -0,0 +1,56 @@
+import json
+from unittest.mock import MagicMock
+
+from core.enums import LLMRole
+from core.models.line import Line
+from core.models.llm import LLMMessage, LLMResponse
+from adapters.analyzer.llm_pipeline_processor import LLMPipelineProcessor
+from adapters.persistence.content_block_cache import ContentAddressedBlockCache
+
+
+def test_content_cache_roundtrip_ignores_location(tmp_path, dummy_segment_dicts):
+    cache = ContentAddressedBlockCache(tmp_path)
+    cache.save_block("w1", "ch1", 0, dummy_segment_dicts, fingerprint="abc123")
+
+    assert cache.load_block("w2", "ch9", 7, fingerprint="abc123") == dummy_segment_dicts
+    assert cache.load_block("w1", "ch1", 0, fingerprint="other") is None
+    assert cache.load_block("w1", "ch1", 0) is None
+
+
+def test_content_cache_skips_save_without_fingerprint(tmp_path, dummy_segment_dicts):
+    cache = ContentAddressedBlockCache(tmp_path)
+    cache.save_block("w1", "ch1", 0, dummy_segment_dicts)
+    assert not (tmp_path / "blocks" / "content").exists()
+
+
+def test_processor_reuses_identical_blocks_across_chapters(tmp_path, sample_character):
+    llm = MagicMock(model="gpt-4o")
+    llm.chat.side_effect = lambda messages, **kwargs: LLMResponse(text=json.dumps({"segments": [{
+        "segment_index": 0,
+        "line_number": 0,
+        "text": "Boilerplate",
+        "translated_text": "Boilerplate",
+        "segment_type": "narration",
+        "speaker": "Narrador"
+    }]}))
+    template = MagicMock()
+    template.parse_segments.side_effect = lambda segments, lines: segments
+    template.response_schema = None
+    template.build_messages.side_effect = lambda payload: [
+        LLMMessage(role=LLMRole.USER, content=json.dumps(payload))
+    ]
+    repo = MagicMock()
+    repo.upsert.return_value = sample_character
+    processor = LLMPipelineProcessor(
+        llm, template, repo, block_cache=ContentAddressedBlockCache(tmp_path)
+    )
+    lines = [Line(original_text="Boilerplate", line_number=0)]
+
+    processor.process(lines, work_id="w1", chapter_id="ch1")
+    processor.process(lines, work_id="w1", chapter_id="ch2")
+    processor.process(lines)
+    assert llm.chat.call_count == 1
+
+    processor.temperature = 0.9
+    processor.process(lines)
+    assert llm.chat.call_count == 2
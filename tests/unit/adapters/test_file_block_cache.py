@@ -0,0 +1,59 @@
+import json
+
+from adapters.persistence.block_codec import MAGIC
+from adapters.persistence.file_block_cache import FileBlockCache
+
+
+def test_roundtrip_with_fingerprint(tmp_path, dummy_segment_dicts):
+    cache = FileBlockCache(tmp_path)
+    cache.save_block("w1", "ch1", 0, dummy_segment_dicts, fingerprint="fp-1")
+
+    assert cache.load_block("w1", "ch1", 0, fingerprint="fp-1") == dummy_segment_dicts
+    assert cache.load_block("w1", "ch1", 0) == dummy_segment_dicts
+
+
+def test_stale_fingerprint_is_a_miss(tmp_path, dummy_segment_dicts):
+    cache = FileBlockCache(tmp_path)
+    cache.save_block("w1", "ch1", 0, dummy_segment_dicts, fingerprint="fp-1")
+
+    assert cache.load_block("w1", "ch1", 0, fingerprint="fp-2") is None
+    assert cache.load_block("w1", "ch1", 1) is None
+
+
+def test_legacy_list_files(tmp_path, dummy_segment_dicts):
+    path = tmp_path / "blocks" / "w1" / "ch1" / "block_0.json"
+    path.parent.mkdir(parents=True)
+    path.write_text(json.dumps(dummy_segment_dicts), encoding="utf-8")
+    cache = FileBlockCache(tmp_path)
+
+    assert cache.load_block("w1", "ch1", 0) == dummy_segment_dicts
+    # Sem fingerprint gravado, não há como garantir que o bloco está atualizado.
+    assert cache.load_block("w1", "ch1", 0, fingerprint="fp-1") is None
+
+
+def test_saves_compact_file_and_replaces_legacy(tmp_path, dummy_segment_dicts):
+    legacy = tmp_path / "blocks" / "w1" / "ch1" / "block_0.json"
+    legacy.parent.mkdir(parents=True)
+    legacy.write_text(json.dumps(dummy_segment_dicts), encoding="utf-8")
+    cache = FileBlockCache(tmp_path)
+
+    cache.save_block("w1", "ch1", 0, dummy_segment_dicts, fingerprint="fp-1")
+
+    assert not legacy.exists()
+    assert legacy.with_suffix(".blk").read_bytes().startswith(MAGIC)
+    assert cache.load_block("w1", "ch1", 0, fingerprint="fp-1") == dummy_segment_dicts
+
+
+def test_uncompressed_codec_is_readable_by_default_cache(tmp_path, dummy_segment_dicts):
+    FileBlockCache(tmp_path, codec="json").save_block("w1", "ch1", 0, dummy_segment_dicts, fingerprint="fp-1")
+
+    assert FileBlockCache(tmp_path).load_block("w1", "ch1", 0, fingerprint="fp-1") == dummy_segment_dicts
+
+
+def test_corrupted_block_is_a_miss(tmp_path, dummy_segment_dicts):
+    cache = FileBlockCache(tmp_path)
+    cache.save_block("w1", "ch1", 0, dummy_segment_dicts)
+    path = tmp_path / "blocks" / "w1" / "ch1" / "block_0.blk"
+    path.write_bytes(path.read_bytes()[:-8])
+
+    assert cache.load_block("w1", "ch1", 0) is None
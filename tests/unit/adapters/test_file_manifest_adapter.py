@@ -0,0 +1,96 @@
+import json
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from adapters.persistence.file_manifest_adapter import FileManifestAdapter
+from core.utils.file_utils import file_lock
+
+
+def _add_chapter(store_dir, chapter_id):
+    FileManifestAdapter(store_dir).update(
+        "w1", lambda m: m.setdefault("chapters", {}).__setitem__(chapter_id, {"checksum": chapter_id})
+    )
+
+
+def _save_chapter(store_dir, chapter_id):
+    FileManifestAdapter(store_dir, compact_every=5).save_chapter("w1", chapter_id, {"checksum": chapter_id})
+
+
+def test_update_persists_mutation(tmp_path):
+    adapter = FileManifestAdapter(tmp_path)
+    adapter.save("w1", {"chapters": {"000": {"checksum": "a"}}})
+
+    result = adapter.update("w1", lambda m: m["chapters"].__setitem__("001", {"checksum": "b"}))
+
+    assert sorted(result["chapters"]) == ["000", "001"]
+    assert sorted(adapter.load("w1")["chapters"]) == ["000", "001"]
+
+
+def test_corrupted_manifest_loads_empty(tmp_path):
+    path = tmp_path / "w1" / "manifest.json"
+    path.parent.mkdir()
+    path.write_text('{"chapters": {"000"', encoding="utf-8")
+
+    assert FileManifestAdapter(tmp_path).load("w1") == {"chapters": {}}
+
+
+def test_concurrent_updates_from_processes_are_not_lost(tmp_path):
+    chapter_ids = [f"{i:03d}" for i in range(24)]
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        list(pool.map(_add_chapter, [tmp_path] * len(chapter_ids), chapter_ids))
+
+    data = json.loads((tmp_path / "w1" / "manifest.json").read_text(encoding="utf-8"))
+    assert sorted(data["chapters"]) == chapter_ids
+
+
+def test_save_chapter_appends_to_journal_without_rewriting_manifest(tmp_path):
+    adapter = FileManifestAdapter(tmp_path, compact_every=3)
+    adapter.save("w1", {"chapters": {"000": {"checksum": "a"}}})
+    manifest_path = tmp_path / "w1" / "manifest.json"
+    before = manifest_path.read_text(encoding="utf-8")
+
+    adapter.save_chapter("w1", "001", {"checksum": "b"})
+    adapter.save_chapter("w1", "000", {"checksum": "c"})
+
+    assert manifest_path.read_text(encoding="utf-8") == before
+    assert adapter.load("w1") == {"chapters": {"000": {"checksum": "c"}, "001": {"checksum": "b"}}}
+
+    adapter.save_chapter("w1", "002", {"checksum": "d"})
+
+    assert not (tmp_path / "w1" / "manifest.journal.jsonl").exists()
+    assert sorted(json.loads(manifest_path.read_text(encoding="utf-8"))["chapters"]) == ["000", "001", "002"]
+
+
+def test_truncated_journal_line_is_ignored(tmp_path):
+    adapter = FileManifestAdapter(tmp_path)
+    adapter.save_chapter("w1", "000", {"checksum": "a"})
+    journal = tmp_path / "w1" / "manifest.journal.jsonl"
+    with journal.open("a", encoding="utf-8") as f:
+        f.write('{"chapter_id": "001", "ent')
+
+    adapter.save_chapter("w1", "002", {"checksum": "c"})
+
+    assert sorted(adapter.load("w1")["chapters"]) == ["000", "002"]
+
+
+def test_concurrent_save_chapter_from_processes(tmp_path):
+    chapter_ids = [f"{i:03d}" for i in range(24)]
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        list(pool.map(_save_chapter, [tmp_path] * len(chapter_ids), chapter_ids))
+
+    assert sorted(FileManifestAdapter(tmp_path).load("w1")["chapters"]) == chapter_ids
+
+
+def test_save_waits_for_the_manifest_lock(tmp_path):
+    adapter = FileManifestAdapter(tmp_path)
+    adapter.save_chapter("w1", "000", {"checksum": "a"})
+    saver = threading.Thread(target=adapter.save, args=("w1", {"chapters": {"001": {"checksum": "b"}}}))
+
+    with file_lock(tmp_path / "w1" / "manifest.json"):
+        saver.start()
+        saver.join(timeout=0.2)
+        assert saver.is_alive()
+        assert (tmp_path / "w1" / "manifest.journal.jsonl").exists()
+    saver.join()
+
+    assert adapter.load("w1") == {"chapters": {"001": {"checksum": "b"}}}
@@ -0,0 +1,30 @@
+from adapters.persistence.file_scenario_registry_adapter import FileScenarioRegistryAdapter
+
+
+def test_load_missing_registry_is_empty(tmp_path):
+    assert len(FileScenarioRegistryAdapter(tmp_path).load("w1")) == 0
+
+
+def test_update_persists_registry(tmp_path):
+    adapter = FileScenarioRegistryAdapter(tmp_path)
+    adapter.update("w1", lambda reg: reg.merge([{"location": "Rua", "text": "Uma rua molhada."}], "001"))
+    adapter.update("w1", lambda reg: reg.merge([{"location": "Praça", "text": "Uma praça."}], "002"))
+
+    registry = adapter.load("w1")
+    assert registry.known_locations() == ["Rua", "Praça"]
+    assert (tmp_path / "w1" / "scenarios.json").exists()
+
+
+def test_corrupted_registry_loads_empty(tmp_path):
+    path = tmp_path / "w1" / "scenarios.json"
+    path.parent.mkdir()
+    path.write_text("{", encoding="utf-8")
+
+    assert len(FileScenarioRegistryAdapter(tmp_path).load("w1")) == 0
+
+
+def test_loaded_registry_keeps_description_limit(tmp_path):
+    adapter = FileScenarioRegistryAdapter(tmp_path, max_description_chars=40)
+    adapter.update("w1", lambda reg: reg.merge([{"location": "Rua", "text": "Uma rua molhada."}], "001"))
+
+    assert adapter.load("w1").max_description_chars == 40
@@ -1,3 +1,4 @@
+import logging
 import pytest
 from pathlib import Path
 from adapters.loaders.file_text_loader import FileTextLoader
@@ -39,3 +40,72 @@ def test_file_text_loader_fallback(tmp_path):
 
     assert line.original_text == "ÿ"
     assert line.line_number == 0
+
+
+@pytest.mark.parametrize("read_size", [1, 2, 3, 7, 4096])
+def test_iter_lines_matches_whole_file_split(tmp_path, read_size):
+    content = "Primeira linha\r\n\r\nSegunda — ação\rTerceira 日本語\n\n  \nÚltima sem quebra"
+    file = tmp_path / "chunks.txt"
+    file.write_bytes(content.encode("utf-8"))
+
+    lines = list(FileTextLoader(read_size=read_size).iter_lines(str(file)))
+
+    expected = [(i, t) for i, t in enumerate(content.splitlines()) if t.strip()]
+    assert [(l.line_number, l.original_text) for l in lines] == expected
+
+
+def test_iter_lines_is_lazy(tmp_path):
+    file = tmp_path / "big.txt"
+    file.write_text("".join(f"Linha {i}\n" for i in range(1000)), encoding="utf-8")
+
+    iterator = FileTextLoader(read_size=16).iter_lines(str(file))
+    assert next(iterator).original_text == "Linha 0"
+    assert next(iterator).line_number == 1
+
+
+def test_detect_encoding_uses_bounded_prefix(tmp_path, monkeypatch, caplog):
+    file = tmp_path / "latin.txt"
+    file.write_bytes("ação\n".encode("utf-8") * 10 + "coração\n".encode("cp1252"))
+    seen = []
+    monkeypatch.setattr(
+        "adapters.loaders.file_text_loader.chardet.detect",
+        lambda data: seen.append(len(data)) or {"encoding": "ISO-8859-1", "confidence": 0.7}
+    )
+
+    loader = FileTextLoader(sniff_bytes=16)
+    assert loader.detect_encoding(file) == "utf-8"
+    assert seen == []
+
+    with caplog.at_level(logging.WARNING, logger="adapters.loaders.file_text_loader"):
+        lines = loader.load(str(file))
+    assert [line.original_text for line in lines] == ["ação"] * 10 + ["coração"]
+    assert "Linha 10 inválida em utf-8" in caplog.text
+
+
+def test_detect_encoding_utf8_bom(tmp_path):
+    file = tmp_path / "bom.txt"
+    file.write_bytes(b"\xef\xbb\xbfLinha")
+    loader = FileTextLoader()
+    assert loader.detect_encoding(file) == "utf-8-sig"
+    assert loader.load(str(file))[0].original_text == "Linha"
+
+
+@pytest.mark.parametrize("encoding", ["utf-8-sig", "utf-16"])
+@pytest.mark.parametrize("read_size", [1, 5, 4096])
+def test_iter_lines_with_bom_encodings(tmp_path, encoding, read_size):
+    content = "Primeira — ação\r\nSegunda 日本語\rTerceira"
+    file = tmp_path / "bom.txt"
+    file.write_bytes(content.encode(encoding))
+
+    lines = list(FileTextLoader(read_size=read_size).iter_lines(str(file)))
+
+    assert [l.original_text for l in lines] == content.splitlines()
+
+
+def test_invalid_line_is_redetected_across_chunks(tmp_path):
+    file = tmp_path / "mixed.txt"
+    file.write_bytes("Linha um\n".encode("utf-8") + "coração\r\n".encode("cp1252") + "fim — ok".encode("utf-8"))
+
+    lines = FileTextLoader(sniff_bytes=9, read_size=3).load(str(file))
+
+    assert [(l.line_number, l.original_text) for l in lines] == [(0, "Linha um"), (1, "coração"), (2, "fim — ok")]
@@ -0,0 +1,70 @@
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from adapters.extractor.incremental_scenario_extractor import IncrementalScenarioExtractor
+from adapters.persistence.file_scenario_registry_adapter import FileScenarioRegistryAdapter
+from adapters.prompts.incremental_scenario_prompt import IncrementalScenarioPrompt
+from core.enums import SegmentType
+from core.models.chapter import Chapter
+from core.models.line import Line
+from core.models.llm import LLMResponse
+from core.models.segment import Segment
+
+
+def _chapter(chapter_id, narration):
+    segment = Segment(
+        segment_index=0, line_number=0, text="x", translated_text=narration,
+        segment_type=SegmentType.NARRATION
+    )
+    return Chapter(id=chapter_id, work_id="w1", title=chapter_id, lines=[Line(original_text="x", segments=[segment])])
+
+
+def _response(*scenarios):
+    return LLMResponse(text=json.dumps({"scenarios": list(scenarios)}))
+
+
+def test_second_chapter_sends_known_locations_and_merges(tmp_path):
+    client = Mock()
+    client.chat.side_effect = [
+        _response({"location": "Colégio Zhicai", "text": "Um colégio antigo.", "characters": ["Ye Hong"]}),
+        _response(
+            {"location": "Colégio Zhicai", "text": "Tem um lago no pátio."},
+            {"location": "Rua Leste", "text": "Uma rua estreita."}
+        ),
+    ]
+    registry = FileScenarioRegistryAdapter(tmp_path)
+    extractor = IncrementalScenarioExtractor(client, IncrementalScenarioPrompt(), registry)
+
+    extractor.extract(_chapter("001", "Ye Hong chega ao colégio."))
+    scenarios = extractor.extract(_chapter("002", "Ye Hong sai para a rua."))
+
+    first_messages = client.chat.call_args_list[0].args[0]
+    second_messages = client.chat.call_args_list[1].args[0]
+    assert len(first_messages) == 2
+    assert json.loads(second_messages[1].content.split(": ", 1)[1]) == ["Colégio Zhicai"]
+    assert second_messages[-1].content == "Ye Hong sai para a rua."
+
+    assert [(sc.index, sc.location) for sc in scenarios] == [(0, "Colégio Zhicai"), (1, "Rua Leste")]
+    assert scenarios[0].text == "Um colégio antigo. Tem um lago no pátio."
+    assert registry.load("w1").chapters_for("Colégio Zhicai") == ["001", "002"]
+
+
+def test_chapter_without_narration_makes_no_call(tmp_path):
+    client = Mock()
+    chapter = Chapter(id="001", work_id="w1", title="1", lines=[Line(original_text="x")])
+    extractor = IncrementalScenarioExtractor(client, IncrementalScenarioPrompt(), FileScenarioRegistryAdapter(tmp_path))
+
+    assert extractor.extract(chapter) == []
+    client.chat.assert_not_called()
+
+
+def test_invalid_response_raises(tmp_path):
+    client = Mock()
+    client.chat.return_value = LLMResponse(text='{"scenarios": ["Rua"]}')
+    extractor = IncrementalScenarioExtractor(client, IncrementalScenarioPrompt(), FileScenarioRegistryAdapter(tmp_path))
+
+    with pytest.raises(ValueError):
+        extractor.extract(_chapter("001", "Uma rua."))
+    assert len(FileScenarioRegistryAdapter(tmp_path).load("w1")) == 0
@@ -2,11 +2,17 @@ import pytest
 import json
 from unittest.mock import MagicMock
 
-from core.enums import LLMRole
+from core.enums import LLMRole, SegmentType, EmotionType
+from core.interfaces.llm import BlockProcessingError
 from core.models.line import Line
 from core.models.llm import LLMMessage, LLMResponse
 
-from adapters.analyzer.llm_pipeline_processor import LLMPipelineProcessor
+from adapters.analyzer.llm_pipeline_processor import LLMPipelineProcessor, is_truncated
+from adapters.persistence.file_block_cache import FileBlockCache
+from adapters.persistence.sqlite_store import SQLiteBlockCache, SQLiteDatabase
+from adapters.prompts.compact_pipeline_prompt import CompactPipelinePrompt
+from adapters.prompts.pipeline_prompt import PipelinePrompt
+from core.utils import tokens
 
 
 @pytest.fixture
@@ -16,10 +22,21 @@ def fake_lines():
         Line(original_text="Texto 2", line_number=1),
     ]
 
+def _echo_messages(payload):
+    """
+    Mensagens do template falso: o payload do bloco em JSON, para que os
+    clientes falsos saibam quais linhas receberam.
+    """
+    return [LLMMessage(role=LLMRole.USER, content=json.dumps(payload))]
+
+
 @pytest.fixture
 def processor(sample_character):
     llm_client = MagicMock()
     prompt_template = MagicMock()
+    prompt_template.build_messages.side_effect = _echo_messages
+    prompt_template.parse_segments.side_effect = lambda segments, lines: segments
+    prompt_template.response_schema = None
     character_repo = MagicMock()
     character_repo.upsert.return_value = sample_character
 
@@ -31,7 +48,6 @@ def processor(sample_character):
     )
 
 def test_process_basic_success(processor, fake_lines, sample_character):
-    processor.template.build_messages.return_value = [LLMMessage(role=LLMRole.USER, content="msg")]
     response_text = json.dumps({
         "segments": [
             {
@@ -62,7 +78,6 @@ def test_process_basic_success(processor, fake_lines, sample_character):
 
 
 def test_process_with_metadata(processor, fake_lines):
-    processor.template.build_messages.return_value = [LLMMessage(role=LLMRole.USER, content="msg")]
     response_text = json.dumps({"segments": []})
     processor.llm.chat.return_value = LLMResponse(text=response_text)
 
@@ -71,16 +86,460 @@ def test_process_with_metadata(processor, fake_lines):
 
 
 def test_process_invalid_json(processor, fake_lines):
-    processor.template.build_messages.return_value = [LLMMessage(role=LLMRole.USER, content="msg")]
     processor.llm.chat.return_value = LLMResponse(text="{not a valid json")
 
-    with pytest.raises(json.JSONDecodeError):
+    with pytest.raises(BlockProcessingError) as exc_info:
         processor.process(fake_lines)
+    assert isinstance(exc_info.value.failures[0], json.JSONDecodeError)
 
 
 def test_llm_exception_is_raised(processor, fake_lines):
-    processor.template.build_messages.return_value = [LLMMessage(role=LLMRole.USER, content="msg")]
     processor.llm.chat.side_effect = RuntimeError("LLM error")
 
     with pytest.raises(RuntimeError):
         processor.process(fake_lines)
+
+
+# ---------- Concurrent dispatch ----------
+
+def _segment_json(line_number: int, speaker: str = "Narrador") -> str:
+    return json.dumps({
+        "segments": [
+            {
+                "segment_index": 0,
+                "line_number": line_number,
+                "text": f"Texto {line_number}",
+                "translated_text": f"Texto {line_number}",
+                "segment_type": "narration",
+                "speaker": speaker,
+                "character_type": "narrator",
+                "gender": "unknown"
+            }
+        ]
+    })
+
+
+@pytest.fixture
+def many_lines():
+    return [Line(original_text=f"Texto {i}", line_number=i) for i in range(6)]
+
+
+def _echo_llm(messages, **kwargs):
+    payload = json.loads(messages[0].content)
+    return LLMResponse(text=_segment_json(payload["lines"][0]["line_number"]))
+
+
+def test_process_concurrent_keeps_deterministic_order(processor, many_lines):
+    processor.max_workers = 3
+    processor.llm.chat.side_effect = _echo_llm
+
+    segments = processor.process(many_lines, chunk_size=1)
+
+    assert [s.line_number for s in segments] == list(range(6))
+    assert processor.llm.chat.call_count == 6
+
+
+def test_process_concurrent_keeps_successful_blocks(processor, many_lines):
+    processor.max_workers = 3
+
+    def flaky(messages, **kwargs):
+        payload = json.loads(messages[0].content)
+        if payload["lines"][0]["line_number"] == 2:
+            raise RuntimeError("LLM error")
+        return _echo_llm(messages, **kwargs)
+
+    processor.llm.chat.side_effect = flaky
+
+    with pytest.raises(BlockProcessingError) as exc_info:
+        processor.process(many_lines, chunk_size=2)
+
+    error = exc_info.value
+    assert list(error.failures) == [1]
+    assert isinstance(error.failures[1], RuntimeError)
+    assert [s.line_number for s in error.segments] == [0, 4]
+
+
+def test_process_sequential_keeps_successful_blocks(processor, many_lines):
+    def flaky(messages, **kwargs):
+        payload = json.loads(messages[0].content)
+        if payload["lines"][0]["line_number"] == 2:
+            raise RuntimeError("LLM error")
+        return _echo_llm(messages, **kwargs)
+
+    processor.llm.chat.side_effect = flaky
+
+    with pytest.raises(BlockProcessingError) as exc_info:
+        processor.process(many_lines, chunk_size=2)
+
+    error = exc_info.value
+    assert list(error.failures) == [1]
+    assert [s.line_number for s in error.segments] == [0, 4]
+    assert processor.llm.chat.call_count == 3
+
+
+def test_processor_rejects_invalid_max_workers():
+    with pytest.raises(ValueError):
+        LLMPipelineProcessor(MagicMock(), MagicMock(), MagicMock(), max_workers=0)
+
+
+# ---------- Block cache ----------
+
+def test_process_resumes_from_block_cache(processor, many_lines, tmp_path):
+    processor.block_cache = FileBlockCache(tmp_path)
+
+    def crash_on_third_block(messages, **kwargs):
+        payload = json.loads(messages[0].content)
+        if payload["lines"][0]["line_number"] == 4:
+            raise RuntimeError("LLM error")
+        return _echo_llm(messages, **kwargs)
+
+    processor.llm.chat.side_effect = crash_on_third_block
+    with pytest.raises(RuntimeError):
+        processor.process(many_lines, chunk_size=2, work_id="w1", chapter_id="ch1")
+    assert processor.llm.chat.call_count == 3
+
+    processor.llm.chat.reset_mock()
+    processor.llm.chat.side_effect = _echo_llm
+    segments = processor.process(many_lines, chunk_size=2, work_id="w1", chapter_id="ch1")
+
+    assert [s.line_number for s in segments] == [0, 2, 4]
+    assert processor.llm.chat.call_count == 1
+
+
+def test_process_does_not_cache_segments_that_fail_to_build(processor, many_lines, tmp_path):
+    processor.block_cache = FileBlockCache(tmp_path)
+    processor.split_on_failure = False
+    blank = json.loads(_segment_json(0))
+    blank["segments"][0]["text"] = "   "
+    processor.llm.chat.return_value = LLMResponse(text=json.dumps(blank))
+
+    with pytest.raises(BlockProcessingError):
+        processor.process(many_lines[:1], chunk_size=1, work_id="w1", chapter_id="ch1")
+
+    processor.llm.chat.side_effect = _echo_llm
+    segments = processor.process(many_lines[:1], chunk_size=1, work_id="w1", chapter_id="ch1")
+
+    assert [s.text for s in segments] == ["Texto 0"]
+    assert processor.llm.chat.call_count == 2
+
+
+def test_invalid_cached_block_is_reprocessed(processor, many_lines):
+    processor.block_cache = MagicMock(keyed_by_content=False)
+    processor.block_cache.load_block.return_value = [{"line_number": 0, "segment_index": 0, "text": " "}]
+    processor.llm.chat.side_effect = _echo_llm
+
+    segments = processor.process(many_lines[:1], chunk_size=1, work_id="w1", chapter_id="ch1")
+
+    assert [s.line_number for s in segments] == [0]
+    processor.llm.chat.assert_called_once()
+    processor.block_cache.save_block.assert_called_once()
+
+
+def test_process_batches_cache_writes_per_chapter(processor, many_lines, tmp_path):
+    database = SQLiteDatabase(tmp_path / "store.sqlite3")
+    processor.block_cache = SQLiteBlockCache(database)
+    saved_during_process = []
+
+    def echo_and_peek(messages, **kwargs):
+        saved_during_process.append(processor.block_cache.list_block_indexes("w1", "ch1"))
+        return _echo_llm(messages, **kwargs)
+
+    processor.llm.chat.side_effect = echo_and_peek
+    processor.process(many_lines, chunk_size=2, work_id="w1", chapter_id="ch1")
+
+    assert saved_during_process == [[], [], []]
+    assert processor.block_cache.list_block_indexes("w1", "ch1") == [0, 1, 2]
+    database.close()
+
+
+def test_process_without_ids_skips_block_cache(processor, fake_lines):
+    processor.block_cache = MagicMock(keyed_by_content=False)
+    processor.llm.chat.return_value = LLMResponse(text=json.dumps({"segments": []}))
+
+    processor.process(fake_lines)
+
+    processor.block_cache.load_block.assert_not_called()
+    processor.block_cache.save_block.assert_not_called()
+
+
+# ---------- Token budget ----------
+
+def test_process_packs_blocks_by_token_budget(monkeypatch, sample_character):
+    monkeypatch.setattr(tokens, "_encoder_for", lambda model: None)
+    repo = MagicMock()
+    repo.upsert.return_value = sample_character
+    llm = MagicMock()
+    llm.chat.return_value = LLMResponse(text=json.dumps({"segments": []}))
+    processor = LLMPipelineProcessor(
+        llm, PipelinePrompt(), repo,
+        chunk_size=1, max_input_tokens=2000, max_tokens=400, output_ratio=2.0
+    )
+    short = [Line(original_text="abcd" * 4, line_number=i) for i in range(6)]
+    long = [Line(original_text="abcd" * 200, line_number=6)]
+
+    blocks = processor._make_blocks(short + long, None, None)
+
+    # saída estimada por linha curta: 2.0 * 4 + 70 = 78 tokens → 5 linhas por bloco de 400
+    assert [len(b) for b in blocks] == [5, 1, 1]
+    processor.process(short + long)
+    assert llm.chat.call_count == 3
+
+
+# ---------- Split-and-retry ----------
+
+def _truncated_if_many_lines(messages, **kwargs):
+    payload = json.loads(messages[0].content)
+    if len(payload["lines"]) > 1:
+        return LLMResponse(
+            text='{"segments": [{"segment_index": 0, "line_num',
+            raw={"choices": [{"finish_reason": "length"}]}
+        )
+    return _echo_llm(messages, **kwargs)
+
+
+def test_process_splits_truncated_blocks(processor, many_lines):
+    processor.llm.chat.side_effect = _truncated_if_many_lines
+
+    segments = processor.process(many_lines[:4], chunk_size=4)
+
+    assert [s.line_number for s in segments] == [0, 1, 2, 3]
+    # 1 bloco de 4 + 2 metades de 2 + 4 linhas isoladas
+    assert processor.llm.chat.call_count == 7
+
+
+def test_process_split_disabled_raises(processor, many_lines):
+    processor.split_on_failure = False
+    processor.llm.chat.side_effect = _truncated_if_many_lines
+
+    with pytest.raises(BlockProcessingError) as exc_info:
+        processor.process(many_lines[:4], chunk_size=4)
+    assert isinstance(exc_info.value.__cause__, json.JSONDecodeError)
+    assert processor.llm.chat.call_count == 1
+
+
+def test_is_truncated():
+    assert is_truncated(LLMResponse(text="x", raw={"choices": [{"finish_reason": "length"}]}))
+    assert not is_truncated(LLMResponse(text="x", raw={"choices": [{"finish_reason": "stop"}]}))
+    assert not is_truncated(LLMResponse(text="x"))
+
+
+# ---------- Streaming ----------
+
+def _stream_echo(messages, **kwargs):
+    payload = json.loads(messages[0].content)
+    segments = json.loads(_segment_json(0))["segments"][0]
+    text = json.dumps({"segments": [
+        dict(segments, line_number=line["line_number"], text=line["text"], translated_text=line["text"])
+        for line in payload["lines"]
+    ]})
+    return iter([text[i:i + 8] for i in range(0, len(text), 8)])
+
+
+def test_iter_process_yields_segments_before_stream_ends(processor, many_lines):
+    consumed = []
+
+    def tracking_stream(messages, **kwargs):
+        for chunk in _stream_echo(messages, **kwargs):
+            consumed.append(chunk)
+            yield chunk
+
+    processor.llm.stream_chat.side_effect = tracking_stream
+
+    stream = processor.iter_process(many_lines[:3], chunk_size=3)
+    first = next(stream)
+    chunks_for_first = len(consumed)
+    rest = list(stream)
+
+    # A linha 0 sai assim que a linha 1 começa, antes do fim do stream.
+    assert first.line_number == 0
+    assert [s.line_number for s in rest] == [1, 2]
+    assert chunks_for_first < len(consumed)
+    processor.llm.chat.assert_not_called()
+
+
+def test_iter_process_recovers_interrupted_stream(processor, many_lines):
+    def truncated_stream(messages, **kwargs):
+        text = "".join(_stream_echo(messages, **kwargs))
+        cut = text.index('"line_number": 2')
+        yield text[:cut]
+
+    processor.llm.stream_chat.side_effect = truncated_stream
+    processor.llm.chat.side_effect = lambda messages, **kwargs: LLMResponse(text="".join(_stream_echo(messages)))
+
+    segments = list(processor.iter_process(many_lines[:4], chunk_size=4))
+
+    assert [s.line_number for s in segments] == [0, 1, 2, 3]
+    # A linha 1 é reenviada junto com as linhas não cobertas, mas não duplicada.
+    resent = json.loads(processor.llm.chat.call_args.kwargs["messages"][0].content)["lines"]
+    assert [line["line_number"] for line in resent] == [1, 2, 3]
+
+
+def test_iter_process_never_mixes_answers_for_a_line(processor, many_lines, tmp_path):
+    processor.block_cache = FileBlockCache(tmp_path)
+
+    def segment(line_number, index, text):
+        return dict(json.loads(_segment_json(0))["segments"][0],
+                    line_number=line_number, segment_index=index, text=text, translated_text=text)
+
+    def broken_stream(messages, **kwargs):
+        # Linha 1 dividida em dois segmentos; o stream quebra no meio do segundo.
+        text = json.dumps({"segments": [segment(0, 0, "Texto 0"), segment(1, 0, "Texto")]})
+        yield text[:-2] + ', {"line_number": 1, "segment_index": 1, "te'
+
+    processor.llm.stream_chat.side_effect = broken_stream
+    # A nova resposta divide a linha 1 de outro jeito: um segmento só.
+    processor.llm.chat.return_value = LLMResponse(text=json.dumps({"segments": [segment(1, 0, "Texto 1")]}))
+
+    segments = list(processor.iter_process(many_lines[:2], chunk_size=2, work_id="w", chapter_id="c"))
+
+    assert [(s.line_number, s.segment_index, s.text) for s in segments] == [(0, 0, "Texto 0"), (1, 0, "Texto 1")]
+    resent = json.loads(processor.llm.chat.call_args.kwargs["messages"][0].content)["lines"]
+    assert [line["line_number"] for line in resent] == [1]
+
+    processor.llm.stream_chat.reset_mock()
+    cached = list(processor.iter_process(many_lines[:2], chunk_size=2, work_id="w", chapter_id="c"))
+    assert [(s.line_number, s.text) for s in cached] == [(0, "Texto 0"), (1, "Texto 1")]
+    processor.llm.stream_chat.assert_not_called()
+
+
+def test_iter_process_uses_and_fills_cache(processor, many_lines, tmp_path):
+    processor.block_cache = FileBlockCache(tmp_path)
+    processor.llm.stream_chat.side_effect = _stream_echo
+
+    first = list(processor.iter_process(many_lines, chunk_size=3, work_id="w", chapter_id="c"))
+    second = list(processor.iter_process(many_lines, chunk_size=3, work_id="w", chapter_id="c"))
+
+    assert [s.line_number for s in first] == [s.line_number for s in second] == list(range(6))
+    assert processor.llm.stream_chat.call_count == 2
+
+
+def test_iter_process_consumes_lines_lazily(processor, many_lines):
+    processor.llm.stream_chat.side_effect = _stream_echo
+    pulled = []
+
+    def line_source():
+        for line in many_lines:
+            pulled.append(line.line_number)
+            yield line
+
+    stream = processor.iter_process(line_source(), chunk_size=2)
+    assert next(stream).line_number == 0
+    assert pulled == [0, 1]
+    assert [s.line_number for s in stream] == [1, 2, 3, 4, 5]
+
+
+def test_process_accepts_iterables(processor, many_lines):
+    processor.llm.chat.side_effect = _echo_llm
+
+    segments = processor.process(iter(many_lines), chunk_size=1)
+    assert [s.line_number for s in segments] == list(range(6))
+
+
+def test_reprocess_resends_only_changed_blocks(processor, many_lines, tmp_path):
+    processor.block_cache = FileBlockCache(tmp_path)
+    processor.llm.chat.side_effect = _echo_llm
+    processor.process(many_lines, chunk_size=2, work_id="w", chapter_id="c")
+
+    edited = list(many_lines)
+    edited[3] = Line(original_text="Texto 3 corrigido", line_number=3)
+    processor.llm.chat.reset_mock()
+    segments = processor.process(edited, chunk_size=2, work_id="w", chapter_id="c")
+
+    assert [s.line_number for s in segments] == [0, 2, 4]
+    assert processor.llm.chat.call_count == 1
+
+
+# ---------- Resposta compacta ----------
+
+def _compact_llm(messages, **kwargs):
+    payload = json.loads(messages[-1].content)
+    return json.dumps({"segments": [
+        {"l": line["line_number"], "s": [[0, len(line["text"]), line["text"], "n", "Narrador", "n", "u", "n"]]}
+        for line in payload["lines"]
+    ]})
+
+
+def _compact_processor(sample_character):
+    repo = MagicMock()
+    repo.upsert.return_value = sample_character
+    return LLMPipelineProcessor(MagicMock(), CompactPipelinePrompt(), repo, chunk_size=3)
+
+
+def test_process_with_compact_prompt(sample_character, many_lines):
+    processor = _compact_processor(sample_character)
+    processor.llm.chat.side_effect = lambda messages, **kwargs: LLMResponse(text=_compact_llm(messages))
+
+    segments = processor.process(many_lines)
+
+    assert [s.line_number for s in segments] == [0, 1, 2, 3, 4, 5]
+    assert [s.text for s in segments] == [ln.original_text for ln in many_lines]
+
+
+def test_iter_process_with_compact_prompt(sample_character, many_lines):
+    processor = _compact_processor(sample_character)
+    processor.llm.stream_chat.side_effect = lambda messages, **kwargs: iter(_compact_llm(messages))
+
+    assert [s.line_number for s in processor.iter_process(many_lines)] == [0, 1, 2, 3, 4, 5]
+
+
+def test_invalid_compact_span_splits_block(sample_character, many_lines):
+    processor = _compact_processor(sample_character)
+
+    def bad_span_if_many_lines(messages, **kwargs):
+        text = _compact_llm(messages)
+        if len(json.loads(messages[-1].content)["lines"]) > 1:
+            text = text.replace('[[0, ', '[[90, ', 1)
+        return LLMResponse(text=text)
+
+    processor.llm.chat.side_effect = bad_span_if_many_lines
+
+    segments = processor.process(many_lines[:3])
+
+    assert [s.line_number for s in segments] == [0, 1, 2]
+    assert processor.llm.chat.call_count == 1 + 2 + 2  # bloco, metades (1 + 2 linhas), quartos
+
+
+# ---------- Structured outputs ----------
+
+def _full_segment_llm(messages, **kwargs):
+    payload = json.loads(messages[-1].content)
+    return LLMResponse(text=json.dumps({"segments": [
+        {
+            "line_number": line["line_number"], "segment_index": 0,
+            "original_text": line["text"] if len(payload["lines"]) == 1 else " ",
+            "translated_text": line["text"], "segment_type": "narration", "speaker": "Narrador",
+            "character_type": "narrator", "gender": "unknown", "emotion": "neutral",
+        }
+        for line in payload["lines"]
+    ]}))
+
+
+def test_process_sends_template_schema_and_validates(sample_character, many_lines):
+    repo = MagicMock()
+    repo.upsert.return_value = sample_character
+    processor = LLMPipelineProcessor(MagicMock(), PipelinePrompt(), repo, chunk_size=2)
+    processor.llm.chat.side_effect = _full_segment_llm
+
+    segments = processor.process(many_lines[:2])
+
+    # Texto original vazio no bloco de 2 linhas: rejeitado e dividido.
+    assert [s.line_number for s in segments] == [0, 1]
+    assert processor.llm.chat.call_count == 3
+    assert processor.llm.chat.call_args.kwargs["response_schema"] is PipelinePrompt.response_schema
+
+
+def test_schema_validation_tolerates_unknown_enum_values(sample_character, many_lines):
+    repo = MagicMock()
+    repo.upsert.return_value = sample_character
+    processor = LLMPipelineProcessor(MagicMock(), PipelinePrompt(), repo, chunk_size=2)
+    processor.llm.chat.return_value = LLMResponse(text=json.dumps({"segments": [{
+        "line_number": 0, "segment_index": 0, "original_text": "Texto 0", "translated_text": "Texto 0",
+        "segment_type": "monologue", "speaker": "Narrador", "character_type": "narrator",
+        "gender": "unknown", "emotion": "bored",
+    }]}))
+
+    segments = processor.process(many_lines[:1])
+
+    assert segments[0].segment_type == SegmentType.NARRATION
+    assert segments[0].emotion == EmotionType.NEUTRAL
+    processor.llm.chat.assert_called_once()
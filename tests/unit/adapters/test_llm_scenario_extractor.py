@@ -1,14 +1,16 @@
+import asyncio
 import pytest
 import json
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 from core.enums import SegmentType
 from core.models.segment import Segment
 from core.models.line import Line
 from core.models.chapter import Chapter
-from core.models.llm import LLMResponse
+from core.models.llm import LLMMessage, LLMResponse, LLMRole
 from core.models.scenario import Scenario
 from adapters.extractor.llm_scenario_extractor import LLMScenarioExtractor
+from adapters.extractor.async_llm_scenario_extractor import AsyncLLMScenarioExtractor
 
 
 @pytest.fixture
@@ -121,3 +123,105 @@ def test_scenarios_data_not_a_list(dummy_chapter_with_narration):
 
     with pytest.raises(ValueError, match="Esperava 'scenarios' como lista"):
         extractor.extract(dummy_chapter_with_narration)
+
+
+def test_async_extract_scenarios_success(mock_llm_client, mock_prompt_template, dummy_chapter_with_narration):
+    async_client = Mock()
+    async_client.achat = AsyncMock(return_value=mock_llm_client.chat.return_value)
+    extractor = AsyncLLMScenarioExtractor(llm_client=async_client, prompt_template=mock_prompt_template)
+
+    scenarios = asyncio.run(extractor.aextract(dummy_chapter_with_narration))
+
+    assert [sc.location for sc in scenarios] == ["Sala de Treinamento"]
+    async_client.achat.assert_awaited_once_with(["mock_message"])
+
+
+# ---------- Map-reduce ----------
+
+def _long_chapter(parts):
+    lines = [
+        Line(original_text=f"L{i}", line_number=i, segments=[Segment(
+            segment_index=0, line_number=i, text=f"L{i}", translated_text=text,
+            segment_type=SegmentType.NARRATION
+        )])
+        for i, text in enumerate(parts)
+    ]
+    return Chapter(id="ch1", work_id="w1", title="Capítulo 1", lines=lines)
+
+
+def _scenario_echo(messages):
+    text = messages[-1].content
+    location = "Colégio Zhicai" if "colégio" in text else "Rua"
+    return LLMResponse(text=json.dumps({"scenarios": [
+        {"index": 0, "text": text, "location": location, "characters": [text.split()[0]]}
+    ]}))
+
+
+def _echo_prompt(instructions="Extraia os cenários."):
+    template = Mock()
+    template.build_messages.side_effect = lambda payload: [
+        LLMMessage(role=LLMRole.SYSTEM, content=instructions),
+        LLMMessage(role=LLMRole.USER, content=payload["narration_text"]),
+    ]
+    return template
+
+
+@pytest.fixture
+def echo_prompt():
+    return _echo_prompt()
+
+
+def test_extract_map_reduce_shards_and_merges(echo_prompt):
+    chapter = _long_chapter([
+        "Ana chega ao colégio " + "pelo portão " * 10,
+        "Bruno caminha pela rua " + "molhada " * 10,
+        "Caio volta ao colégio " + "ao entardecer " * 10,
+    ])
+    client = Mock(model="gpt-4o")
+    client.chat.side_effect = _scenario_echo
+    extractor = LLMScenarioExtractor(client, echo_prompt, max_input_tokens=40, max_workers=3)
+
+    scenarios = extractor.extract(chapter)
+
+    assert client.chat.call_count == 3
+    assert [(sc.index, sc.location) for sc in scenarios] == [(0, "Colégio Zhicai"), (1, "Rua")]
+    assert scenarios[0].characters == ["Ana", "Caio"]
+
+
+def test_extract_single_call_when_narration_fits(echo_prompt):
+    chapter = _long_chapter(["Ana chega ao colégio.", "Bruno caminha pela rua."])
+    client = Mock(model="gpt-4o")
+    client.chat.side_effect = _scenario_echo
+    extractor = LLMScenarioExtractor(client, echo_prompt, max_input_tokens=1000)
+
+    extractor.extract(chapter)
+
+    assert client.chat.call_args.args[0][-1].content == "Ana chega ao colégio.\nBruno caminha pela rua."
+
+
+def test_async_extract_map_reduce(echo_prompt):
+    chapter = _long_chapter(["Ana chega ao colégio " + "x " * 30, "Caio volta ao colégio " + "y " * 30])
+    client = Mock(model="gpt-4o")
+    client.achat = AsyncMock(side_effect=_scenario_echo)
+    extractor = AsyncLLMScenarioExtractor(client, echo_prompt, max_input_tokens=40, max_concurrency=2)
+
+    scenarios = extractor.extract(chapter)
+
+    assert client.achat.await_count == 2
+    assert [sc.location for sc in scenarios] == ["Colégio Zhicai"]
+
+
+def test_extract_budget_excludes_prompt_overhead():
+    chapter = _long_chapter(["Ana chega ao colégio.", "Bruno caminha pela rua."])
+    client = Mock(model="gpt-4o")
+    client.chat.side_effect = _scenario_echo
+    extractor = LLMScenarioExtractor(client, _echo_prompt("instrução " * 40), max_input_tokens=70)
+
+    extractor.extract(chapter)
+
+    assert client.chat.call_count == 2
+
+
+def test_async_extractor_rejects_max_workers(echo_prompt):
+    with pytest.raises(TypeError):
+        AsyncLLMScenarioExtractor(Mock(), echo_prompt, max_workers=2)
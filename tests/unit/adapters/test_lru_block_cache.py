@@ -0,0 +1,88 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from adapters.persistence.content_block_cache import ContentAddressedBlockCache
+from adapters.persistence.file_block_cache import FileBlockCache
+from adapters.persistence.lru_block_cache import LRUBlockCache
+
+
+@pytest.fixture
+def inner(tmp_path):
+    return FileBlockCache(tmp_path)
+
+
+def test_repeated_loads_hit_memory(inner, dummy_segment_dicts):
+    inner.save_block("w1", "ch1", 0, dummy_segment_dicts, fingerprint="fp-1")
+    cache = LRUBlockCache(inner)
+    inner.load_block = MagicMock(wraps=inner.load_block)
+
+    for _ in range(3):
+        assert cache.load_block("w1", "ch1", 0, fingerprint="fp-1") == dummy_segment_dicts
+
+    assert inner.load_block.call_count == 1
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_write_through(inner, dummy_segment_dicts):
+    cache = LRUBlockCache(inner)
+    cache.save_block("w1", "ch1", 0, dummy_segment_dicts, fingerprint="fp-1")
+
+    assert inner.load_block("w1", "ch1", 0, fingerprint="fp-1") == dummy_segment_dicts
+    assert cache.load_block("w1", "ch1", 0, fingerprint="fp-1") == dummy_segment_dicts
+    assert cache.hits == 1
+
+
+def test_failed_inner_save_is_not_cached(dummy_segment_dicts):
+    inner = MagicMock(keyed_by_content=False)
+    inner.save_block.side_effect = OSError("disco cheio")
+    inner.load_block.return_value = None
+    cache = LRUBlockCache(inner)
+
+    with pytest.raises(OSError):
+        cache.save_block("w1", "ch1", 0, dummy_segment_dicts)
+    assert len(cache) == 0
+
+
+def test_stale_fingerprint_goes_to_inner(inner, dummy_segment_dicts):
+    cache = LRUBlockCache(inner)
+    cache.save_block("w1", "ch1", 0, dummy_segment_dicts, fingerprint="fp-1")
+
+    assert cache.load_block("w1", "ch1", 0, fingerprint="fp-2") is None
+    assert cache.misses == 1
+
+
+def test_evicts_least_recently_used(inner, dummy_segment_dicts):
+    cache = LRUBlockCache(inner, max_entries=2)
+    for i in range(3):
+        cache.save_block("w1", "ch1", i, dummy_segment_dicts)
+    assert len(cache) == 2
+
+    cache.load_block("w1", "ch1", 0)  # volta do disco e expulsa o bloco 1
+    cache.load_block("w1", "ch1", 2)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_returned_segments_are_copies(inner, dummy_segment_dicts):
+    cache = LRUBlockCache(inner)
+    cache.save_block("w1", "ch1", 0, dummy_segment_dicts)
+
+    cache.load_block("w1", "ch1", 0)[0]["original_text"] = "alterado"
+
+    assert cache.load_block("w1", "ch1", 0) == dummy_segment_dicts
+
+
+def test_content_keyed_inner(tmp_path, dummy_segment_dicts):
+    cache = LRUBlockCache(ContentAddressedBlockCache(tmp_path))
+    assert cache.keyed_by_content
+
+    cache.save_block("w1", "ch1", 0, dummy_segment_dicts, fingerprint="ab" * 32)
+
+    assert cache.load_block("w2", "ch9", 5, fingerprint="ab" * 32) == dummy_segment_dicts
+    assert cache.load_block("w1", "ch1", 0) is None
+    assert cache.hits == 1
+
+
+def test_invalid_size(inner):
+    with pytest.raises(ValueError):
+        LRUBlockCache(inner, max_entries=0)
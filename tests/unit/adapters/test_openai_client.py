@@ -1,9 +1,15 @@
+import httpx
 import pytest
 from unittest.mock import MagicMock, patch
-from openai import OpenAIError
+from openai import (
+    OpenAIError, APIConnectionError, AuthenticationError,
+    BadRequestError, InternalServerError, RateLimitError
+)
 
+from core.interfaces.llm import LLMTransientError, LLMPermanentError
 from core.models.llm import LLMMessage, LLMRole
-from adapters.llm.openai_client import OpenAIClient
+from adapters.llm.openai_client import OpenAIClient, build_llm_response, build_response_format, to_llm_error
+from adapters.prompts.response_schemas import COMPACT_PIPELINE_RESPONSE_SCHEMA, PIPELINE_RESPONSE_SCHEMA
 
 
 @pytest.fixture
@@ -56,4 +62,178 @@ def test_openai_client_without_usage():
 
     assert response.text == "Resposta"
     assert response.usage is None
-    assert isinstance(response.raw, dict)
\ No newline at end of file
+    assert isinstance(response.raw, dict)
+
+def test_openai_client_with_rate_limiter_reads_headers(mock_openai_response):
+    limiter = MagicMock()
+    raw_response = MagicMock(headers={"x-ratelimit-remaining-requests": "10"})
+    raw_response.parse.return_value = mock_openai_response
+
+    client = OpenAIClient(api_key="test-key", rate_limiter=limiter)
+    with patch.object(client.client.chat.completions.with_raw_response, "create", return_value=raw_response):
+        response = client.chat([LLMMessage(role=LLMRole.USER, content="Olá")], max_tokens=50)
+
+    assert response.text == "Resposta gerada."
+    estimated = limiter.acquire.call_args.args[0]
+    assert estimated > 50
+    limiter.update_from_headers.assert_called_once_with(raw_response.headers)
+    limiter.reconcile.assert_called_once_with(estimated, 30)
+
+
+def _status_error(cls, status, headers=None, code=None):
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(status, headers=headers or {}, request=request)
+    body = {"code": code} if code else None
+    return cls("falha", response=response, body=body)
+
+
+@pytest.mark.parametrize("error,expected", [
+    (APIConnectionError(request=httpx.Request("POST", "https://api.openai.com")), LLMTransientError),
+    (_status_error(InternalServerError, 503), LLMTransientError),
+    (_status_error(RateLimitError, 429), LLMTransientError),
+    (_status_error(RateLimitError, 429, code="insufficient_quota"), LLMPermanentError),
+    (_status_error(AuthenticationError, 401), LLMPermanentError),
+    (_status_error(BadRequestError, 400), LLMPermanentError),
+    (OpenAIError("genérico"), LLMPermanentError),
+])
+def test_to_llm_error_classifies_errors(error, expected):
+    result = to_llm_error(error, "[ctx]")
+    assert type(result) is expected
+    assert str(result).startswith("[ctx] Error:")
+
+
+def test_to_llm_error_reads_retry_after():
+    error = _status_error(RateLimitError, 429, headers={"retry-after-ms": "1500"})
+    assert to_llm_error(error, "[ctx]").retry_after == 1.5
+
+
+def _stream_chunk(content=None, usage=None):
+    choices = [MagicMock(delta=MagicMock(content=content))] if usage is None else []
+    return MagicMock(choices=choices, usage=usage)
+
+
+def test_openai_client_stream_chat_yields_deltas():
+    client = OpenAIClient(api_key="test-key", model="gpt-4o")
+    chunks = [_stream_chunk('{"seg'), _stream_chunk(None), _stream_chunk('ments": []}'),
+              _stream_chunk(usage=MagicMock(total_tokens=30))]
+
+    with patch.object(client.client.chat.completions, "create", return_value=iter(chunks)) as create:
+        text = list(client.stream_chat([LLMMessage(role=LLMRole.USER, content="Olá")]))
+
+    assert text == ['{"seg', 'ments": []}']
+    assert create.call_args.kwargs["stream"] is True
+
+
+def test_openai_client_stream_chat_converts_errors():
+    client = OpenAIClient(api_key="test-key", model="gpt-4o")
+    with patch.object(client.client.chat.completions, "create", side_effect=OpenAIError("Erro simulado")):
+        with pytest.raises(LLMPermanentError, match=r"\[OpenAIClient.stream_chat\]"):
+            list(client.stream_chat([LLMMessage(role=LLMRole.USER, content="Olá")]))
+
+
+def test_openai_client_stream_chat_reads_rate_limit_headers():
+    limiter = MagicMock()
+    raw_response = MagicMock(headers={"x-ratelimit-remaining-tokens": "500"})
+    raw_response.parse.return_value = iter([_stream_chunk("{}"), _stream_chunk(usage=MagicMock(total_tokens=30))])
+
+    client = OpenAIClient(api_key="test-key", rate_limiter=limiter)
+    with patch.object(client.client.chat.completions.with_raw_response, "create", return_value=raw_response):
+        assert list(client.stream_chat([LLMMessage(role=LLMRole.USER, content="Olá")])) == ["{}"]
+
+    limiter.acquire.assert_called_once()
+    limiter.update_from_headers.assert_called_once_with(raw_response.headers)
+    limiter.reconcile.assert_called_once_with(limiter.acquire.call_args.args[0], 30)
+
+
+@pytest.mark.parametrize("headers,pause", [({"retry-after": "7"}, 7.0), ({}, 1.0)])
+def test_openai_client_rate_limit_error_pauses_limiter(headers, pause):
+    limiter = MagicMock()
+    client = OpenAIClient(api_key="test-key", rate_limiter=limiter)
+    error = _status_error(RateLimitError, 429, headers=headers)
+
+    with patch.object(client.client.chat.completions.with_raw_response, "create", side_effect=error):
+        with pytest.raises(LLMTransientError):
+            client.chat([LLMMessage(role=LLMRole.USER, content="Olá")])
+
+    limiter.pause.assert_called_once_with(pause)
+
+
+def test_openai_client_quota_error_does_not_pause_limiter():
+    limiter = MagicMock()
+    client = OpenAIClient(api_key="test-key", rate_limiter=limiter)
+    error = _status_error(RateLimitError, 429, code="insufficient_quota")
+
+    with patch.object(client.client.chat.completions.with_raw_response, "create", side_effect=error):
+        with pytest.raises(LLMPermanentError):
+            client.chat([LLMMessage(role=LLMRole.USER, content="Olá")])
+
+    limiter.pause.assert_not_called()
+
+
+# ---------- Structured outputs ----------
+
+SCHEMA = {
+    "title": "resposta",
+    "type": "object",
+    "properties": {"segments": {"type": "array"}},
+    "required": ["segments"],
+    "additionalProperties": False
+}
+
+
+def test_openai_client_sends_response_format_only_with_schema(mock_openai_response):
+    client = OpenAIClient(api_key="test-key", model="gpt-4o")
+    message = LLMMessage(role=LLMRole.USER, content="Olá")
+
+    with patch.object(client.client.chat.completions, "create", return_value=mock_openai_response) as create:
+        client.chat([message])
+        assert "response_format" not in create.call_args.kwargs
+
+        client.chat([message], response_schema=SCHEMA)
+        assert create.call_args.kwargs["response_format"] == {
+            "type": "json_schema",
+            "json_schema": {"name": "resposta", "schema": SCHEMA, "strict": True}
+        }
+
+
+def test_build_response_format_uses_json_object_for_open_schemas():
+    assert build_response_format(PIPELINE_RESPONSE_SCHEMA)["json_schema"]["strict"] is True
+    assert build_response_format(COMPACT_PIPELINE_RESPONSE_SCHEMA) == {"type": "json_object"}
+
+
+def test_openai_client_json_object_mode():
+    client = OpenAIClient(api_key="test-key", model="gpt-3.5-turbo", response_format="json_object")
+
+    with patch.object(client.client.chat.completions, "create", return_value=iter([])) as create:
+        list(client.stream_chat([LLMMessage(role=LLMRole.USER, content="Olá")], response_schema=SCHEMA))
+
+    assert create.call_args.kwargs["response_format"] == {"type": "json_object"}
+
+
+def test_openai_client_rejects_unknown_response_format():
+    with pytest.raises(ValueError):
+        OpenAIClient(api_key="test-key", response_format="xml")
+
+
+def test_build_llm_response_raises_on_refusal(mock_openai_response):
+    mock_openai_response.choices[0].message = MagicMock(content=None, refusal="Não posso ajudar com isso.")
+
+    with pytest.raises(LLMPermanentError, match="Não posso ajudar"):
+        build_llm_response(mock_openai_response)
+
+
+def test_openai_client_stream_chat_raises_on_refusal():
+    client = OpenAIClient(api_key="test-key")
+    chunk = _stream_chunk()
+    chunk.choices[0].delta.refusal = "Não posso ajudar com isso."
+
+    with patch.object(client.client.chat.completions, "create", return_value=iter([chunk])):
+        with pytest.raises(LLMPermanentError, match="Recusa do modelo"):
+            list(client.stream_chat([LLMMessage(role=LLMRole.USER, content="Olá")]))
+
+
+def test_build_llm_response_reads_cached_tokens(mock_openai_response):
+    assert build_llm_response(mock_openai_response).usage.cached_tokens == 0
+
+    mock_openai_response.usage.prompt_tokens_details = MagicMock(cached_tokens=8)
+    assert build_llm_response(mock_openai_response).usage.cached_tokens == 8
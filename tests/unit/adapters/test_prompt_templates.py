@@ -4,6 +4,9 @@ from jsonschema import validate
 
 from core.models.llm import LLMMessage
 from core.enums.llm_role import LLMRole
+from core.models.line import Line
+from adapters.prompts.compact_pipeline_prompt import CompactPipelinePrompt
+from adapters.prompts.incremental_scenario_prompt import IncrementalScenarioPrompt
 from adapters.prompts.pipeline_prompt import PipelinePrompt
 from adapters.prompts.scenario_extraction_prompt import ScenarioExtractionPrompt
 from tests.schemas.llm_response_schema import (
@@ -56,7 +59,108 @@ def test_pipeline_prompt_build_messages(structured_payload):
     
     parsed = json.loads(user_msg.content)
     assert parsed == structured_payload
-    
+
+
+def test_pipeline_prompt_stable_prefix(structured_payload):
+    prompt = PipelinePrompt()
+    first = prompt.build_messages({"lines": structured_payload[:1], "metadata": {"title": "Obra", "original_language": "zh"}})
+    second = prompt.build_messages({"metadata": {"original_language": "zh", "title": "Obra"}, "lines": structured_payload[1:]})
+
+    assert [m.role for m in first] == [LLMRole.SYSTEM, LLMRole.SYSTEM, LLMRole.USER]
+    assert [m.content for m in first[:2]] == [m.content for m in second[:2]]
+    assert "Obra" not in first[2].content
+    assert json.loads(first[2].content) == {"lines": structured_payload[:1]}
+
+
+def test_pipeline_prompt_without_metadata_has_no_metadata_message(structured_payload):
+    messages = PipelinePrompt().build_messages({"lines": structured_payload, "metadata": {}})
+    assert [m.role for m in messages] == [LLMRole.SYSTEM, LLMRole.USER]
+
+
+def test_pipeline_prompt_schema_matches_expected_response():
+    response = {"segments": [{
+        "line_number": 1, "segment_index": 0, "original_text": "x", "translated_text": "x",
+        "segment_type": "dialogue", "speaker": "Ye Hong", "character_type": "protagonist",
+        "gender": "male", "emotion": "shout"
+    }]}
+    validate(instance=response, schema=PipelinePrompt.response_schema)
+    validate(instance=response, schema=pipeline_response_schema)
+
+
+def test_pipeline_prompt_parse_segments_is_identity():
+    segments = [{"line_number": 1, "segment_index": 0, "original_text": "x"}]
+    assert PipelinePrompt().parse_segments(segments, []) is segments
+
+# ---------- CompactPipelinePrompt ----------
+
+def test_compact_prompt_build_messages(structured_payload):
+    system_msg, user_msg = CompactPipelinePrompt().build_messages({"lines": structured_payload})
+
+    assert_llm_message(system_msg, LLMRole.SYSTEM, "não repita o texto original")
+    assert json.loads(user_msg.content) == {"lines": structured_payload}
+    assert '": ' not in user_msg.content  # JSON minificado
+
+
+def test_compact_prompt_schema():
+    response = {"segments": [{"l": 7, "s": [[0, 5, "Texto", "n", "Narrador", "n", "u", "n"]]}]}
+    validate(instance=response, schema=CompactPipelinePrompt.response_schema)
+
+
+def test_compact_prompt_parse_segments_rebuilds_full_segments():
+    lines = [Line(original_text='Ye Hong riu. "Quem está aí?"', line_number=7)]
+    compact = [{"l": 7, "s": [
+        [0, 12, "Ye Hong riu.", "n", "Narrador", "n", "u", "j"],
+        [13, 28, "\"Quem está aí?\"", "d", "Ye Hong", "p", "m", "s"],
+    ]}]
+
+    segments = CompactPipelinePrompt().parse_segments(compact, lines)
+
+    assert segments == [
+        {
+            "line_number": 7, "segment_index": 0, "original_text": "Ye Hong riu.",
+            "translated_text": "Ye Hong riu.", "segment_type": "narration", "speaker": "Narrador",
+            "character_type": "narrator", "gender": "unknown", "emotion": "joy",
+        },
+        {
+            "line_number": 7, "segment_index": 1, "original_text": '"Quem está aí?"',
+            "translated_text": '"Quem está aí?"', "segment_type": "dialogue", "speaker": "Ye Hong",
+            "character_type": "protagonist", "gender": "male", "emotion": "surprise",
+        },
+    ]
+
+
+@pytest.mark.parametrize("compact", [
+    [{"l": 99, "s": [[0, 1, "x", "n", "Narrador", "n", "u", "n"]]}],
+    [{"l": 7, "s": [[0, 500, "x", "n", "Narrador", "n", "u", "n"]]}],
+    [{"l": 7, "s": [[3, 3, "x", "n", "Narrador", "n", "u", "n"]]}],
+    [{"l": 7, "s": [[0, 1, "x"]]}],
+    [{"l": 7}],
+    [[7, 0, 1]],
+])
+def test_compact_prompt_parse_segments_rejects_invalid(compact):
+    with pytest.raises(ValueError):
+        CompactPipelinePrompt().parse_segments(compact, [Line(original_text="Texto", line_number=7)])
+
+
+def test_compact_prompt_parse_segments_rejects_whitespace_span():
+    compact = [{"l": 7, "s": [[3, 4, "x", "n", "Narrador", "n", "u", "n"]]}]
+    with pytest.raises(ValueError, match="espaços"):
+        CompactPipelinePrompt().parse_segments(compact, [Line(original_text="Olá mundo", line_number=7)])
+
+
+@pytest.mark.parametrize("compact,match", [
+    ([{"l": 7, "s": [[4, 9, "x", "n", "Narrador", "n", "u", "n"], [0, 3, "y", "n", "Narrador", "n", "u", "n"]]}],
+     "antes do fim"),
+    ([{"l": 7, "s": [[0, 5, "x", "n", "Narrador", "n", "u", "n"], [2, 9, "y", "n", "Narrador", "n", "u", "n"]]}],
+     "antes do fim"),
+    ([{"l": 7, "s": [[0, 3, "x", "n", "Narrador", "n", "u", "n"]]},
+      {"l": 7, "s": [[4, 9, "y", "n", "Narrador", "n", "u", "n"]]}],
+     "mais de uma vez"),
+])
+def test_compact_prompt_parse_segments_rejects_unordered_or_repeated_spans(compact, match):
+    with pytest.raises(ValueError, match=match):
+        CompactPipelinePrompt().parse_segments(compact, [Line(original_text="Olá mundo", line_number=7)])
+
 # ---------- ScenarioExtractionPrompt ----------
 
 def test_scenario_extraction_prompt_build_messages(narration_payload):
@@ -70,4 +174,18 @@ def test_scenario_extraction_prompt_build_messages(narration_payload):
 
     assert_llm_message(system_msg, LLMRole.SYSTEM, "descrição de cenários")
     assert_llm_message(user_msg, LLMRole.USER, narration_payload["narration_text"])
-    assert user_msg.content == narration_payload["narration_text"]
\ No newline at end of file
+    assert user_msg.content == narration_payload["narration_text"]
+
+# ---------- IncrementalScenarioPrompt ----------
+
+def test_incremental_scenario_prompt_lists_known_locations(narration_payload):
+    prompt = IncrementalScenarioPrompt()
+
+    assert len(prompt.build_messages(narration_payload)) == 2
+
+    system_msg, known_msg, user_msg = prompt.build_messages(
+        dict(narration_payload, known_locations=["Colégio Zhicai"])
+    )
+    assert_llm_message(system_msg, LLMRole.SYSTEM, "locais")
+    assert_llm_message(known_msg, LLMRole.SYSTEM, "Colégio Zhicai")
+    assert user_msg.content == narration_payload["narration_text"]
@@ -0,0 +1,73 @@
+import pytest
+
+from adapters.llm.rate_limiter import RateLimiter, parse_reset_duration
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.mark.parametrize("value,expected", [
+    ("20ms", 0.02),
+    ("1s", 1.0),
+    ("6m0s", 360.0),
+    ("1h2m3.5s", 3723.5),
+])
+def test_parse_reset_duration(value, expected):
+    assert parse_reset_duration(value) == pytest.approx(expected)
+
+
+def test_parse_reset_duration_invalid():
+    assert parse_reset_duration("") is None
+    assert parse_reset_duration("soon") is None
+
+
+def test_requests_bucket_queues_instead_of_bursting(clock):
+    limiter = RateLimiter(requests_per_minute=60, clock=clock, sleep=clock.sleep)
+
+    waits = [limiter.acquire(0) for _ in range(62)]
+
+    assert waits[:60] == [0.0] * 60
+    assert waits[60] == pytest.approx(1.0)
+    assert waits[61] == pytest.approx(1.0)
+    assert clock.now == pytest.approx(2.0)
+
+
+def test_tokens_bucket_waits_for_budget(clock):
+    limiter = RateLimiter(tokens_per_minute=6000, clock=clock, sleep=clock.sleep)
+
+    assert limiter.acquire(6000) == 0.0
+    assert limiter.reserve(1000) == pytest.approx(10.0)
+
+
+def test_reconcile_returns_unused_tokens(clock):
+    limiter = RateLimiter(tokens_per_minute=6000, clock=clock, sleep=clock.sleep)
+    limiter.acquire(6000)
+    limiter.reconcile(estimated_tokens=6000, actual_tokens=1000)
+
+    assert limiter.reserve(5000) == 0.0
+
+
+def test_headers_adjust_limits_and_pause(clock):
+    limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+    limiter.update_from_headers({
+        "x-ratelimit-limit-requests": "600",
+        "x-ratelimit-remaining-requests": "0",
+        "x-ratelimit-reset-requests": "2s",
+        "x-ratelimit-limit-tokens": "60000",
+        "x-ratelimit-remaining-tokens": "59000",
+    })
+
+    assert limiter.reserve(100) == pytest.approx(2.0)
@@ -0,0 +1,133 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from core.interfaces.llm import LLMTransientError, LLMPermanentError
+from core.models.llm import LLMMessage, LLMResponse, LLMRole
+from adapters.llm.retrying_llm_client import RetryPolicy, RetryingLLMClient, AsyncRetryingLLMClient
+
+
+@pytest.fixture
+def messages():
+    return [LLMMessage(role=LLMRole.USER, content="Olá")]
+
+
+@pytest.fixture
+def ok_response():
+    return LLMResponse(text="ok")
+
+
+def test_policy_delay_is_capped_exponential():
+    policy = RetryPolicy(base_delay=1.0, max_delay=10.0, jitter=False)
+    assert [policy.delay_for(i) for i in range(5)] == [1.0, 2.0, 4.0, 8.0, 10.0]
+
+
+def test_policy_jitter_and_retry_after():
+    policy = RetryPolicy(base_delay=1.0, max_delay=10.0)
+    assert policy.delay_for(2, rng=lambda: 0.5) == 2.0
+    assert policy.delay_for(0, retry_after=7.0, rng=lambda: 0.5) == 7.0
+    assert policy.delay_for(0, retry_after=300.0, rng=lambda: 0.5) == 10.0
+
+
+def test_retries_transient_errors_and_records_stats(messages, ok_response):
+    inner = MagicMock(model="gpt-4o")
+    inner.chat.side_effect = [
+        LLMTransientError("429", retry_after=3.0),
+        TimeoutError("timeout"),
+        ok_response,
+    ]
+    sleeps = []
+    client = RetryingLLMClient(inner, RetryPolicy(base_delay=1.0, jitter=False), sleep=sleeps.append)
+
+    assert client.chat(messages) is ok_response
+    assert sleeps == [3.0, 2.0]
+    assert client.model == "gpt-4o"
+    assert client.last_stats.attempts == 3
+    assert client.last_stats.retries == 2
+    assert client.last_stats.total_wait == 5.0
+    assert client.stats.total_retries == 2
+
+
+def test_permanent_errors_are_not_retried(messages):
+    inner = MagicMock()
+    inner.chat.side_effect = LLMPermanentError("auth")
+    sleeps = []
+    client = RetryingLLMClient(inner, sleep=sleeps.append)
+
+    with pytest.raises(LLMPermanentError):
+        client.chat(messages)
+    assert inner.chat.call_count == 1
+    assert sleeps == []
+    assert client.last_stats.attempts == 1
+
+
+def test_gives_up_after_max_attempts(messages):
+    inner = MagicMock()
+    inner.chat.side_effect = LLMTransientError("503")
+    client = RetryingLLMClient(inner, RetryPolicy(max_attempts=3), sleep=lambda s: None)
+
+    with pytest.raises(LLMTransientError):
+        client.chat(messages)
+    assert inner.chat.call_count == 3
+    assert len(client.last_stats.errors) == 3
+
+
+def test_async_client_retries(messages, ok_response):
+    inner = MagicMock()
+    inner.achat = AsyncMock(side_effect=[ConnectionResetError("reset"), ok_response])
+    client = AsyncRetryingLLMClient(inner, RetryPolicy(base_delay=0.0))
+
+    async def call():
+        response = await client.achat(messages)
+        return response, client.last_stats
+
+    response, stats = asyncio.run(call())
+    assert response is ok_response
+    assert stats.retries == 1
+
+
+def test_async_last_stats_are_isolated_per_task(messages, ok_response):
+    async def inner_achat(messages, **kwargs):
+        await asyncio.sleep(0.01)
+        if messages[0].content == "falha" and not failed:
+            failed.append(True)
+            raise ConnectionResetError("reset")
+        return ok_response
+
+    failed = []
+    inner = MagicMock()
+    inner.achat = inner_achat
+    client = AsyncRetryingLLMClient(inner, RetryPolicy(base_delay=0.0))
+
+    async def call(content):
+        await client.achat([LLMMessage(role=LLMRole.USER, content=content)])
+        await asyncio.sleep(0.02)  # a outra chamada termina nesse meio-tempo
+        return client.last_stats.retries
+
+    async def main():
+        return await asyncio.gather(call("falha"), call("ok"))
+
+    assert asyncio.run(main()) == [1, 0]
+    assert client.stats.total_calls == 2
+
+
+def test_stream_retries_only_before_first_chunk(messages):
+    inner = MagicMock(model="gpt-4o")
+
+    def failing_midway(**kwargs):
+        yield "parte 1"
+        raise LLMTransientError("conexão perdida")
+
+    inner.stream_chat.side_effect = [LLMTransientError("429"), iter(["a", "b"]), failing_midway()]
+    sleeps = []
+    client = RetryingLLMClient(inner, RetryPolicy(base_delay=1.0, jitter=False), sleep=sleeps.append)
+
+    assert list(client.stream_chat(messages)) == ["a", "b"]
+    assert sleeps == [1.0]
+
+    received = []
+    with pytest.raises(LLMTransientError):
+        for chunk in client.stream_chat(messages):
+            received.append(chunk)
+    assert received == ["parte 1"]
+    assert inner.stream_chat.call_count == 3
@@ -0,0 +1,48 @@
+import pytest
+
+from adapters.analyzer.segment_validator import validate_segments
+
+
+@pytest.fixture
+def segment():
+    return {
+        "line_number": 1,
+        "segment_index": 0,
+        "original_text": "他笑了。",
+        "translated_text": "Ele riu.",
+        "segment_type": "narration",
+        "speaker": "Narrador",
+        "character_type": "narrator",
+        "gender": "unknown",
+        "emotion": "joy",
+    }
+
+
+def test_valid_segments_pass(segment):
+    validate_segments([segment, dict(segment, segment_index=1)], [1, 2])
+    validate_segments([], [1])
+
+
+@pytest.mark.parametrize("changes", [
+    {"line_number": "1"},
+    {"segment_index": True},
+    {"translated_text": None},
+    {"speaker": ["Ye Hong"]},
+    {"emotion": ["joy"]},
+    {"original_text": ""},
+    {"original_text": "   "},
+    {"line_number": 9},
+])
+def test_invalid_segments_raise(segment, changes):
+    with pytest.raises(ValueError):
+        validate_segments([dict(segment, **changes)], [1, 2])
+
+
+def test_unknown_enum_values_are_tolerated(segment):
+    validate_segments([dict(segment, segment_type="monologue", emotion="bored", gender="other")], [1])
+
+
+def test_missing_field_raises(segment):
+    del segment["gender"]
+    with pytest.raises(ValueError, match="gender"):
+        validate_segments([segment], [1])
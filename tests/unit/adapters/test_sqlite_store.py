@@ -0,0 +1,110 @@
+import threading
+
+import pytest
+from multiprocessing import get_context
+
+from adapters.persistence.sqlite_store import SQLiteDatabase, SQLiteBlockCache, SQLiteManifestAdapter
+
+
+@pytest.fixture
+def database(tmp_path):
+    db = SQLiteDatabase(tmp_path / "store.sqlite3")
+    yield db
+    db.close()
+
+
+def test_database_uses_wal(database):
+    mode = database.connection.execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+
+
+def test_block_cache_roundtrip(database, dummy_segment_dicts):
+    cache = SQLiteBlockCache(database)
+    assert cache.load_block("w1", "ch1", 0) is None
+
+    cache.save_block("w1", "ch1", 0, dummy_segment_dicts, fingerprint="fp")
+    cache.save_block("w1", "ch1", 2, [])
+
+    assert cache.load_block("w1", "ch1", 0) == dummy_segment_dicts
+    assert cache.list_block_indexes("w1", "ch1") == [0, 2]
+
+
+def test_block_cache_batch_commits_once(database, dummy_segment_dicts):
+    cache = SQLiteBlockCache(database)
+
+    with cache.batch():
+        for i in range(3):
+            cache.save_block("w1", "ch1", i, dummy_segment_dicts)
+        assert cache.list_block_indexes("w1", "ch1") == []
+        assert cache.load_block("w1", "ch1", 1) == dummy_segment_dicts
+
+    assert cache.list_block_indexes("w1", "ch1") == [0, 1, 2]
+
+
+def test_manifest_save_load_and_update(database):
+    manifest = SQLiteManifestAdapter(database)
+    assert manifest.load("w1") == {"chapters": {}}
+
+    manifest.save("w1", {"chapters": {"001": "abc", "002": {"checksum": "def"}}})
+    manifest.save_chapter("w1", "003", "ghi")
+    manifest.save("w2", {"chapters": {"001": "zzz"}})
+
+    assert manifest.load("w1") == {"chapters": {"001": "abc", "002": {"checksum": "def"}, "003": "ghi"}}
+
+    manifest.save("w1", {"chapters": {"001": "new"}})
+    assert manifest.load("w1") == {"chapters": {"001": "new"}}
+    assert manifest.load("w2") == {"chapters": {"001": "zzz"}}
+
+    manifest.update("w1", lambda m: m["chapters"].__setitem__("002", "upd"))
+    assert manifest.load("w1") == {"chapters": {"001": "new", "002": "upd"}}
+    assert manifest.load("w2") == {"chapters": {"001": "zzz"}}
+
+    manifest.update("w1", lambda m: m["chapters"].pop("001"))
+    manifest.save_chapter("w1", "002", {"checksum": "upsert"})
+    assert manifest.load("w1") == {"chapters": {"002": {"checksum": "upsert"}}}
+
+
+def _save_from_worker(db_path, chapter_id):
+    db = SQLiteDatabase(db_path)
+    SQLiteManifestAdapter(db).save_chapter("w1", chapter_id, chapter_id)
+    db.close()
+
+
+def test_manifest_shared_between_processes(tmp_path):
+    db_path = tmp_path / "store.sqlite3"
+    ctx = get_context("spawn")
+    workers = [ctx.Process(target=_save_from_worker, args=(db_path, f"{i:03d}")) for i in range(3)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+
+    db = SQLiteDatabase(db_path)
+    assert sorted(SQLiteManifestAdapter(db).load("w1")["chapters"]) == ["000", "001", "002"]
+    db.close()
+
+
+def test_block_cache_batch_is_per_thread(database, dummy_segment_dicts):
+    cache = SQLiteBlockCache(database)
+
+    with cache.batch():
+        cache.save_block("w1", "ch1", 0, dummy_segment_dicts)
+        worker = threading.Thread(target=cache.save_block, args=("w1", "ch1", 1, dummy_segment_dicts))
+        worker.start()
+        worker.join()
+        assert cache.list_block_indexes("w1", "ch1") == [1]
+
+    assert cache.list_block_indexes("w1", "ch1") == [0, 1]
+
+
+def test_block_cache_ignores_stale_fingerprints(database, dummy_segment_dicts):
+    cache = SQLiteBlockCache(database)
+    cache.save_block("w1", "ch1", 0, dummy_segment_dicts, fingerprint="fp-1")
+
+    assert cache.load_block("w1", "ch1", 0, fingerprint="fp-1") == dummy_segment_dicts
+    assert cache.load_block("w1", "ch1", 0, fingerprint="fp-2") is None
+    assert cache.load_block("w1", "ch1", 0) == dummy_segment_dicts
+
+    with cache.batch():
+        cache.save_block("w1", "ch1", 1, dummy_segment_dicts, fingerprint="fp-3")
+        assert cache.load_block("w1", "ch1", 1, fingerprint="fp-4") is None
@@ -0,0 +1,54 @@
+import json
+import pytest
+
+from adapters.analyzer.streaming_segment_parser import StreamingSegmentParser, iter_stream_segments
+
+
+def _chunks(text: str, size: int):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+@pytest.fixture
+def response_text():
+    return json.dumps({
+        "segments": [
+            {"segment_index": 0, "line_number": 0, "text": "Ele disse: \"{ok}\"", "tags": ["a", "]"]},
+            {"segment_index": 1, "line_number": 0, "text": "barra \\ final"},
+            {"segment_index": 0, "line_number": 1, "text": "日本語"},
+        ]
+    }, ensure_ascii=False)
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 1000])
+def test_stream_yields_all_segments_for_any_chunking(response_text, size):
+    segments = list(iter_stream_segments(_chunks(response_text, size)))
+    assert segments == json.loads(response_text)["segments"]
+
+
+def test_parser_emits_segment_as_soon_as_object_closes():
+    parser = StreamingSegmentParser()
+    assert parser.feed('{"segments": [{"line_number": 0') == []
+    assert parser.feed(', "segment_index": 0}') == [{"line_number": 0, "segment_index": 0}]
+    assert parser.feed(', {"line_number": 1, "segment_index": 0}') == [{"line_number": 1, "segment_index": 0}]
+    assert not parser.done
+    assert parser.feed("]}") == []
+    assert parser.done
+    parser.finish()
+
+
+def test_truncated_stream_raises_after_complete_segments():
+    text = '{"segments": [{"line_number": 0, "segment_index": 0}, {"line_number": 1, "segm'
+    received = []
+    with pytest.raises(ValueError):
+        for segment in iter_stream_segments(_chunks(text, 5)):
+            received.append(segment)
+    assert received == [{"line_number": 0, "segment_index": 0}]
+
+
+def test_empty_segments():
+    assert list(iter_stream_segments(['{"segments": []}'])) == []
+
+
+def test_non_object_item_raises():
+    with pytest.raises(ValueError):
+        list(iter_stream_segments(['{"segments": [1, 2]}']))
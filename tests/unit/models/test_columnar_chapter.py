@@ -0,0 +1,84 @@
+import pytest
+
+from core.enums import SegmentType, EmotionType, CharacterType
+from core.models.chapter import Chapter
+from core.models.character import Character
+from core.models.columnar_chapter import ColumnarChapter, MISSING
+from core.models.line import Line
+from core.models.segment import Segment
+
+
+@pytest.fixture
+def chapter():
+    hero = Character(name="Li Wei", type=CharacterType.PROTAGONIST)
+    lines = []
+    for n in range(3):
+        segments = [
+            Segment(segment_index=0, line_number=n, text=f"Narração {n}", translated_text=f"Narração {n}",
+                    speaker_hint="Narrador", emotion=EmotionType.NEUTRAL),
+        ]
+        if n != 1:
+            segments.append(Segment(
+                segment_index=1, line_number=n, text=f"Fala {n}", translated_text=None,
+                segment_type=SegmentType.DIALOGUE, speaker_hint="Li Wei",
+                character=hero, emotion=EmotionType.JOY
+            ))
+        lines.append(Line(original_text=f"Linha {n}", line_number=n, segments=segments))
+    return Chapter(id="cap01", work_id="obra01", title="Capítulo 1", lines=lines)
+
+
+def test_roundtrip_to_chapter(chapter):
+    columns = ColumnarChapter.from_chapter(chapter)
+    rebuilt = columns.to_chapter()
+
+    assert rebuilt == chapter
+    assert rebuilt.lines[0].segments[1].character is rebuilt.lines[2].segments[1].character
+
+
+def test_from_dict_matches_from_chapter(chapter, sample_chapter):
+    for source in (chapter, sample_chapter):
+        from_dict = ColumnarChapter.from_dict(source.to_dict())
+        from_chapter = ColumnarChapter.from_chapter(source)
+        assert list(from_dict) == list(from_chapter)
+        assert from_dict.line_count == from_chapter.line_count
+
+
+def test_row_view(chapter):
+    columns = ColumnarChapter.from_chapter(chapter)
+
+    assert len(columns) == 5
+    row = columns.row(1)
+    assert row.text == "Fala 0"
+    assert row.translated_text is None
+    assert row.segment_type is SegmentType.DIALOGUE
+    assert row.character == "Li Wei"
+    assert [r.text for r in columns.line_segments(1)] == ["Narração 1"]
+    with pytest.raises(IndexError):
+        columns.row(5)
+
+
+def test_columns_are_read_only(chapter):
+    columns = ColumnarChapter.from_chapter(chapter)
+    line_numbers = columns.column("line_number")
+
+    assert line_numbers.tolist() == [0, 0, 1, 2, 2]
+    assert columns.column("character").tolist().count(MISSING) == 3
+    with pytest.raises(TypeError):
+        line_numbers[0] = 7
+    with pytest.raises(KeyError):
+        columns.column("inexistente")
+
+
+def test_aggregates(chapter):
+    columns = ColumnarChapter.from_chapter(chapter)
+
+    assert columns.speaker_counts() == {"Narrador": 3, "Li Wei": 2}
+    assert columns.emotion_histogram() == {EmotionType.NEUTRAL: 3, EmotionType.JOY: 2}
+    assert columns.segment_type_counts() == {SegmentType.NARRATION: 3, SegmentType.DIALOGUE: 2}
+    assert columns.lines_per_character() == {"Li Wei": 2}
+
+
+def test_empty_chapter():
+    columns = ColumnarChapter.from_chapter(Chapter(id="c", work_id="w", title="T"))
+    assert len(columns) == 0
+    assert columns.to_chapter().lines == []
@@ -47,3 +47,9 @@ def test_line_invalid_segment_items():
 def test_line_invalid_line_number():
     with pytest.raises(ValueError):
         Line(original_text="OK", line_number=-2)
+
+
+def test_line_is_slotted(sample_line):
+    assert not hasattr(sample_line, "__dict__")
+    with pytest.raises(AttributeError):
+        sample_line.unknown_attribute = 1
@@ -63,6 +63,18 @@ def test_llm_usage_from_dict(sample_llm_usage_dict):
     
 # ----- Validações -----
 
+def test_llm_usage_cached_tokens_default_and_roundtrip(sample_llm_usage_dict):
+    assert LLMUsage.from_dict(sample_llm_usage_dict).cached_tokens == 0
+
+    usage = LLMUsage(prompt_tokens=100, completion_tokens=150, total_tokens=250, cached_tokens=64)
+    assert LLMUsage.from_dict(usage.to_dict()) == usage
+
+
+def test_llm_usage_cached_tokens_above_prompt():
+    with pytest.raises(ValueError):
+        LLMUsage(prompt_tokens=5, completion_tokens=5, total_tokens=10, cached_tokens=6)
+
+
 def test_llm_usage_invalid_negative():
     with pytest.raises(ValueError):
         LLMUsage(prompt_tokens=-1, completion_tokens=5, total_tokens=4)
@@ -48,3 +48,18 @@ def test_media_work_add_chapter_wrong_work_id():
     chapter = Chapter(id="c01", work_id="diferente", title="Capítulo")
     with pytest.raises(ValueError):
         work.add_chapter(chapter)
+
+
+def test_media_work_from_dict_without_validation(sample_media_work, sample_media_work_dict):
+    trusted = MediaWork.from_dict(sample_media_work_dict, validate=False)
+    validated = MediaWork.from_dict(sample_media_work_dict)
+
+    assert trusted == validated
+    assert isinstance(trusted.chapters[0], Chapter)
+
+
+def test_media_work_from_dict_without_validation_skips_checks():
+    work = MediaWork.from_dict({"id": "", "title": "T", "chapters": []}, validate=False)
+    assert work.id == ""
+    with pytest.raises(ValueError):
+        MediaWork.from_dict({"id": "", "title": "T", "chapters": []})
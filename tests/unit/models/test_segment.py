@@ -55,3 +55,15 @@ def test_segment_post_init_validation_errors():
 
     with pytest.raises(TypeError):
         Segment(segment_index=0, line_number=1, text="x", character="not a character")
+
+
+def test_segment_from_dict_without_validation(sample_segment_dict):
+    assert Segment.from_dict(sample_segment_dict, validate=False) == Segment.from_dict(sample_segment_dict)
+
+
+def test_segment_is_slotted_and_interns_speaker(sample_segment_dict):
+    first = Segment.from_dict(dict(sample_segment_dict, speaker="".join(["Li", " Wei"])))
+    second = Segment.from_dict(dict(sample_segment_dict, speaker="".join(["Li ", "Wei"])))
+
+    assert not hasattr(first, "__dict__")
+    assert first.speaker_hint is second.speaker_hint
@@ -2,6 +2,7 @@ import pytest
 from core.enums import CharacterType, GenderType
 from core.models.character import Character
 from core.repositories.character_repository import CharacterRepository
+from core.repositories.scenario_registry import ScenarioRegistry
 
 # === get_or_create ===
 
@@ -74,3 +75,61 @@ def test_list_returns_all_characters(char_repo):
     assert isinstance(all_chars, list)
     assert len(all_chars) == 2
     assert all(isinstance(c, Character) for c in all_chars)
+
+
+
+# === ScenarioRegistry ===
+
+def test_scenario_registry_registers_new_locations():
+    registry = ScenarioRegistry()
+    scenarios = registry.merge([
+        {"location": "Colégio Zhicai", "text": "Um colégio antigo.", "characters": ["Ye Hong"]},
+        {"location": "Rua", "text": ""},
+        {"location": None, "text": "Chuva forte."},
+    ], "001")
+
+    assert registry.known_locations() == ["Colégio Zhicai"]
+    assert [(sc.index, sc.location) for sc in scenarios] == [(0, "Colégio Zhicai"), (1, None)]
+    assert registry.chapters_for("colegio zhicai") == ["001"]
+
+
+def test_scenario_registry_merges_incremental_details():
+    registry = ScenarioRegistry()
+    registry.merge([{"location": "Colégio Zhicai", "text": "Um colégio antigo.", "characters": ["Ye Hong"]}], "001")
+
+    scenarios = registry.merge([
+        {"location": "o colégio zhicai", "text": "Tem um lago no pátio.", "characters": ["Zhang", "Ye Hong"]},
+    ], "002")
+    registry.merge([{"location": "Colégio Zhicai", "text": ""}], "003")
+    registry.merge([{"location": "Colégio Zhicai", "text": "tem um lago no pátio"}], "004")
+
+    entry = registry.get("Colégio Zhicai")
+    assert entry.text == "Um colégio antigo. Tem um lago no pátio."
+    assert entry.characters == ["Ye Hong", "Zhang"]
+    assert scenarios[0].text == entry.text and scenarios[0] is not entry
+    assert registry.chapters_for("Colégio Zhicai") == ["001", "002", "003", "004"]
+    assert len(registry) == 1
+
+
+def test_scenario_registry_caps_description_length():
+    registry = ScenarioRegistry(max_description_chars=60)
+    registry.merge([{"location": "Rua", "text": "Uma rua molhada."}], "001")
+
+    registry.merge([{"location": "Rua", "text": "Uma rua molhada. Há lojas fechadas."}], "002")
+    for chapter in range(3, 40):
+        registry.merge([{"location": "Rua", "text": f"Detalhe número {chapter} da rua."}], f"{chapter:03d}")
+
+    entry = registry.get("Rua")
+    assert entry.text.startswith("Uma rua molhada. Há lojas fechadas. Detalhe número 3 da rua.")
+    assert len(entry.text) <= 60
+    assert len(registry.chapters_for("Rua")) == 39
+
+
+def test_scenario_registry_dict_roundtrip():
+    registry = ScenarioRegistry()
+    registry.merge([{"location": "Rua", "text": "Uma rua molhada."}], "001")
+
+    restored = ScenarioRegistry.from_dict(registry.to_dict())
+
+    assert restored.to_dict() == registry.to_dict()
+    assert restored.chapters_for("rua") == ["001"]
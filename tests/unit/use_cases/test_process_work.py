@@ -0,0 +1,108 @@
+import json
+import pytest
+
+from adapters.loaders.file_text_loader import FileTextLoader
+from adapters.persistence.file_manifest_adapter import FileManifestAdapter
+from core.enums import SegmentType
+from core.interfaces.llm import IBlockProcessor
+from core.models.segment import Segment
+from core.utils.file_utils import compute_checksum
+from use_cases.process_work import ChapterPipeline, ProcessWorkUseCase
+
+
+class EchoProcessor(IBlockProcessor):
+    """
+    Um segmento de narração por linha; falha nos capítulos listados em `fail_on`.
+    """
+
+    def __init__(self, fail_on=()):
+        self.fail_on = set(fail_on)
+        self.calls = []
+
+    def process(self, lines, *, chunk_size=None, metadata=None, work_id=None, chapter_id=None):
+        self.calls.append(chapter_id)
+        if chapter_id in self.fail_on:
+            raise RuntimeError("LLM indisponível")
+        return [
+            Segment(segment_index=0, line_number=ln.line_number, text=ln.original_text,
+                    translated_text=ln.original_text, segment_type=SegmentType.NARRATION)
+            for ln in lines
+        ]
+
+
+@pytest.fixture
+def chapters(chapters_dir):
+    for i in range(1, 4):
+        (chapters_dir / f"cap{i:02d}.txt").write_text(f"Linha do capítulo {i}\n\nOutra linha", encoding="utf-8")
+    return chapters_dir
+
+
+@pytest.fixture
+def manifest(base_store):
+    return FileManifestAdapter(base_store)
+
+
+def _use_case(manifest, processor, base_input, base_output):
+    return ProcessWorkUseCase(
+        manifest,
+        lambda: ChapterPipeline(loader=FileTextLoader(), processor=processor),
+        input_dir=base_input,
+        output_dir=base_output
+    )
+
+
+def test_processes_pending_chapters_and_records_checksums(chapters, manifest, base_input, base_output, work_id):
+    processor = EchoProcessor()
+    result = _use_case(manifest, processor, base_input, base_output).execute(work_id, max_workers=2)
+
+    assert result.processed == ["cap01", "cap02", "cap03"]
+    assert result.failed == {}
+    entries = manifest.load(work_id)["chapters"]
+    assert entries["cap02"]["checksum"] == compute_checksum((chapters / "cap02.txt").read_bytes())
+    assert entries["cap02"]["segments"] == 2
+
+    output = json.loads((base_output / work_id / "chapters" / "cap01.json").read_text(encoding="utf-8"))
+    assert [ln["line_number"] for ln in output["lines"]] == [0, 2]
+    assert len(output["lines"][1]["segments"]) == 1
+
+
+def test_resumes_after_failures(chapters, manifest, base_input, base_output, work_id):
+    failing = EchoProcessor(fail_on={"cap02"})
+    first = _use_case(manifest, failing, base_input, base_output).execute(work_id, max_workers=3)
+
+    assert first.processed == ["cap01", "cap03"]
+    assert list(first.failed) == ["cap02"]
+    assert "cap02" not in manifest.load(work_id)["chapters"]
+
+    retry = EchoProcessor()
+    second = _use_case(manifest, retry, base_input, base_output).execute(work_id)
+
+    assert second.processed == ["cap02"]
+    assert second.skipped == ["cap01", "cap03"]
+    assert retry.calls == ["cap02"]
+
+
+def test_pending_jobs_and_invalid_mode(chapters, manifest, base_input, base_output, work_id):
+    checksum = compute_checksum((chapters / "cap01.txt").read_bytes())
+    manifest.save(work_id, {"chapters": {"cap01": {"checksum": checksum}, "cap02": "checksum-antigo"}})
+    use_case = _use_case(manifest, EchoProcessor(), base_input, base_output)
+
+    assert [job.chapter_id for job in use_case.pending_jobs(work_id)] == ["cap02", "cap03"]
+    assert len(use_case.pending_jobs(work_id, force=True)) == 3
+    with pytest.raises(ValueError):
+        use_case.execute(work_id, mode="cluster")
+
+
+def test_reprocesses_only_changed_chapters(chapters, manifest, base_input, base_output, work_id):
+    _use_case(manifest, EchoProcessor(), base_input, base_output).execute(work_id)
+
+    (chapters / "cap02.txt").write_text("Linha do capítulo 2 (corrigida)\n\nOutra linha", encoding="utf-8")
+    processor = EchoProcessor()
+    result = _use_case(manifest, processor, base_input, base_output).execute(work_id)
+
+    assert result.processed == ["cap02"]
+    assert result.skipped == ["cap01", "cap03"]
+    assert processor.calls == ["cap02"]
+    entry = manifest.load(work_id)["chapters"]["cap02"]
+    assert entry["checksum"] == compute_checksum((chapters / "cap02.txt").read_bytes())
+    assert "blocks" not in entry
@@ -0,0 +1,42 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from core.utils.event_loop import background_loop, run_sync
+
+
+async def _current_loop():
+    await asyncio.sleep(0)
+    return asyncio.get_running_loop()
+
+
+def test_run_sync_reuses_the_same_loop():
+    first = run_sync(_current_loop())
+    second = run_sync(_current_loop())
+
+    assert first is second is background_loop()
+    assert not first.is_closed()
+
+
+def test_run_sync_from_many_threads():
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        loops = list(executor.map(lambda _: run_sync(_current_loop()), range(8)))
+
+    assert len(set(map(id, loops))) == 1
+
+
+def test_run_sync_propagates_exceptions():
+    async def boom():
+        raise ValueError("falhou")
+
+    with pytest.raises(ValueError, match="falhou"):
+        run_sync(boom())
+
+
+def test_run_sync_inside_running_loop_raises():
+    async def nested():
+        run_sync(_current_loop())
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(nested())
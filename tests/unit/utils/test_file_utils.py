@@ -47,3 +47,65 @@ def test_write_text_creates_directories(tmp_path):
     file_utils.write_text(nested_file, "teste")
     assert nested_file.exists()
     assert nested_file.read_text(encoding="utf-8") == "teste"
+
+
+# ========== compute_fingerprint ==========
+
+def test_compute_fingerprint_ignores_key_order():
+    a = file_utils.compute_fingerprint({"model": "gpt-4o", "params": {"top_p": 1.0, "temperature": 0.3}})
+    b = file_utils.compute_fingerprint({"params": {"temperature": 0.3, "top_p": 1.0}, "model": "gpt-4o"})
+    assert a == b
+
+
+def test_compute_fingerprint_changes_with_content():
+    a = file_utils.compute_fingerprint({"messages": ["Olá"]})
+    b = file_utils.compute_fingerprint({"messages": ["Olá!"]})
+    assert a != b
+
+
+# ========== atomic_write_text / file_lock ==========
+
+def test_atomic_write_keeps_old_file_on_failure(tmp_path, monkeypatch):
+    path = tmp_path / "manifest.json"
+    file_utils.save_json(path, {"versao": 1})
+
+    def fail(*args, **kwargs):
+        raise OSError("disco cheio")
+
+    monkeypatch.setattr(file_utils.os, "replace", fail)
+    try:
+        file_utils.save_json(path, {"versao": 2})
+    except OSError:
+        pass
+
+    assert file_utils.load_json(path) == {"versao": 1}
+    assert [p.name for p in tmp_path.iterdir()] == ["manifest.json"]
+
+
+def test_atomic_write_replaces_content(tmp_path):
+    path = tmp_path / "a" / "b.txt"
+    file_utils.atomic_write_text(path, "um")
+    file_utils.atomic_write_text(path, "dois")
+    assert path.read_text(encoding="utf-8") == "dois"
+    assert [p.name for p in path.parent.iterdir()] == ["b.txt"]
+
+
+def test_file_lock_serializes_threads(tmp_path):
+    import threading
+
+    path = tmp_path / "counter.txt"
+    path.write_text("0", encoding="utf-8")
+
+    def increment():
+        for _ in range(20):
+            with file_utils.file_lock(path):
+                value = int(path.read_text(encoding="utf-8"))
+                file_utils.atomic_write_text(path, str(value + 1))
+
+    threads = [threading.Thread(target=increment) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert path.read_text(encoding="utf-8") == "80"
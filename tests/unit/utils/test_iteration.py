@@ -1,5 +1,5 @@
 import pytest
-from core.utils.iteration import chunk_list
+from core.utils.iteration import chunk_list, chunk_by_budget
     
 def test_chunk_list_basic():
     assert list(chunk_list([1, 2, 3, 4], 2)) == [[1, 2], [3, 4]]
@@ -16,3 +16,15 @@ def test_chunk_list_basic():
 ])
 def test_chunk_list_parametrized(items, size, expected):
     assert list(chunk_list(items, size)) == expected
+
+
+def test_chunk_by_budget_respects_every_limit():
+    items = [3, 3, 3, 5, 1]
+    chunks = list(chunk_by_budget(items, lambda x: (x, 2 * x), limits=(10, 12)))
+    assert chunks == [[3, 3], [3], [5, 1]]
+
+
+def test_chunk_by_budget_oversized_item_gets_own_chunk():
+    chunks = list(chunk_by_budget([1, 50, 1], lambda x: (x,), limits=(10,)))
+    assert chunks == [[1], [50], [1]]
+    assert list(chunk_by_budget([], lambda x: (x,), limits=(10,))) == []
@@ -2,7 +2,8 @@ import pytest
 from core.utils.normalizer import (
     normalize_work_id,
     format_chapter_id,
-    safe_filename
+    safe_filename,
+    normalize_location
 )
 
 # ========== normalize_work_id ==========
@@ -45,4 +46,15 @@ def test_safe_filename_default(name, expected):
 def test_safe_filename_custom_replacement():
     name = "nome inválido.txt"
     result = safe_filename(name, replace_with="-")
-    assert result == "nome-invalido.txt"
\ No newline at end of file
+    assert result == "nome-invalido.txt"
+
+
+@pytest.mark.parametrize("name,expected", [
+    ("Colégio Zhicai", "colegio zhicai"),
+    ("O  colégio ZHICAI.", "colegio zhicai"),
+    ("The Training Room", "training room"),
+    ("A", "a"),
+    ("紫菜中学", "紫菜中学"),
+])
+def test_normalize_location(name, expected):
+    assert normalize_location(name) == expected
@@ -0,0 +1,32 @@
+from core.models.scenario import Scenario
+from core.utils.scenarios import merge_scenarios
+
+
+def test_merge_by_normalized_location():
+    merged = merge_scenarios([
+        Scenario(index=0, text="Uma sala.", location="Sala de Aula", characters=["Ye Hong"]),
+        Scenario(index=0, text="Um pátio com árvores.", location="Pátio"),
+        Scenario(index=1, text="Uma sala ampla e iluminada.", location="a sala de aula", characters=["Zhang", "Ye Hong"]),
+    ])
+
+    assert [(sc.index, sc.location) for sc in merged] == [(0, "Sala de Aula"), (1, "Pátio")]
+    assert merged[0].text == "Uma sala ampla e iluminada."
+    assert merged[0].characters == ["Ye Hong", "Zhang"]
+
+
+def test_scenarios_without_location_merge_only_on_same_text():
+    merged = merge_scenarios([
+        Scenario(index=0, text="Chuva forte.", location=None),
+        Scenario(index=1, text="chuva forte", location=""),
+        Scenario(index=2, text="Um céu limpo.", location=None),
+    ])
+
+    assert [sc.text for sc in merged] == ["Chuva forte.", "Um céu limpo."]
+
+
+def test_merge_does_not_mutate_inputs():
+    original = Scenario(index=3, text="Uma sala.", location="Sala", characters=["A"])
+    merge_scenarios([original, Scenario(index=0, text="Sala.", location="sala", characters=["B"])])
+
+    assert original.index == 3
+    assert original.characters == ["A"]
@@ -0,0 +1,22 @@
+from core.models.llm import LLMMessage, LLMRole
+from core.utils import tokens
+
+
+def test_estimate_tokens_counts_cjk_per_character():
+    assert tokens.estimate_tokens("abcdefgh") == 2
+    assert tokens.estimate_tokens("叶洪") == 2
+
+
+def test_count_tokens_falls_back_without_encoder(monkeypatch):
+    monkeypatch.setattr(tokens, "_encoder_for", lambda model: None)
+    assert tokens.count_tokens("abcdefgh", "gpt-4o") == 2
+
+
+def test_count_message_tokens_adds_overhead(monkeypatch):
+    monkeypatch.setattr(tokens, "_encoder_for", lambda model: None)
+    messages = [
+        LLMMessage(role=LLMRole.SYSTEM, content="abcd"),
+        LLMMessage(role=LLMRole.USER, content="abcdefgh"),
+    ]
+    expected = tokens.TOKENS_PER_REPLY + 2 * tokens.TOKENS_PER_MESSAGE + 1 + 2
+    assert tokens.count_message_tokens(messages) == expected
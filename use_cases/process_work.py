@@ -0,0 +1,228 @@
+import logging
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from core.interfaces.input import ITextLoader
+from core.interfaces.llm import IBlockProcessor
+from core.interfaces.repository import IManifestAdapter
+from core.models.chapter import Chapter
+from core.models.segment import Segment
+from core.utils.file_utils import compute_file_checksum, save_json
+
+logger = logging.getLogger(__name__)
+
+# Fábrica do par (loader, processor) usado por cada worker. Com pool de
+# processos, precisa ser picklable (função de módulo ou functools.partial).
+PipelineFactory = Callable[[], "ChapterPipeline"]
+
+EXECUTORS = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+
+
+@dataclass
+class ChapterPipeline:
+    loader: ITextLoader
+    processor: IBlockProcessor
+
+
+@dataclass(frozen=True)
+class ChapterJob:
+    work_id: str
+    chapter_id: str
+    source: Path
+    output: Path
+    checksum: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class ProcessWorkResult:
+    processed: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+
+
+class ProcessWorkUseCase:
+    """
+    Processa os capítulos pendentes de uma obra (data/input/{work_id}/chapters/*.txt)
+    num pool de threads ou de processos.
+
+    Cada capítulo concluído é gravado em data/output/{work_id}/chapters/{chapter_id}.json
+    e registrado imediatamente no manifest, com o checksum do .txt de origem.
+    Apenas o processo principal escreve no manifest, via
+    `IManifestAdapter.save_chapter`, que grava só a entrada do capítulo
+    (com lock, quando suportado, preservando entradas de outras execuções).
+    Se a execução for interrompida, uma nova chamada retoma dos capítulos
+    ainda não registrados.
+
+    Capítulos cujo checksum não mudou são pulados; os alterados são
+    reprocessados, e o cache de blocos (que compara fingerprints) reenvia
+    à LLM apenas os blocos cujas linhas mudaram.
+    """
+
+    def __init__(
+        self,
+        manifest: IManifestAdapter,
+        pipeline_factory: PipelineFactory,
+        *,
+        input_dir: Path = Path("data/input"),
+        output_dir: Path = Path("data/output")
+    ):
+        self.manifest = manifest
+        self.pipeline_factory = pipeline_factory
+        self.input_dir = input_dir
+        self.output_dir = output_dir
+
+    def pending_jobs(
+        self,
+        work_id: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        *,
+        force: bool = False
+    ) -> List[ChapterJob]:
+        """
+        Lista os capítulos .txt da obra que não constam no manifest ou cujo
+        checksum mudou desde o último processamento (todos, com `force`).
+        """
+        return self._jobs(work_id, self.manifest.load(work_id).get("chapters", {}), metadata, force)
+
+    def _jobs(
+        self,
+        work_id: str,
+        done: Dict[str, Any],
+        metadata: Optional[Dict[str, Any]],
+        force: bool = False
+    ) -> List[ChapterJob]:
+        chapters_dir = self.input_dir / work_id / "chapters"
+        jobs: List[ChapterJob] = []
+        for path in sorted(chapters_dir.glob("*.txt")):
+            chapter_id = path.stem
+            checksum = compute_file_checksum(path)
+            entry = done.get(chapter_id)
+            if entry is not None and not force and entry_checksum(entry) == checksum:
+                continue
+            jobs.append(ChapterJob(
+                work_id=work_id,
+                chapter_id=chapter_id,
+                source=path,
+                output=self.output_dir / work_id / "chapters" / f"{chapter_id}.json",
+                checksum=checksum,
+                metadata=metadata or {}
+            ))
+            if entry is not None:
+                logger.info("Capítulo %s/%s alterado desde o último processamento", work_id, chapter_id)
+        return jobs
+
+    def execute(
+        self,
+        work_id: str,
+        *,
+        max_workers: int = 4,
+        mode: str = "thread",
+        metadata: Optional[Dict[str, Any]] = None,
+        force: bool = False,
+        on_chapter_done: Optional[Callable[[str, Optional[Exception]], None]] = None
+    ) -> ProcessWorkResult:
+        if mode not in EXECUTORS:
+            raise ValueError(f"Modo inválido: {mode} (use {', '.join(EXECUTORS)})")
+        if max_workers < 1:
+            raise ValueError("max_workers deve ser maior ou igual a 1")
+
+        result = ProcessWorkResult()
+        jobs = self._jobs(work_id, self.manifest.load(work_id).get("chapters", {}), metadata, force)
+        pending = {job.chapter_id for job in jobs}
+        chapters_dir = self.input_dir / work_id / "chapters"
+        result.skipped = sorted(p.stem for p in chapters_dir.glob("*.txt") if p.stem not in pending)
+        logger.info(
+            "Obra %s: %d capítulo(s) pendente(s), %d inalterado(s); %d worker(s) em modo %s",
+            work_id, len(jobs), len(result.skipped), max_workers, mode
+        )
+        if not jobs:
+            return result
+
+        executor: Executor = EXECUTORS[mode](
+            max_workers=max_workers,
+            initializer=init_worker,
+            initargs=(self.pipeline_factory,)
+        )
+        with executor:
+            futures = {executor.submit(process_chapter, job): job for job in jobs}
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    entry = future.result()
+                except Exception as e:
+                    logger.error("Falha ao processar o capítulo %s/%s: %s", work_id, job.chapter_id, e)
+                    result.failed[job.chapter_id] = str(e)
+                    error: Optional[Exception] = e
+                else:
+                    self.manifest.save_chapter(work_id, job.chapter_id, entry)
+                    result.processed.append(job.chapter_id)
+                    error = None
+                if on_chapter_done:
+                    on_chapter_done(job.chapter_id, error)
+
+        result.processed.sort()
+        logger.info(
+            "Obra %s finalizada: %d processado(s), %d com falha",
+            work_id, len(result.processed), len(result.failed)
+        )
+        return result
+
+
+def entry_checksum(entry: Any) -> Optional[str]:
+    """
+    Checksum registrado numa entrada do manifest (dict ou, no formato
+    antigo, o próprio checksum como string).
+    """
+    if isinstance(entry, dict):
+        return entry.get("checksum")
+    return entry if isinstance(entry, str) else None
+
+
+_worker_state = threading.local()
+
+
+def init_worker(factory: PipelineFactory) -> None:
+    """
+    Inicializador do pool: cada worker (thread ou processo) monta o seu
+    pipeline uma única vez, reaproveitando clientes HTTP entre capítulos.
+    """
+    _worker_state.pipeline = factory()
+
+
+def process_chapter(job: ChapterJob, pipeline: Optional[ChapterPipeline] = None) -> Dict[str, Any]:
+    """
+    Processa um capítulo dentro de um worker e grava o resultado em `job.output`.
+    Retorna a entrada do manifest para o capítulo.
+    """
+    pipeline = pipeline or _worker_state.pipeline
+    lines = pipeline.loader.load(str(job.source))
+    metadata = job.metadata or None
+
+    segments = pipeline.processor.process(
+        lines,
+        metadata=metadata,
+        work_id=job.work_id,
+        chapter_id=job.chapter_id
+    )
+
+    by_line: Dict[int, List[Segment]] = {}
+    for seg in segments:
+        by_line.setdefault(seg.line_number, []).append(seg)
+    for line in lines:
+        line.segments = by_line.get(line.line_number, [])
+
+    chapter = Chapter(id=job.chapter_id, work_id=job.work_id, title=job.chapter_id, lines=lines)
+    save_json(job.output, chapter.to_dict())
+    logger.info("Capítulo %s/%s processado: %d segmento(s)", job.work_id, job.chapter_id, len(segments))
+
+    return {
+        "checksum": job.checksum,
+        "segments": len(segments),
+        "output": str(job.output),
+        "processed_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }